@@ -1,823 +1,68 @@
 import streamlit as st
-from datetime import datetime, date
-import pandas as pd
-import re
-from io import BytesIO
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet
 from pathlib import Path
-import streamlit.components.v1 as components
-from streamlit_javascript import st_javascript
+from uuid import uuid4
 
-# Config de la page
-st.set_page_config(page_title="Simulateur ECLAT", page_icon="🎵", layout="wide")
+# Chaque page est un script de vues/, exécuté seul à chaque interaction : les
+# modules lourds (pandas, reportlab, composants HTML) et les constantes d'une page
+# ne sont importés qu'à sa première ouverture, puis restent en mémoire du processus.
+from calculateur import chrono
+from calculateur.images import LOGO, variante_image
 
-# Sidebar
-st.sidebar.title("Musiques Tangentes")
-logo_url = "https://raw.githubusercontent.com/musiquestangentes/calculateur-eclat-app/refs/heads/main/logo_2025_celine_queguiner.png"
-st.sidebar.image(logo_url, width=300)
+PAGES = Path(__file__).parent / "vues"
 
-# URLs
-url_eclat = "https://www.legifrance.gouv.fr/conv_coll/id/KALICONT000005635177"
-url_grille = "https://www.legifrance.gouv.fr/conv_coll/article/KALIARTI000048471347#KALIARTI000048471347"
-url_valpoint = "http://legifrance.gouv.fr/conv_coll/article/KALIARTI000050362519#KALIARTI000050362519"
-url_salaire = "https://www.legifrance.gouv.fr/conv_coll/id/KALIARTI000046098173/?idConteneur=KALICONT000005635177"
-url_modulation = "https://www.legifrance.gouv.fr/conv_coll/id/KALIARTI000027717752?idConteneur=KALICONT000005635177&origin=list"
-url_etp = "https://www.legifrance.gouv.fr/conv_coll/article/KALIARTI000043234742?utm_"
-url_mensualisation = "https://www.legifrance.gouv.fr/conv_coll/article/KALIARTI000027717752#KALIARTI000027717752"
+# Config de la page
+st.set_page_config(page_title="Simulateur ECLAT", page_icon="🎵", layout="wide")
 
 # Navigation principale
-modules = [
-    "Accueil",
-    "Lire sa fiche de paie",
-    "Coefficient, valeur du point d'indice et salaire de base",
-    "Mensualisation et ETP",
-    "Primes",
-    "Vérificateur d'heures",
-    "🧮 Simulateur complet",
-    "🔗 Liens utiles"
-]
-module = st.sidebar.radio("Navigation", modules, index=0)
-
-# ACCUEIL
-
-if module == "Accueil":
-    st.title("Simulateur de paie - Musiques Tangentes")
-    st.image(logo_url, width=400)
-    st.write("""
-    **Cet outil vous permet de comprendre les éléments de votre fiche de paie et de calculer vos heures et primes.**
-    
-    Utilisez le menu à gauche pour naviguer entre les différents modules :
-    - Définitions : Coefficient, valeur du point d'indice et salaire de base  
-    - Lire sa fiche de paie : schéma interactif  
-    - Mensualisation et ETP 
-    - Primes d'ancienneté et différentielle  
-    - Vérification de son nombre d'heures réelles annuelles  
-    - Simulateur complet   
-    - Liens utiles
-    """)
-
-
-# PAGE 1: LIRE SA FICHE DE PAIE
-elif module == "Lire sa fiche de paie":
-    st.title("Comprendre sa fiche de paie")
-
-    st.write("Passez la souris sur un élément pour voir le détail")
-
-    svg_code = """
-    <svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 1250" width="100%" height="100%" preserveAspectRatio="xMinYMin meet" style="font-family:sans-serif;">
-        <style>
-            .block { fill:#eef3fd; pointer-events:none; }
-            .text { font-size:13px; }
-            .titres { font-size: 13px; }
-            .text:hover { font-weight:bold; cursor:pointer;}
-            .header { font-size:20px; font-weight:bold; }
-            .subheader { font-size:14px; fill:#5c9cc4; font-weight:bold; }
-            .bold { font-size: 13px; font-weight: bold;}
-            .bold:hover { fill:#363636; cursor:pointer;}
-            .tooltip-box {
-                fill: #fffbe6;
-                fill-opacity: 1;
-                stroke: #aaa;
-                stroke-width: 0.5;
-                rx: 5;
-                ry: 5;
-            }
-            .tooltip-text {
-                font-size: 13px;
-                fill: #333;
-                pointer-events: none;
-            }
-        </style>
-        
-        <!-- Titre -->
-        <text x="50%" y="30" text-anchor="middle" class="header">BULLETIN DE PAIE</text>
-
-        <!-- Informations employeur et salarié -->
-        <rect x="5%" y="67" width="45%" height="15" class="block"/>
-        <text x="5.5%" y="80" class="subheader">EMPLOYEUR</text>
-        <text x="5.5%" y="95" class="titres">MUSIQUES TANGENTES</text>
-
-        <rect x="5%" y="107" width="45%" height="15" class="block"/>
-        <text x="5.5%" y="120" class="subheader">CONVENTION COLLECTIVE</text>
-        <text x="5.5%" y="135" class="titres">N° 3246 - E.C.L.A.T (Animation)</text>
-
-        <rect x="5%" y="147" width="45%" height="15" class="block"/>
-        <text x="5.5%" y="160" class="subheader" 
-            onmouseover="showTooltip(evt, 'Voir l’onglet « Coefficient, valeur du point d’indice et salaire de base »')"
-            onmouseout="hideTooltip()">QUALIFICATION-COEFFICIENT</text>
-        <text x="5.5%" y="175" class="titres">Echelon Groupe D - Coefficient 305 - Catégorie Agent de Maîtrise</text>
-
-        <rect x="5%" y="187" width="45%" height="15" class="block"/>
-        <text x="5.5%" y="200" class="subheader">N° SECURITE SOCIALE - ANCIENNETÉ</text>
-        <text x="5.5%" y="215" class="titres">123 45 6789 012 - Entré·e le 01/01/2015 - Ancienneté 10 ans</text>
-
-        <rect x="55%" y="67" width="45%" height="15" class="block"/>
-        <text x="55.5%" y="80" class="subheader">EMPLOI</text>
-        <text x="55.5%" y="95" class="titres">ARTISTE ENSEIGNANT</text>
-
-        <rect x="55%" y="107" width="45%" height="15" class="block"/>
-        <text x="55.5%" y="120" class="subheader">SALARIÉ·E</text>
-        <text x="55.5%" y="135" class="titres">Prénom Nom</text>
-
-        <!-- Tableau Salaire -->
-        <rect x="5%" y="240" width="100%" height="28" class="block"/>
-        <text x="5.5%" y="260" class="subheader">Désignation</text>
-        <text x="55%" y="260" class="subheader">Base</text>
-        <text x="65%" y="260" class="subheader">Taux</text>
-        <text x="75%" y="260" class="subheader">Montant</text>
-
-        <text x="5.5%" y="290" class="text" 
-            onmouseover="showTooltip(evt, 'Voir l’onglet « Coefficient, valeur du point d’indice et salaire de base »')"
-            onmouseout="hideTooltip()">Salaire de base</text>
-        <text x="55%" y="290" class="text" 
-            onmouseover="showTooltip(evt, 'Heures mensuelles ETP')"
-            onmouseout="hideTooltip()">19,70</text>
-        <text x="65%" y="290" class="text" 
-            onmouseover="showTooltip(evt, 'Taux Salaire de base / Heures ETP. Pour avoir le taux brut réel, il faut convertir les heures ETP en heures réelles.')"
-            onmouseout="hideTooltip()">14,2454</text>
-        <text x="75%" y="290" class="text" 
-            onmouseover="showTooltip(evt, '19,70 × 14,2454 = 280,63')"
-            onmouseout="hideTooltip()">280,63</text>
-
-        <text x="5.5%" y="315" class="text"  
-            onmouseover="showTooltip(evt, 'Voir l’onglet « Primes »')"
-            onmouseout="hideTooltip()">Prime d'ancienneté CC 3246</text>
-        <text x="55%" y="315" class="text" 
-            onmouseover="showTooltip(evt, 'Nombre d’années d’ancienneté × 2')"
-            onmouseout="hideTooltip()">20</text>
-        <text x="65%" y="315" class="text" 
-            onmouseover="showTooltip(evt, 'Taux plus ou moins élevé selon le nombre d’heures effectuées. Calcul : Prime / Base')"
-            onmouseout="hideTooltip()">0,9295</text>
-        <text x="75%" y="315" class="text"
-            onmouseover="showTooltip(evt, '20 × 0,9295 = 18,59')"
-            onmouseout="hideTooltip()">18,59</text>
-
-        <text x="5.5%" y="340" class="text" 
-            onmouseover="showTooltip(evt, 'Voir l’onglet « Primes »')"
-            onmouseout="hideTooltip()">Prime différentielle compensatoire</text>
-        <text x="55%" y="340" class="text" 
-            onmouseover="showTooltip(evt, 'Le calcul détaillé se trouve dans l’onglet Primes')"
-            onmouseout="hideTooltip()">37,15</text>
-        <text x="65%" y="340" class="text" 
-            onmouseover="showTooltip(evt, 'Taux plus ou moins élevé selon le nombre d’heures effectuées. Calcul : Prime / Base')"
-            onmouseout="hideTooltip()">0,9295</text>
-        <text x="75%" y="340" class="text" 
-            onmouseover="showTooltip(evt, '37,15 × 0,9295 = 34,53')"
-            onmouseout="hideTooltip()">34,53</text>
-
-        <text x="5.5%" y="365" class="bold" 
-            onmouseover="showTooltip(evt, 'Total brut réel : ce que vous gagnez effectivement pour vos heures')"
-            onmouseout="hideTooltip()">Total brut</text>
-        <text x="55%" y="365" class="text"></text>
-        <text x="65%" y="365" class="text"></text>
-        <text x="75%" y="365" class="bold" 
-            onmouseover="showTooltip(evt, '280,63 + 18,59 + 34,53 = 333,75')"
-            onmouseout="hideTooltip()">333,75</text>
-
-        <text x="5.5%" y="390" class="bold" 
-            onmouseover="showTooltip(evt, 'Calcul fiscal réduisant les cotisations (abattement d’environ 30%) : ce sont sur cette base que sont calculées les cotisations et contributions sociales. Ce total brut ne change donc pas le salaire réel, il indique au contraire un net perçu plus élevé.')"
-            onmouseout="hideTooltip()">Total brut abattu</text>
-        <text x="55%" y="390" class="text"></text>
-        <text x="65%" y="390" class="text"></text>
-        <text x="75%" y="390" class="bold" 
-            onmouseover="showTooltip(evt, 'Total brut réel × ≈30% = Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-
-        <!-- Tableau Cotisations -->
-        <rect x="5%" y="410" width="100%" height="28" class="block"/>
-        <text x="5.5%" y="430" class="subheader">Cotisations et contributions sociales</text>
-        <text x="55%" y="430" class="subheader">Base</text>
-        <text x="65%" y="430" class="subheader">Taux salarial</text>
-        <text x="75%" y="430" class="subheader">Part salarié</text>
-        <text x="85%" y="430" class="subheader">Part employeur</text>
-
-        <text x="5.5%" y="455" class="text" 
-            onmouseover="showTooltip(evt, 'Ces cotisations constituent une garantie de base en santé pour tou·te·s les salarié·e·s et sont entièrement prises en charge par l’employeur.')"
-            onmouseout="hideTooltip()">Sécurité sociale - Maladie Maternité Invalidité Décès</text>
-        <text x="55%" y="455" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="455" class="text"></text>
-        <text x="75%" y="455" class="text"></text>
-        <text x="85%" y="455" class="text" 
-            onmouseover="showTooltip(evt, 'Taux de 7,3% applicable en 2025')"
-            onmouseout="hideTooltip()">16,35</text>
-
-        <text x="5.5%" y="480" class="bold" 
-            onmouseover="showTooltip(evt, 'Cette cotisation couvre les risques liés aux accidents du travail, aux maladies professionnelles et aux accidents du trajet. Son taux est fixé par la CARSAT (caisse d’assurance retraite et de la santé au travail).')"
-            onmouseout="hideTooltip()">ACCIDENTS DU TRAVAIL - MALADIES PROFESSIONNELLES</text>
-        <text x="55%" y="480" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="480" class="text"></text>
-        <text x="75%" y="480" class="text"></text>
-        <text x="85%" y="480" class="text"></text>
-
-        <text x="5.5%" y="505" class="bold" 
-            onmouseover="showTooltip(evt, 'Ces cotisations financent le régime général de retraite de la Sécurité sociale (CNAV). Les montants versés sont convertis en trimestres pour définir le montant de la future retraite du/de la salarié·e : c’est ce qu’on appelle la « retraite de base ».')"
-            onmouseout="hideTooltip()">RETRAITE</text>
-        <text x="55%" y="505" class="text"></text>
-        <text x="65%" y="505" class="text"></text>
-        <text x="75%" y="505" class="text"></text>
-        <text x="85%" y="505" class="text"></text>
-
-        <text x="5.5%" y="530" class="text" 
-            onmouseover="showTooltip(evt, 'La cotisation plafonnée s’applique sur le salaire limité au plafond défini par la Sécurité sociale (3 925 euros mensuels en 2025).')"
-            onmouseout="hideTooltip()">Sécurité Sociale plafonnée</text>
-        <text x="55%" y="530" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="530" class="text">6,9000</text>
-        <text x="75%" y="530" class="text" 
-            onmouseover="showTooltip(evt, 'Taux de 6,9% en 2025')"
-            onmouseout="hideTooltip()">16,11</text>
-        <text x="85%" y="530" class="text" 
-            onmouseover="showTooltip(evt, 'Taux de 8,55% en 2025')"
-            onmouseout="hideTooltip()">19,97</text>
-
-        <text x="5.5%" y="555" class="text" 
-            onmouseover="showTooltip(evt, 'La cotisation déplafonnée s’applique sur le salaire total.')"
-            onmouseout="hideTooltip()">Sécurité Sociale déplafonnée</text>
-        <text x="55%" y="555" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="555" class="text">0,4000</text>
-        <text x="75%" y="555" class="text" 
-            onmouseover="showTooltip(evt, 'Taux de 0,4% en 2025')"
-            onmouseout="hideTooltip()">0,93</text>
-        <text x="85%" y="555" class="text" 
-            onmouseover="showTooltip(evt, 'Taux de 2,02% en 2025')"
-            onmouseout="hideTooltip()">4,72</text>
-
-        <text x="5.5%" y="580" class="text" 
-            onmouseover="showTooltip(evt, 'Cette cotisation complète la retraite de base de la Sécurité sociale. 60% sont versés par l’employeur et 40% par le/la salarié·e. Elle finance le régime de retraite complémentaire. Le montant versé est converti en points qui serviront à définir le montant de la retraite complémentaire du/de la salarié·e (AGIRC-ARRCO).')"
-            onmouseout="hideTooltip()">Complémentaire Tranche 1</text>
-        <text x="55%" y="580" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="580" class="text">4,0100</text>
-        <text x="75%" y="580" class="text">9,36</text>
-        <text x="85%" y="580" class="text"></text>
-
-        <text x="5.5%" y="605" class="bold" 
-            onmouseover="showTooltip(evt, 'Uniquement à la charge de l’employeur, cette cotisation finance les prestations familiales versées par la Caisse d’Allocations Familiales (CAF).')"
-            onmouseout="hideTooltip()">FAMILLE</text>
-        <text x="55%" y="605" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="605" class="text"></text>
-        <text x="75%" y="605" class="text"></text>
-        <text x="85%" y="605" class="text" 
-            onmouseover="showTooltip(evt, 'Taux de 3,45% pour un salaire inférieur à 3,5 SMIC en 2025')"
-            onmouseout="hideTooltip()">8,06</text>
-
-        <text x="5.5%" y="630" class="bold" 
-            onmouseover="showTooltip(evt, 'Uniquement à la charge de l’employeur, cette cotisation permet de percevoir une allocation en cas de chômage.')"
-            onmouseout="hideTooltip()">ASSURANCE CHÔMAGE</text>
-        <text x="55%" y="630" class="text" 
-            onmouseover="showTooltip(evt, 'Total brut abattu')"
-            onmouseout="hideTooltip()">233,52</text>
-        <text x="65%" y="630" class="text"></text>
-        <text x="75%" y="630" class="text"></text>
-        <text x="85%" y="630" class="text"></text>
-
-        <text x="5.5%" y="655" class="bold">AUTRES CONTRIBUTIONS DUES PAR L'EMPLOYEUR</text>
-        <text x="55%" y="655" class="text"></text>
-        <text x="65%" y="655" class="text"></text>
-        <text x="75%" y="655" class="text"></text>
-        <text x="85%" y="655" class="text"></text>
-
-        <text x="5.5%" y="680" class="bold" 
-            onmouseover="showTooltip(evt, 'CSG : Contribution Sociale Généralisée. Ces contributions sont des impôts, totalement à la charge du/de la salarié·e. Elles permettent principalement de financer la protection sociale. Elles sont calculées sur 98,25% du salaire brut.')"
-            onmouseout="hideTooltip()">CSG déductible de l'impôt sur le revenu</text>
-        <text x="55%" y="680" class="text" 
-            onmouseover="showTooltip(evt, '98,25% du Total brut réel')"
-            onmouseout="hideTooltip()">327,91</text>
-        <text x="65%" y="680" class="text">6,8000</text>
-        <text x="75%" y="680" class="text">22,30</text>
-        <text x="85%" y="680" class="text"></text>
-
-        <text x="5.5%" y="705" class="bold" 
-            onmouseover="showTooltip(evt, 'CRDS : Contribution au Remboursement de la Dette Sociale. Ces contributions sont des impôts, totalement à la charge du/de la salarié·e. Elles permettent principalement de financer la protection sociale et à résorber l’endettement de la Sécurité sociale. Elles sont calculées sur 98,25% du salaire brut.')"
-            onmouseout="hideTooltip()">CSG/CRDS non déductible de l'impôt sur le revenu</text>
-        <text x="55%" y="705" class="text" 
-            onmouseover="showTooltip(evt, '98,25% du Total brut réel')"
-            onmouseout="hideTooltip()">327,91</text>
-        <text x="65%" y="705" class="text">2,9000</text>
-        <text x="75%" y="705" class="text">9,51</text>
-        <text x="85%" y="705" class="text"></text>
-
-        <text x="5.5%" y="730" class="bold">EXONERATIONS, ECRETEMENTS ET ALLEGEMENTS DE COTISATIONS</text>
-        <text x="55%" y="730" class="text"></text>
-        <text x="65%" y="730" class="text"></text>
-        <text x="75%" y="730" class="text"></text>
-        <text x="85%" y="730" class="text"></text>        
-
-        <rect x="5%" y="740" width="100%" height="20" class="block"/>
-        <text x="5.5%" y="755" class="subheader">Total des cotisations et contributions</text>
-        <text x="55%" y="755" class="text"></text>
-        <text x="65%" y="755" class="text"></text>
-        <text x="75%" y="755" class="text">58,21</text>
-        <text x="85%" y="755" class="text">49,1</text>     
-
-        <!-- Tableau Net à Payer -->
-        <rect x="5%" y="770" width="100%" height="30" class="block"/>
-        <text x="5.5%" y="790" class="subheader" 
-            onmouseover="showTooltip(evt, 'Salaire brut − Cotisations')"
-            onmouseout="hideTooltip()">NET À PAYER AU SALARIE</text>
-        <text x="90%" y="790" class="subheader" 
-            onmouseover="showTooltip(evt, '333,75 − 58,21 = 275,54')"
-            onmouseout="hideTooltip()">275,54</text>
-
-        <g id="tooltip" visibility="hidden">
-            <rect id="tooltip-bg" class="tooltip-box" width="200" height="30" x="0" y="0" rx="5" ry="5"/>
-            <text id="tooltip-text" x="10" y="20" class="tooltip-text"></text>
-        </g>
-
-    <script><![CDATA[
-    setTimeout(function(){
-    window.showTooltip = function(evt, text) {
-        try {
-        const tooltip = document.getElementById('tooltip');
-        const tooltipText = document.getElementById('tooltip-text');
-        const tooltipBg = document.getElementById('tooltip-bg');
-        const MAX_WIDTH = 250;
-
-        if (!tooltip || !tooltipText || !tooltipBg) return;
-
-        tooltip.setAttribute("visibility", "visible");
-
-        // clear previous text
-        while (tooltipText.firstChild) tooltipText.removeChild(tooltipText.firstChild);
-
-        const words = (text || '').split(' ');
-        let line = '';
-        let yOffset = 15;
-        const lineHeight = 16;
-
-        words.forEach((word) => {
-            const testLine = line + word + ' ';
-            const tempTspan = document.createElementNS("http://www.w3.org/2000/svg", "tspan");
-            tempTspan.setAttribute("x", 0);
-            tempTspan.setAttribute("y", 0);
-            tempTspan.textContent = testLine;
-            tooltipText.appendChild(tempTspan);
-            let width = MAX_WIDTH;
-            try {
-            width = tempTspan.getComputedTextLength();
-            } catch(e) {
-            width = MAX_WIDTH;
-            }
-            tooltipText.removeChild(tempTspan);
-
-            if (width > MAX_WIDTH && line !== '') {
-            const tspan = document.createElementNS("http://www.w3.org/2000/svg", "tspan");
-            tspan.setAttribute("x", 10);
-            tspan.setAttribute("y", yOffset);
-            tspan.textContent = line.trim();
-            tooltipText.appendChild(tspan);
-            line = word + ' ';
-            yOffset += lineHeight;
-            } else {
-            line = testLine;
-            }
-        });
-
-        if (line !== '') {
-            const tspan = document.createElementNS("http://www.w3.org/2000/svg", "tspan");
-            tspan.setAttribute("x", 10);
-            tspan.setAttribute("y", yOffset);
-            tspan.textContent = line.trim();
-            tooltipText.appendChild(tspan);
-        }
-
-        // compute bbox and resize bg
-        const bbox = tooltipText.getBBox();
-        const bgWidth = Math.min(bbox.width + 20, MAX_WIDTH + 20);
-        const bgHeight = bbox.height + 10;
-        tooltipBg.setAttribute("width", bgWidth);
-        tooltipBg.setAttribute("height", bgHeight);
-
-        // compute cursor position in svg coords
-        const svg = (evt && evt.target) ? evt.target.ownerSVGElement : document.querySelector('svg');
-        if (!svg) return;
-        const pt = svg.createSVGPoint();
-        pt.x = (evt && typeof evt.clientX === 'number') ? evt.clientX : 0;
-        pt.y = (evt && typeof evt.clientY === 'number') ? evt.clientY : 0;
-        let cursor;
-        try {
-            cursor = pt.matrixTransform(svg.getScreenCTM().inverse());
-        } catch(e) {
-            // fallback to center of viewport if transform fails
-            cursor = { x: svg.viewBox.baseVal.width / 2, y: svg.viewBox.baseVal.height / 2 };
-        }
-
-        let xPos = cursor.x + 15;
-        let yPos = cursor.y - bbox.height - 5;
-        if (xPos + bgWidth > svg.viewBox.baseVal.width) {
-            xPos = svg.viewBox.baseVal.width - bgWidth - 5;
-        }
-        if (yPos < 0) yPos = cursor.y + 15;
-
-        tooltip.setAttribute("transform", "translate(" + xPos + "," + yPos + ")");
-        } catch (err) {
-        console.warn('tooltip error', err);
-        }
-    };
-
-    window.hideTooltip = function() {
-        try {
-        const tooltip = document.getElementById('tooltip');
-        if (tooltip) tooltip.setAttribute("visibility", "hidden");
-        } catch(e) {}
-    };
-    }, 50);
-    ]]></script>
-
-    </svg>
-    """
-
-    components.html(svg_code, height=1250, scrolling=False)
-
-# PAGE 2: COEFFICIENT ET SALAIRE DE BASE
-
-elif module == "Coefficient, valeur du point d'indice et salaire de base":
-    st.title("Coefficient et salaire de base")
-    
-    st.info("""
-    **Coefficient :** Renvoie à la grille de classification de la convention collective ECLAT.  
-    Les Animateurs et Techniciens sont rattaché·e·s par défaut au groupe A de niveau 1, 
-    qui correspond au coefficient 257. Musiques Tangentes rattache ses profs au **groupe D, 
-    coefficient 305**, dont le salaire de base est plus élevé.
-    """)
-    st.success("Nb : Le coefficient conventionnel de base, indiqué sur les bulletins de paie, est de 305 mais le coefficient réel sur " \
-    "lequel est indexé les paies des profs de Musiques Tangentes est de 367,03 (voir \"prime différentielle\"). Il est donc " \
-    "plus élevé que le coefficient maximal de la catégorie Techniciens et agents de maîtrise et s'approche de la catégorie Cadres.")
-    st.caption(f"[Lien Légifrance - Grille de classification]({url_grille})")
-    st.divider()
-    st.info("""
-    **Valeur du point d'indice** : Valeur fixée par la convention collective ECLAT.  
-    Au 1er janvier 2025, la valeur du point d'indice est de 7,15€.
-    """)
-    st.caption(f"[Lien Légifrance - Valeur du point d'indice]({url_valpoint})")
-    st.divider()
-    st.info("""
-    Le **salaire de base conventionnel** correspond à la rémunération d’un·e professeur·e à temps plein ECLAT.  
-    Il est calculé en multipliant les heures hebdomadaires contractuelles par la valeur du point d’indice et le coefficient, puis en divisant 
-    le tout par 24 afin de ramener le résultat à la quotité ETP, c’est-à-dire la fraction du temps plein effectuée.
-    Il sépare le coefficient en deux tranches pour valoriser différemment le socle de base et les points de responsabilité.
-    """)
-    
-    with st.expander("Détail de la formule conventionnelle"):
-        # La formule générale
-        st.latex(r"\text{Salaire de base} = \frac{\text{Heures hebdo} \times [ (257 \times valeur_point_v1) + (\text{Coefficient} - 257) \times valeur_point_v2 ]}{24}")
-        st.write("---")
-        # L'application avec les chiffres de 2025
-        st.write("Pour un coefficient 305 en 2025 :")
-        st.latex(r"\text{Salaire} = \frac{\text{H}_{\text{hebdo}} \times [ (257 \times 7,15) + (48 \times 6,73) ]}{24}")
-        
-        st.caption("Note : Les points d'ancienneté sont ajoutés séparément et calculés intégralement sur la valeur V1 (7,15 €).")
-        st.caption(f"[Lien Légifrance - Salaire conventionnel]({url_salaire})")
-
-# PAGE 3: HEURES CONTRACTUELLES
-
-elif module == "Mensualisation et ETP":
-    st.title("Calcul des heures contractuelles et ETP")
-
-    st.info("La **mensualisation** permet de compenser le creux d'heures pendant les vacances scolaires.")
-    with st.expander("**Comprendre la mensualisation de votre salaire**"):
-        st.write(f"""
-        La Convention Collective Nationale de l'Animation (ECLAT, IDCC 1518) impose que la rémunération des salarié·e·s en CDI soit versée sous la forme d'une mensualisation obligatoire sur 12 mois.    
-        Concrètement, le calcul de votre salaire est basé sur votre **temps de travail annuel contractuel**, lequel est ensuite **réparti de manière uniforme** sur l'ensemble de l'année civile.    
-        Cela signifie que vous percevez **un salaire de base identique et stable chaque mois, y compris lors des périodes de suspension de l'activité** (vacances scolaires).    
+page = st.navigation([
+    st.Page(PAGES / "accueil.py", title="Accueil", default=True),
+    st.Page(PAGES / "fiche_paie.py", title="Lire sa fiche de paie"),
+    st.Page(PAGES / "coefficient.py", title="Coefficient, valeur du point d'indice et salaire de base"),
+    st.Page(PAGES / "mensualisation.py", title="Mensualisation et ETP"),
+    st.Page(PAGES / "primes.py", title="Primes"),
+    st.Page(PAGES / "verificateur.py", title="Vérificateur d'heures"),
+    st.Page(PAGES / "simulateur.py", title="Simulateur complet", icon="🧮"),
+    st.Page(PAGES / "liens.py", title="Liens utiles", icon="🔗"),
+])
 
-        ##### Principes de la mensualisation
-
-        La mensualisation est une obligation légale pour tout contrat à durée indéterminée et permet d'assurer une **stabilité financière** aux salarié·e·s.  
-        > « Afin de répondre aux variations inhérentes aux activités (pendant les périodes périscolaires, scolaires, de vacances) de la branche professionnelle, de permettre de satisfaire l'accueil 
-        du public et d'éviter le recours excessif aux heures complémentaires, au chômage partiel, un régime de modulation pour les salariés à temps partiel est mis en place concernant les salariés 
-        sous CDI. »   
-        > *Source :* [*Article 5.7.4.1. de la convention collective ECLAT - Modulation pour les salariés à temps partiel*]({url_mensualisation})   
-        
-        Pour les enseignant·e·s artistiques : 
-
-        - **Le contrat est annuel :** La rémunération versée couvre l'ensemble des heures de service, les heures connexes prévues par la convention, ainsi que la rémunération des congés payés et des périodes d'inactivité.
-        - **Calcul du montant :** Le total des heures annuelles à rémunérer (incluant les 10 % de majoration pour congés payés) est divisé par 12, ce qui donne **le temps de travail mensuel rémunéré**.
-        - **Paiement stable :** Ce temps de travail mensuel rémunéré est appliqué de manière régulière (12 fois par an) pour garantir un revenu stable, même pendant les vacances scolaires.
-
-        La mensualisation ne modifie ni votre volume d'heures de service réel, ni vos droits légaux (ancienneté, congés) mais elle **assure une régularité et une sécurité financière sur l'année**.
-        """)
-
-             
-    with st.expander("Formules de calcul"):
-    	# Formule 1 : Calcul du temps de travail annuel total à rémunérer, réparti sur 12 mois.
-        st.latex(r"\text{Heures mensuelles rémunérées} = \frac{\text{Heures annuelles} \times 1,10}{12}")
-    
-    	# Formule 2 : Calcul de l'équivalent hebdomadaire de ces heures mensualisées (utile pour comparer avec l'horaire contractuel)
-    	# L'utilisation de \frac{52}{12} est la définition du coefficient de mensualisation légal.
-        st.latex(r"\text{Coefficient de mensualisation} = \frac{52 \text{ semaines}}{12 \text{ mois}} \approx 4,33 \text{ semaines/mois}")
-    
-    	# Formule 3 : L'équivalent de l'horaire de service contractuel hebdomadaire (vérification)
-        st.latex(r"\text{Heures hebdomadaires contractuelles} = \frac{\text{Heures mensuelles rémunérées}}{\frac{52}{12}}")
-        st.caption(f"[Lien Légifrance - Modulation et annualisation]({url_modulation})")
-
-        st.divider()
-        st.info("**L'équivalent temps plein** - ETP - permet de comparer les heures des profs (temps plein fixé à 24h/semaine par la convention collective ECLAT) à un temps plein classique (35h/semaine).")
-    with st.expander("Formule"):
-        st.latex("\\text{Heures mensuelles ETP} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{151,67}}{24}")
-        st.caption(f"[Lien Légifrance - Temps plein professeur]({url_etp})")
-        
-        st.divider()
-        st.write("##### Heures annuelles réelles -> Heures contractuelles et ETP :")
-        st.number_input(
-        "Heures annuelles réellement effectuées (de septembre à août) :", min_value=0.0, step=0.5
-        )
-
-    if heures_annuelles_reelles > 0:
-        heures_avec_cp = heures_annuelles_reelles * 1.10
-        heures_mensuelles = heures_avec_cp / 12
-        heures_hebdo = heures_mensuelles / (52/12)
-        heures_mensuelles_etp = (heures_hebdo * ((35 * 52)/12)) / 24
-
-        st.markdown("###### Résultats")
-        st.write(f"- Heures annuelles + 10% CP : **{heures_avec_cp:.2f} h**")
-        st.write(f"- Heures mensuelles rémunérées : **{heures_mensuelles:.2f} h/mois**")
-        st.write(f"- Heures hebdomadaires contractuelles : **{heures_hebdo:.2f} h/semaine**")
-        st.write(f"- Heures mensuelles ETP : **{heures_mensuelles_etp:.2f} h**")
-
-    st.write("##### Heures mensuelles ETP -> Heures annuelles réelles :")
-    heures_mensuelles_etp = st.number_input(
-        "Heures mensuelles ETP (affichées sur fiche de paie) :", min_value=0.0, step=0.5
-    )
-
-    if heures_mensuelles_etp > 0:
-        heures_annuelles_reelles = heures_mensuelles_etp * 7.4805
-
-        st.markdown("###### Résultats")
-        st.write(f"- Heures annuelles réelles : **{heures_annuelles_reelles:.2f} h**")
-
-
-# PAGE 4: PRIMES
-
-elif module == "Primes":
-    st.title("Calcul des primes")
-
-    st.info("La **prime d'ancienneté** est calculée sur la base du nombre d'années d'ancienneté. Elle commence à N+1. On compte 2 points par année d'ancienneté.")
-    st.info("La **prime différentielle** a été mise en place afin que tou·te·s les salarié·e·s soient sur un pied d'égalité en termes de " \
-    "rémunération, quelle que soit leur ancienneté.")
-    with st.expander("Formules"):
-        st.latex("\\text{Prime d'ancienneté} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{valeur du point d'indice} \\times (\\text{ancienneté} \\times 2)}{24}")
-        st.latex("\\text{Prime différentielle} = \\frac{\\text{valeur max entre 0 et} \\text{(62.03 - (}\\text{ancienneté} \\times 2)) \\times \\text{valeur du point d'indice} \\times \\text{heures hebdo contractuelles}}{24}")
-    
-    st.divider()
-    st.write("**Calculateur :**")
-    date_entree = st.date_input(
-        "Date d'entrée dans l'école :", min_value=date(1980,1,1), max_value=date.today()
-    )
-    heures_lissees = st.number_input("Heures hebdomadaires contractuelles :", min_value=0.0, step=0.5)
-    valeur_point_v1 = 7.15
-    valeur_point_v2 = 6.73
-    st.caption(f"Valeur du point d'indice V1 au 1er janvier 2025 : {valeur_point_v1} €.")
-    st.caption(f"Valeur du point d'indice V2 au 1er janvier 2025 : {valeur_point_v2} €.")
-
-    # Ancienneté
-    today = datetime.today().date()
-    anciennete = today.year - date_entree.year - ((today.month, today.day) < (date_entree.month, date_entree.day))
-
-    if heures_lissees > 0:
-        prime_anciennete = heures_lissees * valeur_point_v1 * (anciennete * 2) / 24
-        prime_diff = max(0, (62.03 - (anciennete * 2))) * 7.15 * heures_lissees / 24
-
-        st.markdown("### Résultats")
-        st.write(f"- Ancienneté calculée : **{anciennete} ans**")
-        st.write(f"- Prime d’ancienneté : **{prime_anciennete:.2f} €**")
-        st.write(f"- Prime différentielle : **{prime_diff:.2f} €**")
-
-
-# PAGE 5: VERIFICATEUR HEURES ANNUELLES
-
-elif module == "Vérificateur d'heures":
-    
-    def hhmm_to_decimal(hhmm):
-        """Convertit '03:30' en nombre décimal d’heures"""
-        hh, mm = hhmm.strip().split(":")
-        return int(hh) + int(mm)/60
-
-    def parse_fichier_multi_profs(fichier_txt):
-        """
-        Retourne :
-        heures_profs = { "Prénom NOM": [(date, heures), ...], ... }
-        total_annuels = { "Prénom NOM": total_annee, ... }
-        """
-        heures_profs = {}
-        total_annuels = {}
-        lines = fichier_txt.splitlines()
-        current_prof = None
-        heures_courantes = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if not re.match(r"\d{2}-\d{2}-\d{4}", line) and not line.startswith("Total"):
-                if current_prof is not None:
-                    heures_profs[current_prof] = heures_courantes
-                    total_annuels[current_prof] = sum(h for _, h in heures_courantes)
-                current_prof = line
-                heures_courantes = []
-
-            match = re.match(r"(\d{2}-\d{2}-\d{4})\s+total jour\s*:\s*(\d{2}:\d{2})", line)
-            if match:
-                date_str, hhmm = match.groups()
-                heures_courantes.append((date_str, hhmm_to_decimal(hhmm)))
-
-            elif line.startswith("Total Période"):
-                match_total = re.search(r"([\d,\.]+)", line)
-                if match_total:
-                    total_annuel = float(match_total.group(1).replace(",", "."))
-                    total_annuels[current_prof] = total_annuel
-
-        if current_prof is not None:
-            heures_profs[current_prof] = heures_courantes
-            if current_prof not in total_annuels:
-                total_annuels[current_prof] = sum(h for _, h in heures_courantes)
-
-        return heures_profs, total_annuels
-
-    # Lecture backend
-    DATA_FILE = Path(__file__).parent / "heures_2526.txt"
-
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        contenu = f.read()
-
-    heures_profs, total_annuels = parse_fichier_multi_profs(contenu)
-
-    st.title("Vérificateur heures annuelles réelles")
-
-    prof_selectionne = st.selectbox("Sélectionnez votre nom :", list(heures_profs.keys()))
-
-    if prof_selectionne:
-        data_semaine = heures_profs[prof_selectionne]
-        dates = [d for d, _ in data_semaine]
-        heures = [h for _, h in data_semaine]
-        total_annuel = total_annuels[prof_selectionne]
-
-        st.markdown(f"### Total annuel : **{total_annuel:.2f} h**")
-
-        # Tableau avec dates réelles     
-        df_heures = pd.DataFrame({
-            "Date": dates,
-            "Heures": heures
-        })
-        jours_fr = {
-            "Monday": "Lundi",
-            "Tuesday": "Mardi",
-            "Wednesday": "Mercredi",
-            "Thursday": "Jeudi",
-            "Friday": "Vendredi",
-            "Saturday": "Samedi",
-            "Sunday": "Dimanche"
-        }
-        df_heures['Jour'] = df_heures['Date'].apply(
-            lambda x: jours_fr[datetime.strptime(x, "%d-%m-%Y").strftime("%A")]
+# Sidebar
+st.sidebar.title("Musiques Tangentes")
+st.sidebar.image(variante_image(LOGO, 300), width=300)
+
+# Chronométrage des étapes (ECLAT_CHRONO=1) : une trace par exécution de la page
+trace = chrono.commencer(page.title)
+if trace is not None:
+    trace.session = st.session_state.setdefault("chrono_session", uuid4().hex[:8])
+    reruns = st.session_state["chrono_reruns"] = st.session_state.get("chrono_reruns", 0) + 1
+
+# st.stop(), st.switch_page() et les reruns interrompent page.run() par une
+# exception : la trace est close dans tous les cas, ces exécutions comprises.
+# Pas de st.session_state dans le finally : après st.stop(), y accéder relance
+# l'exception avant l'écriture de la trace.
+interrompue = True
+try:
+    page.run()
+    interrompue = False
+finally:
+    if trace is not None:
+        chrono.terminer(trace, reruns=reruns, interrompue=interrompue)
+
+# DIAGNOSTICS (ECLAT_CHRONO=1)
+
+if trace is not None:
+    with st.sidebar.expander("Diagnostics"):
+        st.caption(
+            f"Session {trace.session} : {reruns} exécutions. "
+            f"Cette page : {trace.duree * 1000:.0f} ms. Journal : {chrono.JOURNAL}"
         )
-        df_heures = df_heures[['Jour', 'Date', 'Heures']]
-        st.dataframe(df_heures, use_container_width=True)
-
-        # Export PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
-        styles = getSampleStyleSheet()
-        story = []
-
-        story.append(Paragraph(f"Relevé heures annuelles - {prof_selectionne}", styles["Title"]))
-        story.append(Spacer(1,12))
-        story.append(Paragraph(f"Total annuel : {total_annuel:.2f} h", styles["Normal"]))
-        story.append(Spacer(1,12))
-
-        for date_str, h in data_semaine:
-            story.append(Paragraph(f"{date_str} : {h:.2f} h", styles["Normal"]))
-
-        doc.build(story)
-        pdf_data = buffer.getvalue()
-
-        st.download_button(
-            label="Télécharger le PDF récapitulatif",
-            data=pdf_data,
-            file_name=f"heures_{prof_selectionne.replace(' ','_')}.pdf",
-            mime="application/pdf"
+        st.dataframe(
+            [{"Étape": etape, "Appels": nombre, "ms": round(secondes * 1000, 1)} for etape, (nombre, secondes) in trace.par_etape().items()],
+            hide_index=True,
         )
-
-
-# PAGE 6: SIMULATEUR COMPLET
-
-elif module == "🧮 Simulateur complet":
-    st.title("🧮 Simulateur complet")
-    heures_annuelles = st.number_input("Heures annuelles réellement effectuées :", min_value=0.0, step=0.5)
-    date_entree = st.date_input("Date d'entrée dans l'école :", min_value=date(1980,1,1), max_value=date.today())
-
-    if heures_annuelles > 0:
-        # Heures lissées
-        heures_avec_cp = heures_annuelles * 1.10
-        heures_mensuelles = heures_avec_cp / 12
-        heures_hebdo = heures_mensuelles / (52/12)
-        heures_mensuelles_etp = (heures_hebdo * ((35 * 52)/12)) / 24
-
-        # Ancienneté & primes
-        valeur_point_v1 = 7.15
-        valeur_point_v2 = 6.73
-        today = datetime.today().date()
-        anciennete = today.year - date_entree.year - ((today.month, today.day) < (date_entree.month, date_entree.day))
-        prime_anciennete = heures_hebdo * valeur_point_v1 * (anciennete * 2) / 24
-        prime_diff = max(0, (62.03 - (anciennete * 2))) * 7.15 * heures_hebdo / 24
-
-        # Salaire brut
-        salaire_base = (heures_hebdo * ((valeur_point_v1 * 257) + (valeur_point_v2 * 48))) / 24
-        salaire_brut_total = salaire_base + prime_anciennete + prime_diff
-        total_brut_abattu = salaire_brut_total * 0.7
-        cotisations_sal = (total_brut_abattu * 0.069) + (total_brut_abattu * 0.004) + (total_brut_abattu * 0.0401) + ((salaire_base * 0.9825) * 0.068) + ((salaire_base * 0.9825) * 0.029)
-        salaire_net = salaire_brut_total - cotisations_sal
-        
-        # Heures réelles mensuelles
-        coef_etp_par_heure_reelle = 1.36
-        heures_mensuelles_reelles = heures_mensuelles_etp / coef_etp_par_heure_reelle
-        taux_horaire_brut_reel = salaire_brut_total / heures_mensuelles_reelles
-
-        st.markdown("### Résultats")
-        st.write(f"- Heures mensuelles rémunérées : **{heures_mensuelles:.2f} h/mois**")
-        st.write(f"- Heures hebdomadaires contactuelles : **{heures_hebdo:.2f} h/semaine**")
-        st.write(f"- Heures mensuelles ETP : **{heures_mensuelles_etp:.2f} h**")
-        st.write(f"- Ancienneté : **{anciennete} ans**")
-        st.write(f"- Prime d’ancienneté : **{prime_anciennete:.2f} €**")
-        st.write(f"- Prime différentielle : **{prime_diff:.2f} €**")
-        st.write(f"- Salaire de base conventionnel : **{salaire_base:.2f} €**")
-        st.write(f"- Salaire brut total estimé : **{salaire_brut_total:.2f} €**")
-        st.write(f"- Salaire net estimé : **{salaire_net:.2f} €**")
-        st.write(f"- Taux horaire brut réel : **{taux_horaire_brut_reel:.2f} €/h**")
-        st.write(f":red[Attention : Les profs rattaché·e·s à la mutuelle de Musiques Tangentes et les profs imposables auront un salaire net moins élevé que le montant estimé, puisque ces montants sont déduits du salaire brut total.]")
-
-        # Export PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4)
-        styles = getSampleStyleSheet()
-        story = []
-
-        story.append(Paragraph("Simulation de salaire - Convention ECLAT", styles["Title"]))
-        story.append(Spacer(1, 12))
-        story.append(Paragraph(f"Heures annuelles réelles : {heures_annuelles:.2f} h", styles["Normal"]))
-        story.append(Paragraph(f"Heures mensuelles rémunérées : {heures_mensuelles:.2f} h/mois", styles["Normal"]))
-        story.append(Paragraph(f"Heures hebdomadaires contractuelles : {heures_hebdo:.2f} h/semaine", styles["Normal"]))
-        story.append(Paragraph(f"Heures mensuelles ETP : {heures_mensuelles_etp:.2f} h", styles["Normal"]))
-        story.append(Paragraph(f"Heures mensuelles réelles (équivalentes) : {heures_mensuelles_reelles:.2f} h", styles["Normal"]))
-        story.append(Paragraph(f"Ancienneté : {anciennete} ans", styles["Normal"]))
-        story.append(Spacer(1, 12))
-        story.append(Paragraph(f"Salaire de base : {salaire_base:.2f} €", styles["Normal"]))
-        story.append(Paragraph(f"Prime d’ancienneté : {prime_anciennete:.2f} €", styles["Normal"]))
-        story.append(Paragraph(f"Prime différentielle : {prime_diff:.2f} €", styles["Normal"]))
-        story.append(Paragraph(f"<b>Salaire brut total : {salaire_brut_total:.2f} €</b>", styles["Heading2"]))
-        story.append(Spacer(1, 12))
-        story.append(Paragraph(f"Taux horaire brut réel : {taux_horaire_brut_reel:.2f} €/h", styles["Normal"]))
-
-        doc.build(story)
-        pdf_data = buffer.getvalue()
-
-        st.download_button(
-            label="📄 Télécharger le PDF récapitulatif",
-            data=pdf_data,
-            file_name="simulation_eclat.pdf",
-            mime="application/pdf"
+        st.dataframe(
+            [
+                {"Page": page, "Exécutions": nombre, "p50 (ms)": round(p50 * 1000), "p95 (ms)": round(p95 * 1000)}
+                for page, (nombre, p50, p95) in chrono.statistiques().items()
+            ],
+            hide_index=True,
         )
-
-
-# PAGE 7: LIENS UTILES
-
-elif module == "🔗 Liens utiles":
-    st.title("🔗 Liens utiles")
-    
-    st.write("### 1. Textes et avenants")
-    st.markdown(f"- [Convention collective ECLAT - IDCC 1518]({url_eclat})")
-    st.markdown(f"- [Classifications et salaires]({url_salaire})")
-    st.markdown(f"- [Durée et définition des temps de travail des animateurs techniciens et professeurs]({url_etp})")
-    st.markdown(f"- [Durée du travail : Modulation]({url_modulation})")
-
-    st.write("### 2. Formules")
-
-    with st.expander("Salaire de base"):
-        st.latex(r"\text{Salaire de base} = \frac{\text{Heures hebdo} \times [ (257 \times V_1) + (\text{Coefficient} - 257) \times V_2 ]}{24}")
-        st.write("---")
-        st.write("Pour un coefficient 305 en 2025 :")
-        st.latex(r"\text{Salaire} = \frac{\text{H}_{\text{hebdo}} \times [ (257 \times 7,15) + (48 \times 6,73) ]}{24}")
-        st.caption("Note : Les points d'ancienneté sont ajoutés séparément et calculés intégralement sur la valeur V1 (7,15 €).")
-    with st.expander("Heures mensuelles rémunérées"):
-        st.latex("\\text{Heures mensuelles rémunérées} = \\frac{\\text{Heures annuelles} + 10\\% \\text{ CP}}{12}")
-    with st.expander("Heures hebdomadaires contractuelles"):
-        st.latex("\\text{Heures hebdomadaires contractuelles} = \\frac{\\text{Heures mensuelles rémunérées}}{\\frac{52}{12}}")
-    with st.expander("Heures mensuelles ETP"):
-        st.latex("\\text{Heures mensuelles ETP} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{151,67}}{24}")
-    with st.expander("Prime d'ancienneté"): 
-        st.latex("\\text{Prime d'ancienneté} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{valeur du point d'indice} \\times (\\text{ancienneté} \\times 2)}{24}")
-    with st.expander("Prime différentielle"):
-        st.latex("\\text{Prime différentielle} = \\frac{\\text{valeur max entre 0 et} \\text{(62.03 - (}\\text{ancienneté} \\times 2)) \\times \\text{valeur du point d'indice} \\times \\text{heures hebdo contractuelles}}{24}")
\ No newline at end of file
@@ -0,0 +1,96 @@
+"""
+Temps de démarrage à froid de l'application (première exécution de la page
+Accueil dans un interpréteur neuf, Streamlit déjà importé comme par le
+serveur), et vérification que les modules lourds ne sont pas chargés au
+démarrage. Le détail par module vient de `python -X importtime`.
+
+    python -m benchmarks.bench_import [--budget-ms 900] [--repetitions 5]
+
+Code de sortie 1 si le budget est dépassé ou si un module interdit est importé.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+RACINE = Path(__file__).resolve().parent.parent
+
+# Modules qui ne doivent pas être chargés pour afficher la page d'accueil
+# (numpy et streamlit.components.v1 sont importés par Streamlit lui-même)
+INTERDITS = ["pandas", "reportlab", "streamlit_javascript"]
+
+BUDGET_MS = 900
+
+RE_LIGNE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+# Exécuté dans l'interpréteur neuf : une exécution de l'application par AppTest,
+# comme à la première visite (st.navigation ne fonctionne pas en simple import)
+LANCEUR = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+avant = set(sys.modules)
+debut = time.perf_counter()
+app = AppTest.from_file({script!r}, default_timeout=60).run()
+duree = time.perf_counter() - debut
+if app.exception:
+    raise SystemExit(app.exception[0].message)
+print(json.dumps({{"ms": duree * 1000, "modules": sorted(set(sys.modules) - avant)}}))
+"""
+
+
+def mesurer_import(script):
+    """Lance un interpréteur neuf ; retourne (durée en ms, { module chargé par l'application: cumul en ms })"""
+    resultat = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LANCEUR.format(script=str(RACINE / script))],
+        cwd=RACINE, capture_output=True, text=True, env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if resultat.returncode != 0:
+        raise SystemExit(resultat.stderr)
+    mesure = json.loads(resultat.stdout.strip().splitlines()[-1])
+    nouveaux = set(mesure["modules"])
+    modules = {}
+    for match in RE_LIGNE.finditer(resultat.stderr):
+        if match.group(4) in nouveaux:
+            modules[match.group(4)] = int(match.group(2)) / 1000
+    return mesure["ms"], modules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--script", default="app_calculateur.py")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--repetitions", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Premier lancement pour remplir les caches de bytecode et du système de fichiers
+    mesurer_import(args.script)
+    mesures = [mesurer_import(args.script) for _ in range(args.repetitions)]
+    totaux = [total for total, _ in mesures]
+    median = statistics.median(totaux)
+    _, modules = mesures[-1]
+
+    plus_lents = sorted(
+        ((ms, nom) for nom, ms in modules.items() if nom.count(".") == 0),
+        reverse=True,
+    )[:8]
+    print(f"Démarrage de {args.script} : médiane {median:.0f} ms (min {min(totaux):.0f}, max {max(totaux):.0f}), budget {args.budget_ms:.0f} ms")
+    for ms, nom in plus_lents:
+        print(f"  {ms:8.1f} ms  {nom}")
+
+    echec = False
+    charges = [nom for nom in INTERDITS if nom in modules]
+    if charges:
+        print(f"Modules lourds chargés au démarrage : {', '.join(charges)}")
+        echec = True
+    if median > args.budget_ms:
+        print("Budget de démarrage dépassé")
+        echec = True
+    return 1 if echec else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
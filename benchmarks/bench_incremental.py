@@ -0,0 +1,62 @@
+"""
+Coût d'un rechargement après l'ajout d'une semaine d'heures : relecture complète
+(charger_releve) contre ChargeurIncremental, sur des copies agrandies de heures_2526.txt.
+
+    python -m benchmarks.bench_incremental [--echelles 10 100 1000]
+"""
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+
+from benchmarks.bench_parseur import SOURCE, copie_agrandie
+from calculateur.heures import empreinte_fichier
+from calculateur.incremental import ChargeurIncremental
+from calculateur.stockage import charger_releve
+
+
+def semaine(numero):
+    """Lignes d'une semaine de cours pour le·la dernier·ère prof du fichier, puis un·e nouvel·le prof."""
+    lundi = date(2026, 7, 6) + timedelta(weeks=numero)
+    jours = [f"{(lundi + timedelta(days=j)).strftime('%d-%m-%Y')} total jour : 03:30\n" for j in range(5)]
+    return "".join(jours) + f"Remplaçant·e SEMAINE{numero}\n" + "".join(jours)
+
+
+def identiques(a, b):
+    return (a.noms == b.noms and a.jours == b.jours and a.minutes == b.minutes
+            and a.totaux == b.totaux and a.empreinte == b.empreinte
+            and a.mensuel.minutes == b.mensuel.minutes and a.mensuel.ecarts == b.mensuel.ecarts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--echelles", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--semaines", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'échelle':>8} {'Mo':>7} {'complet (s)':>12} {'incrémental (s)':>16} {'gain':>8}")
+        for echelle in args.echelles:
+            chemin = copie_agrandie(SOURCE, echelle, dossier)
+            chargeur = ChargeurIncremental(chemin)
+            chargeur.charger()
+            t_complet = t_incremental = 0.0
+            for numero in range(args.semaines):
+                with open(chemin, "a", encoding="utf-8") as f:
+                    f.write(semaine(numero))
+                debut = time.perf_counter()
+                releve = chargeur.charger()
+                t_incremental += time.perf_counter() - debut
+                debut = time.perf_counter()
+                complet = charger_releve(chemin, empreinte_fichier(chemin))
+                t_complet += time.perf_counter() - debut
+                if not identiques(releve, complet):
+                    raise SystemExit(f"Résultats différents à l'échelle x{echelle}, semaine {numero}")
+            n = args.semaines
+            print(f"{'x' + str(echelle):>8} {chemin.stat().st_size / 2**20:>7.1f} {t_complet / n:>12.4f} "
+                  f"{t_incremental / n:>16.5f} {t_complet / t_incremental:>7.0f}x")
+            chemin.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Débit du parsing parallèle (parallele.py) selon le nombre de processus,
+contre le parsing séquentiel, sur un export synthétique (generateur.py).
+Le relevé parallèle est comparé à celui de charger_releve et de
+parse_fichier_multi_profs.
+
+    python -m benchmarks.bench_parallele [--echelle 3000] [--processus 1 2 4 8]
+
+Une échelle de 3000 donne un fichier d'environ 115 Mo. Sur une machine à un
+seul cœur, le parallèle ne fait qu'ajouter le coût des processus : le
+chargeur ne s'en sert qu'à partir de deux cœurs.
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_incremental import identiques
+from benchmarks.generateur import generer
+from calculateur.heures import empreinte_fichier, parse_fichier_multi_profs
+from calculateur.parallele import charger_releve_parallele, processus_disponibles
+from calculateur.stockage import charger_releve
+
+
+def meilleur_temps(fonction, repetitions):
+    meilleur, resultat = float("inf"), None
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        resultat = fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur, resultat
+
+
+def comme_parse_fichier(releve):
+    """Le relevé au format de parse_fichier_multi_profs"""
+    return {nom: releve.jours_prof(nom) for nom in releve.noms}, {nom: releve.totaux[nom] for nom in releve.noms}
+
+
+def main():
+    coeurs = processus_disponibles()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--echelle", type=int, default=3000)
+    parser.add_argument("--processus", type=int, nargs="+",
+                        default=sorted({1, 2, 4, coeurs} | {n for n in (8, 16) if n <= coeurs}))
+    parser.add_argument("--repetitions", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin = Path(dossier) / "heures_consolide.txt"
+        generer(chemin, args.echelle)
+        mo = chemin.stat().st_size / 2**20
+        print(f"{mo:.0f} Mo, {coeurs} cœur(s) disponible(s)")
+
+        t_seq, sequentiel = meilleur_temps(lambda: charger_releve(chemin, empreinte_fichier(chemin)), args.repetitions)
+        with open(chemin, encoding="utf-8") as f:
+            reference = parse_fichier_multi_profs(f.read())
+        if comme_parse_fichier(sequentiel) != reference:
+            raise SystemExit("charger_releve diffère de parse_fichier_multi_profs")
+
+        print(f"{'processus':>10} {'temps (s)':>10} {'Mo/s':>8} {'gain':>6}")
+        print(f"{'séquentiel':>10} {t_seq:>10.3f} {mo / t_seq:>8.1f} {1:>5.1f}x")
+        for processus in args.processus:
+            t_par, releve = meilleur_temps(lambda: charger_releve_parallele(chemin, processus), args.repetitions)
+            if not identiques(releve, sequentiel):
+                raise SystemExit(f"Relevé parallèle différent avec {processus} processus")
+            print(f"{processus:>10} {t_par:>10.3f} {mo / t_par:>8.1f} {t_seq / t_par:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
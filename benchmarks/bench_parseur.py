@@ -0,0 +1,101 @@
+"""
+Compare le parseur d'origine (lecture complète + splitlines) au parseur en flux
+vers le stockage en colonnes, sur des copies agrandies de heures_2526.txt.
+La dernière colonne est un démarrage à chaud : hash de l'export et ouverture
+de la copie binaire (binaire.py), sans parsing.
+
+    python -m benchmarks.bench_parseur [--echelles 10 100 1000]
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks import reference
+from calculateur.binaire import chemin_binaire, ecrire_releve, ouvrir_releve
+from calculateur.heures import charger_fichier_heures, empreinte_fichier, lire_blocs_profs
+from calculateur.stockage import charger_releve
+
+SOURCE = Path(__file__).resolve().parent.parent / "heures_2526.txt"
+
+
+def copie_agrandie(source, echelle, dossier):
+    """Écrit `echelle` copies de l'export, avec des noms de profs suffixés pour rester distincts."""
+    lignes = source.read_text(encoding="utf-8").splitlines()
+    chemin = Path(dossier) / f"heures_x{echelle}.txt"
+    with open(chemin, "w", encoding="utf-8") as f:
+        for i in range(echelle):
+            for line in lignes:
+                texte = line.strip()
+                if texte and not texte[0].isdigit() and not texte.startswith("Total"):
+                    line = f"{texte} {i}"
+                f.write(line + "\n")
+    return chemin
+
+
+def lecture_reference(chemin):
+    with open(chemin, "r", encoding="utf-8") as f:
+        contenu = f.read()
+    return reference.parse_fichier_multi_profs(contenu)
+
+
+def sans_lignes_vides(resultat):
+    """(heures_profs, total_annuels) sans les noms sans aucun jour : l'ancien parseur gardait l'en-tête « Prénom NOM »"""
+    heures_profs, total_annuels = resultat
+    noms = [nom for nom, jours in heures_profs.items() if jours]
+    return {nom: heures_profs[nom] for nom in noms}, {nom: total_annuels[nom] for nom in noms}
+
+
+def parcours_flux(chemin):
+    """Parcourt les blocs sans les conserver : mesure la mémoire propre au parseur."""
+    for _ in lire_blocs_profs(chemin):
+        pass
+
+
+def demarrage_a_chaud(chemin):
+    return ouvrir_releve(chemin_binaire(chemin), empreinte_fichier(chemin))
+
+
+def mesurer(fonction, chemin, repetitions):
+    """Meilleur temps sur `repetitions` essais, puis pic mémoire d'un essai sous tracemalloc."""
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        resultat = fonction(chemin)
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    del resultat
+    tracemalloc.start()
+    fonction(chemin)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return meilleur, pic
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--echelles", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dossier:
+        print(f"{'échelle':>8} {'lignes':>10} {'origine (s)':>12} {'flux (s)':>10} {'gain':>6} {'pic origine':>12} {'pic flux':>10} {'pic parcours':>13} {'à chaud (s)':>12}")
+        for echelle in args.echelles:
+            chemin = copie_agrandie(SOURCE, echelle, dossier)
+            if sans_lignes_vides(lecture_reference(chemin)) != sans_lignes_vides(charger_fichier_heures(chemin)):
+                raise SystemExit(f"Résultats différents à l'échelle x{echelle}")
+            with open(chemin, encoding="utf-8") as f:
+                nb_lignes = sum(1 for _ in f)
+            t_ref, pic_ref = mesurer(lecture_reference, chemin, args.repetitions)
+            t_flux, pic_flux = mesurer(charger_releve, chemin, args.repetitions)
+            _, pic_parcours = mesurer(parcours_flux, chemin, 1)
+            ecrire_releve(charger_releve(chemin, empreinte_fichier(chemin)), chemin_binaire(chemin))
+            t_chaud, _ = mesurer(demarrage_a_chaud, chemin, args.repetitions)
+            print(f"{'x' + str(echelle):>8} {nb_lignes:>10} {t_ref:>12.4f} {t_flux:>10.4f} {t_ref / t_flux:>5.1f}x "
+                  f"{pic_ref / 2**20:>10.1f}Mo {pic_flux / 2**20:>8.1f}Mo {pic_parcours / 2**20:>11.2f}Mo {t_chaud:>12.4f}")
+            chemin.unlink()
+            chemin_binaire(chemin).unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Rendu du relevé PDF sur un relevé long (par défaut 5 000 jours, plusieurs
+saisons) : tableau paginé de calculateur.pdf contre le relevé d'origine
+(un Paragraph par jour, document dans un BytesIO, benchmarks.reference).
+
+    python -m benchmarks.bench_pdf [--jours 5000] [--budget-ms 1000] [--budget-mo 8]
+
+Critères d'acceptation : meilleur temps de rendu et pic mémoire (tracemalloc)
+du nouveau relevé sous les budgets. Code de sortie 1 sinon.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from benchmarks import reference
+from calculateur.pdf import pdf_releve
+
+JOURS = 5000
+BUDGET_MS = 1000
+BUDGET_MO = 8
+
+DUREES = [1.0, 1.5, 2.0, 3.5, 4.75]
+
+
+def jours_synthetiques(nombre):
+    """[(date "jj-mm-aaaa", heures), ...] : un jour sur deux depuis septembre 2010"""
+    debut = date(2010, 9, 1)
+    return [((debut + timedelta(days=2 * i)).strftime("%d-%m-%Y"), DUREES[i % len(DUREES)]) for i in range(nombre)]
+
+
+def rendu_tableau(nom, total, jours):
+    with pdf_releve(nom, total, jours) as fichier:
+        fichier.seek(0, 2)
+        return fichier.tell()
+
+
+def rendu_origine(nom, total, jours):
+    return len(reference.pdf_releve(nom, total, jours))
+
+
+def mesurer(fonction, args, repetitions):
+    """(meilleur temps en s, pic mémoire en octets, taille du PDF)"""
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        taille = fonction(*args)
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    tracemalloc.start()
+    fonction(*args)
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return meilleur, pic, taille
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jours", type=int, default=JOURS)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--budget-mo", type=float, default=BUDGET_MO)
+    parser.add_argument("--sans-origine", action="store_true", help="ne pas mesurer le relevé d'origine (lent)")
+    args = parser.parse_args(argv)
+
+    jours = jours_synthetiques(args.jours)
+    entree = ("Gérald POÈTE", sum(h for _, h in jours), jours)
+    rendu_tableau(*entree)  # imports de reportlab et styles hors mesure
+
+    rendus = [("tableau", rendu_tableau)] + ([] if args.sans_origine else [("origine", rendu_origine)])
+    print(f"{args.jours} jours")
+    print(f"{'rendu':>8} {'temps (ms)':>11} {'pic (Mo)':>9} {'PDF (Ko)':>9}")
+    resultats = {}
+    for libelle, fonction in rendus:
+        secondes, pic, taille = mesurer(fonction, entree, args.repetitions)
+        resultats[libelle] = (secondes * 1000, pic / 2**20)
+        print(f"{libelle:>8} {secondes * 1000:>11.0f} {pic / 2**20:>9.1f} {taille / 2**10:>9.0f}")
+
+    ms, mo = resultats["tableau"]
+    print(f"Budgets : {args.budget_ms:.0f} ms, {args.budget_mo:.0f} Mo")
+    echec = False
+    if ms > args.budget_ms:
+        print("Budget de temps dépassé")
+        echec = True
+    if mo > args.budget_mo:
+        print("Budget mémoire dépassé")
+        echec = True
+    return 1 if echec else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""
+Générateur d'exports d'heures synthétiques au format de heures_2526.txt.
+
+Chaque « école » compte 24 profs avec 1 à 3 cours par semaine de mi-septembre
+à fin juin (hors vacances scolaires), une ligne « Total Mois » à chaque fin de
+mois et « Total Mois ; Total Période » sur le dernier mois. Les noms sont
+uniques dans tout le fichier. Même graine, même fichier.
+
+    python -m benchmarks.generateur sortie.txt [--echelle 100] [--graine 0]
+"""
+import argparse
+import random
+from datetime import date, timedelta
+
+PROFS_PAR_ECOLE = 24
+
+PRENOMS = [
+    "Marc-André", "Frédéric", "Cristina", "Wassim", "Mathieu", "Erick", "Julien", "Rozenn", "Diane",
+    "Alexis", "Emmanuel", "Gunnar", "Maria de la paz", "Karine", "Guillaume", "Renaud", "Gérald",
+    "Swann", "Daniel", "Kaïs", "Soheil", "Miguel", "Céline", "Élodie", "Noémie", "Anaïs", "Loïc",
+]
+NOMS = [
+    "ALBERGEL", "ANDRE", "ARDELEAN", "BENAMMAR", "BOISSEL", "BORELVA", "BORIES", "BROUDIC", "BURLOT",
+    "COLLIN", "DUCLOUX", "ELLWANGER", "GUTIERREZ", "KOHLER", "KUREK", "MICHELON", "PENARANDA", "POÈTE",
+    "ROZEC", "SCHEEL", "SIALA", "TABRIZI-ZADEH", "YANOVER", "LE GOFF", "QUÉGUINER",
+]
+
+# Durées de cours observées dans l'export réel, en minutes
+DUREES = [30, 60, 90, 120, 180, 195, 210, 270, 285, 315]
+
+# Vacances scolaires (zone B, 2025-2026), bornes incluses
+VACANCES = [
+    (date(2025, 10, 18), date(2025, 11, 2)),
+    (date(2025, 12, 20), date(2026, 1, 4)),
+    (date(2026, 2, 14), date(2026, 3, 1)),
+    (date(2026, 4, 11), date(2026, 4, 26)),
+]
+DEBUT_SAISON = date(2025, 9, 15)
+FIN_SAISON = date(2026, 6, 30)
+
+
+def heures_fr(minutes):
+    """Minutes -> '12,5' / '11' / '13,33', comme les totaux de l'export"""
+    return f"{minutes / 60:.2f}".rstrip("0").rstrip(".").replace(".", ",")
+
+
+def en_vacances(jour):
+    return any(debut <= jour <= fin for debut, fin in VACANCES)
+
+
+def jours_de_cours(rng):
+    """Jours travaillés d'un·e prof : mêmes jours de semaine toute l'année, quelques absences"""
+    jours_semaine = sorted(rng.sample(range(5), rng.choice((1, 1, 1, 2, 2))))
+    durees = {j: rng.choice(DUREES) for j in jours_semaine}
+    lundi = DEBUT_SAISON - timedelta(days=DEBUT_SAISON.weekday())
+    while lundi <= FIN_SAISON:
+        for j in jours_semaine:
+            jour = lundi + timedelta(days=j)
+            if DEBUT_SAISON <= jour <= FIN_SAISON and not en_vacances(jour) and rng.random() > 0.05:
+                yield jour, durees[j]
+        lundi += timedelta(weeks=1)
+
+
+def bloc_prof(nom, rng):
+    """Lignes du bloc d'un·e prof"""
+    lignes = [nom]
+    mois_courant, total_mois, total_periode = None, 0, 0
+    for jour, minutes in jours_de_cours(rng):
+        if mois_courant is not None and (jour.year, jour.month) != mois_courant:
+            lignes.append(f"Total Mois : {heures_fr(total_mois)} heures  ")
+            total_mois = 0
+        mois_courant = (jour.year, jour.month)
+        lignes.append(f"{jour.strftime('%d-%m-%Y')} total jour : {minutes // 60:02d}:{minutes % 60:02d}")
+        total_mois += minutes
+        total_periode += minutes
+    if mois_courant is not None:
+        lignes.append(f"Total Mois : {heures_fr(total_mois)} h; Total Période : {heures_fr(total_periode)} h; ")
+    lignes.append("")
+    return lignes
+
+
+def noms_uniques(nombre, rng):
+    """`nombre` noms « Prénom NOM » distincts ; au-delà des combinaisons, un numéro d'école est ajouté"""
+    combinaisons = [f"{prenom} {nom}" for prenom in PRENOMS for nom in NOMS]
+    rng.shuffle(combinaisons)
+    return [
+        combinaisons[i % len(combinaisons)] + (f" {i // len(combinaisons) + 1}" if i >= len(combinaisons) else "")
+        for i in range(nombre)
+    ]
+
+
+def generer(chemin, echelle=1, graine=0):
+    """Écrit un export de `echelle` écoles dans `chemin` ; retourne le nombre de lignes"""
+    rng = random.Random(graine)
+    nombre = 0
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.write("Prénom NOM\n\n")
+        for nom in noms_uniques(PROFS_PAR_ECOLE * echelle, rng):
+            lignes = bloc_prof(nom, rng)
+            f.write("\n".join(lignes) + "\n")
+            nombre += len(lignes)
+    return nombre + 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sortie")
+    parser.add_argument("--echelle", type=int, default=1)
+    parser.add_argument("--graine", type=int, default=0)
+    args = parser.parse_args()
+    print(f"{generer(args.sortie, args.echelle, args.graine)} lignes écrites dans {args.sortie}")
+
+
+if __name__ == "__main__":
+    main()
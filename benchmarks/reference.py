@@ -0,0 +1,79 @@
+"""
+Implémentations d'origine, figées pour servir de référence aux benchmarks.
+Ne pas optimiser : elles mesurent le point de départ.
+"""
+import re
+
+
+def hhmm_to_decimal(hhmm):
+    """Convertit '03:30' en nombre décimal d’heures"""
+    hh, mm = hhmm.strip().split(":")
+    return int(hh) + int(mm)/60
+
+
+def parse_fichier_multi_profs(fichier_txt):
+    """
+    Retourne :
+    heures_profs = { "Prénom NOM": [(date, heures), ...], ... }
+    total_annuels = { "Prénom NOM": total_annee, ... }
+    """
+    heures_profs = {}
+    total_annuels = {}
+    lines = fichier_txt.splitlines()
+    current_prof = None
+    heures_courantes = []
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        if not re.match(r"\d{2}-\d{2}-\d{4}", line) and not line.startswith("Total"):
+            if current_prof is not None:
+                heures_profs[current_prof] = heures_courantes
+                total_annuels[current_prof] = sum(h for _, h in heures_courantes)
+            current_prof = line
+            heures_courantes = []
+
+        match = re.match(r"(\d{2}-\d{2}-\d{4})\s+total jour\s*:\s*(\d{2}:\d{2})", line)
+        if match:
+            date_str, hhmm = match.groups()
+            heures_courantes.append((date_str, hhmm_to_decimal(hhmm)))
+
+        elif line.startswith("Total Période"):
+            match_total = re.search(r"([\d,\.]+)", line)
+            if match_total:
+                total_annuel = float(match_total.group(1).replace(",", "."))
+                total_annuels[current_prof] = total_annuel
+
+    if current_prof is not None:
+        heures_profs[current_prof] = heures_courantes
+        if current_prof not in total_annuels:
+            total_annuels[current_prof] = sum(h for _, h in heures_courantes)
+
+    return heures_profs, total_annuels
+
+
+def pdf_releve(nom, total_annuel, jours):
+    """Relevé d'origine : un Paragraph par jour, document construit dans un BytesIO"""
+    from io import BytesIO
+
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    styles = getSampleStyleSheet()
+    story = []
+
+    story.append(Paragraph(f"Relevé heures annuelles - {nom}", styles["Title"]))
+    story.append(Spacer(1,12))
+    story.append(Paragraph(f"Total annuel : {total_annuel:.2f} h", styles["Normal"]))
+    story.append(Spacer(1,12))
+
+    for date_str, h in jours:
+        story.append(Paragraph(f"{date_str} : {h:.2f} h", styles["Normal"]))
+
+    doc.build(story)
+    return buffer.getvalue()
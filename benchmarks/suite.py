@@ -0,0 +1,142 @@
+"""
+Suite de benchmarks des chemins critiques, sur des exports synthétiques
+(benchmarks.generateur) à plusieurs échelles. Les résultats sont écrits en JSON
+pour comparer les versions entre elles : par défaut dans le dossier temporaire
+(eclat-benchmarks/<version>.json), hors du dépôt.
+
+    python -m benchmarks.suite [--echelles 10 100 1000] [--sortie resultats.json] [--comparer ancien.json]
+
+Mesures (meilleur temps sur --repetitions essais) :
+- parse_fichier_multi_profs : parsing du texte complet (API historique)
+- charger_releve : parsing en flux vers le stockage en colonnes
+- dataframe_jour : ReleveHeures.dataframe() (colonnes Jour / Date / Heures), une école de 24 profs
+- pdf_releve : PDF du relevé, une école de 24 profs
+- simuler_salaire : simulateur scalaire, une fois par prof
+- simuler_lot : simulateur vectorisé, tou·te·s les profs en un appel
+- simuler_mensuel : paie reconstituée mois par mois, tou·te·s les profs en un appel
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from benchmarks.generateur import PROFS_PAR_ECOLE, generer
+from calculateur.heures import parse_fichier_multi_profs
+from calculateur.paie import simuler_lot, simuler_mensuel, simuler_salaire
+from calculateur.stockage import charger_releve
+
+RACINE = Path(__file__).resolve().parent.parent
+AUJOURD_HUI = date(2026, 6, 30)
+
+
+def version():
+    """Commit courant (suffixé de + si l'arbre est modifié), ou None hors dépôt git"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=RACINE, capture_output=True, text=True, check=True).stdout.strip()
+        modifie = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=RACINE, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("+" if modifie else "")
+
+
+def chronometrer(fonction, repetitions):
+    meilleur = float("inf")
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fonction()
+        meilleur = min(meilleur, time.perf_counter() - debut)
+    return meilleur
+
+
+def mesures(chemin):
+    """(nom, fonction sans argument) pour un export donné ; le parsing de préparation n'est pas mesuré"""
+    from calculateur.pdf import pdf_releve
+
+    contenu = chemin.read_text(encoding="utf-8")
+    releve = charger_releve(chemin)
+    ecole = [nom for nom, (debut, fin) in releve.index.items() if fin > debut][:PROFS_PAR_ECOLE]
+    totaux = [releve.totaux[nom] or 1.0 for nom in releve.noms]
+    entrees = [date(2000, 1, 1) + timedelta(days=97 * i % 9000) for i in range(len(totaux))]
+
+    # Premier appel hors mesure : imports de pandas, NumPy et reportlab
+    releve.dataframe(ecole[0])
+    pdf_releve(ecole[0], releve.totaux[ecole[0]], releve.jours_prof(ecole[0])).close()
+    simuler_lot(totaux[:1], entrees[:1], AUJOURD_HUI)
+
+    def dataframes():
+        for nom in ecole:
+            releve.dataframe(nom)
+
+    def pdfs():
+        for nom in ecole:
+            pdf_releve(nom, releve.totaux[nom], releve.jours_prof(nom)).close()
+
+    def simulations():
+        for heures, entree in zip(totaux, entrees):
+            simuler_salaire(heures, entree, AUJOURD_HUI)
+
+    return [
+        ("parse_fichier_multi_profs", lambda: parse_fichier_multi_profs(contenu)),
+        ("charger_releve", lambda: charger_releve(chemin)),
+        ("dataframe_jour", dataframes),
+        ("pdf_releve", pdfs),
+        ("simuler_salaire", simulations),
+        ("simuler_lot", lambda: simuler_lot(totaux, entrees, AUJOURD_HUI)),
+        ("simuler_mensuel", lambda: simuler_mensuel(releve.mensuel, dict(zip(releve.noms, entrees)))),
+    ]
+
+
+def comparer(resultats, reference):
+    """Affiche le rapport nouveau / ancien pour chaque mesure présente des deux côtés"""
+    anciens = {(m["echelle"], m["mesure"]): m["secondes"] for m in reference["mesures"]}
+    print(f"\nComparaison avec {reference.get('version')} (< 1 : plus rapide)")
+    for m in resultats["mesures"]:
+        ancien = anciens.get((m["echelle"], m["mesure"]))
+        if ancien:
+            print(f"{'x' + str(m['echelle']):>7} {m['mesure']:<27} {m['secondes'] / ancien:>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--echelles", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--sortie", type=Path, help="fichier JSON (par défaut eclat-benchmarks/<version>.json du dossier temporaire)")
+    parser.add_argument("--comparer", type=Path, help="résultats JSON d'une version précédente")
+    args = parser.parse_args()
+
+    resultats = {
+        "version": version(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "plateforme": platform.platform(),
+        "repetitions": args.repetitions,
+        "graine": args.graine,
+        "mesures": [],
+    }
+    with tempfile.TemporaryDirectory() as dossier:
+        for echelle in args.echelles:
+            chemin = Path(dossier) / f"heures_x{echelle}.txt"
+            lignes = generer(chemin, echelle, args.graine)
+            print(f"x{echelle} : {lignes} lignes, {chemin.stat().st_size / 2**20:.1f} Mo")
+            for nom, fonction in mesures(chemin):
+                secondes = chronometrer(fonction, args.repetitions)
+                resultats["mesures"].append({"echelle": echelle, "lignes": lignes, "mesure": nom, "secondes": secondes})
+                print(f"    {nom:<27} {secondes:>9.4f} s")
+            chemin.unlink()
+
+    sortie = args.sortie or Path(tempfile.gettempdir()) / "eclat-benchmarks" / f"{resultats['version'] or 'inconnue'}.json"
+    sortie.parent.mkdir(parents=True, exist_ok=True)
+    sortie.write_text(json.dumps(resultats, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"Résultats écrits dans {sortie}")
+    if args.comparer:
+        comparer(resultats, json.loads(args.comparer.read_text(encoding="utf-8")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+"""
+Outils de calcul du simulateur de paie ECLAT - Musiques Tangentes.
+
+Aucun module n'importe Streamlit : l'application n'est qu'une interface
+au-dessus de ces fonctions, réutilisables en ligne de commande ou en benchmark.
+pandas, NumPy et reportlab ne sont chargés que par les fonctions qui en ont besoin.
+
+- heures : lecture en flux de l'export des heures (heures_2526.txt)
+- stockage : heures de tou·te·s les profs en colonnes (ReleveHeures)
+- binaire : copie binaire projetée en mémoire du relevé parsé, pour les démarrages à chaud
+- incremental : rechargement de l'export qui ne parse que les lignes ajoutées
+- parallele : parsing des très gros exports en morceaux, dans un pool de processus
+- saisons : exports disponibles par saison et par site, cache LRU des relevés chargés
+- recherche : index des noms (sans accents, préfixes, fautes de frappe, trigrammes) pour retrouver un·e prof
+- taux : barèmes datés (valeurs du point, taux de cotisations), recherche par date
+- paie : ancienneté, primes, salaire brut et net, simulation vectorisée, paie mois par mois
+- fiche_paie : fiche de paie annotée (SVG) remplie par le simulateur
+- pdf : relevé d'heures et récapitulatif de simulation (reportlab)
+- images : logo redimensionné une fois par largeur, servi depuis la mémoire
+- chrono : chronométrage des étapes (ECLAT_CHRONO=1), journal JSON lines et percentiles par page
+- export_releves : archive ZIP de tous les relevés
+- liens : références Légifrance de la convention collective ECLAT
+"""
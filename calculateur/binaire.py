@@ -0,0 +1,129 @@
+"""
+Copie binaire d'un ReleveHeures, écrite à côté de l'export (heures_2526.releve).
+
+Un nouveau processus (redémarrage, worker ajouté derrière le répartiteur) relit
+cette copie au lieu de parser le texte : les colonnes sont projetées en mémoire
+(mmap) sans copie, seuls les noms et les totaux passent par JSON.
+La copie porte le hash SHA-256 de l'export : dès que l'export change, elle est
+ignorée puis réécrite après le parsing.
+
+Format : MAGIE, longueur de l'en-tête (uint32), en-tête JSON, puis les colonnes
+brutes alignées sur 8 octets, dans l'ordre de COLONNES.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from pathlib import Path
+
+from calculateur.heures import EcartMois
+from calculateur.stockage import ReleveHeures
+
+MAGIE = b"ECLATRH3"  # 3 : un nom répété ne garde que les écarts et le "Total Période" de son dernier bloc
+EXTENSION = ".releve"
+
+# (attribut, objet qui le porte, code array)
+COLONNES = (
+    ("jours", False, "i"),
+    ("minutes", False, "H"),
+    ("cles", True, "i"),
+    ("minutes", True, "i"),
+    ("declares", True, "d"),
+)
+
+
+def chemin_binaire(source) -> Path:
+    """heures_2526.txt -> heures_2526.releve"""
+    return Path(source).with_suffix(EXTENSION)
+
+
+def _colonnes(releve):
+    for attribut, mensuel, code in COLONNES:
+        yield getattr(releve.mensuel if mensuel else releve, attribut), code
+
+
+def ecrire_releve(releve: ReleveHeures, destination):
+    """
+    Écrit la copie binaire de `releve` (empreinte obligatoire).
+    Écriture dans un fichier temporaire puis os.replace : un autre processus
+    ne lit jamais une copie à moitié écrite.
+    """
+    if releve.empreinte is None:
+        raise ValueError("Relevé sans empreinte : la copie binaire ne pourrait pas être validée")
+    entete = {
+        "empreinte": releve.empreinte,
+        "ordre": sys.byteorder,
+        "tailles": [colonne.itemsize for colonne, _ in _colonnes(releve)],
+        "longueurs": [len(colonne) for colonne, _ in _colonnes(releve)],
+        "noms": releve.noms,
+        "index": [releve.index[nom] for nom in releve.noms],
+        "index_mensuel": [releve.mensuel.index[nom] for nom in releve.noms],
+        "totaux": [releve.totaux[nom] for nom in releve.noms],
+        "totaux_periode": releve.totaux_periode,
+        "ecarts": releve.mensuel.ecarts,
+    }
+    texte = json.dumps(entete, ensure_ascii=False).encode("utf-8")
+    destination = Path(destination)
+    descripteur, temporaire = tempfile.mkstemp(dir=destination.parent, prefix=destination.name, suffix=".tmp")
+    try:
+        with os.fdopen(descripteur, "wb") as f:
+            f.write(MAGIE + struct.pack("<I", len(texte)) + texte)
+            for colonne, _ in _colonnes(releve):
+                f.write(b"\0" * (-f.tell() % 8))
+                f.write(colonne)
+        os.chmod(temporaire, 0o644)  # mkstemp crée en 0600 : les autres workers doivent pouvoir lire
+        os.replace(temporaire, destination)
+    except BaseException:
+        os.unlink(temporaire)
+        raise
+
+
+def ouvrir_releve(chemin, empreinte):
+    """
+    ReleveHeures dont les colonnes sont des memoryview sur le fichier projeté,
+    ou None si la copie est absente, illisible ou d'une autre version de l'export.
+    """
+    try:
+        with open(chemin, "rb") as f:
+            projection = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    try:
+        return _lire(projection, empreinte)
+    except (struct.error, ValueError, KeyError, TypeError):
+        return None
+
+
+def _lire(projection, empreinte):
+    if projection[:len(MAGIE)] != MAGIE:
+        return None
+    (longueur,) = struct.unpack_from("<I", projection, len(MAGIE))
+    debut = len(MAGIE) + 4
+    entete = json.loads(projection[debut:debut + longueur])
+    if entete["empreinte"] != empreinte or entete["ordre"] != sys.byteorder:
+        return None
+
+    releve = ReleveHeures(empreinte)
+    vue = memoryview(projection)
+    position = debut + longueur
+    for (attribut, mensuel, code), taille, nombre in zip(COLONNES, entete["tailles"], entete["longueurs"]):
+        position += -position % 8
+        colonne = vue[position:position + taille * nombre]
+        if len(colonne) != taille * nombre or struct.calcsize(code) != taille:
+            return None
+        setattr(releve.mensuel if mensuel else releve, attribut, colonne.cast(code))
+        position += taille * nombre
+
+    releve.noms = entete["noms"]
+    cles = releve.mensuel.cles
+    for nom, bornes, bornes_mensuel, total in zip(releve.noms, entete["index"], entete["index_mensuel"], entete["totaux"]):
+        releve.index[nom] = tuple(bornes)
+        releve.mensuel.index[nom] = tuple(bornes_mensuel)
+        releve.totaux[nom] = total
+        for i in range(*bornes_mensuel):
+            releve.mensuel.positions[nom, cles[i]] = i
+    releve.totaux_periode = entete["totaux_periode"]
+    releve.mensuel.ecarts = [EcartMois(*ecart) for ecart in entete["ecarts"]]
+    return releve
@@ -0,0 +1,151 @@
+"""
+Chronométrage léger des étapes d'une page (lecture, parsing, DataFrame, PDF…).
+
+Activé par la variable d'environnement ECLAT_CHRONO=1, lue au démarrage.
+Désactivé, mesure() rend un objet inerte partagé : le coût se limite à un appel
+de fonction et un test.
+
+Une Trace regroupe les mesures d'une exécution de page : commencer() l'attache
+au thread courant (Streamlit exécute chaque session dans son thread), terminer()
+la range dans les statistiques par page (p50 / p95) et l'ajoute au journal
+JSON lines (ECLAT_CHRONO_LOG, par défaut chrono.jsonl dans le dossier temporaire).
+Une mesure prise hors trace (PDF généré au clic, hors exécution de la page)
+forme sa propre trace, sous la page « (étape) ».
+"""
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+ACTIF = os.environ.get("ECLAT_CHRONO", "") not in ("", "0")
+JOURNAL = Path(os.environ.get("ECLAT_CHRONO_LOG") or Path(tempfile.gettempdir()) / "chrono.jsonl")
+
+# Durées conservées par page pour les percentiles
+HISTORIQUE = 1000
+
+_local = threading.local()
+_verrou = threading.Lock()
+_durees = defaultdict(lambda: deque(maxlen=HISTORIQUE))
+
+
+class _Inerte:
+    """Mesure qui ne fait rien (chronométrage désactivé)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def noter(self, **details):
+        pass
+
+
+_INERTE = _Inerte()
+
+
+class Mesure:
+    """Durée d'une étape ; noter() ajoute des détails (octets, lignes…)"""
+
+    __slots__ = ("nom", "debut", "duree", "details")
+
+    def __init__(self, nom):
+        self.nom = nom
+        self.details = {}
+
+    def __enter__(self):
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.duree = time.perf_counter() - self.debut
+        trace = getattr(_local, "trace", None)
+        if trace is not None:
+            trace.mesures.append(self)
+        else:
+            isolee = Trace(f"({self.nom})")
+            isolee.debut = self.debut
+            isolee.mesures.append(self)
+            terminer(isolee)
+        return False
+
+    def noter(self, **details):
+        self.details.update(details)
+
+
+class Trace:
+    """Mesures d'une exécution de page"""
+
+    def __init__(self, page=None, session=None):
+        self.page = page
+        self.session = session
+        self.mesures = []
+        self.debut = time.perf_counter()
+        self.duree = None
+
+    def par_etape(self):
+        """{ étape: (nombre, secondes cumulées) }, dans l'ordre de première apparition"""
+        cumul = {}
+        for mesure in self.mesures:
+            nombre, secondes = cumul.get(mesure.nom, (0, 0.0))
+            cumul[mesure.nom] = (nombre + 1, secondes + mesure.duree)
+        return cumul
+
+
+def mesure(nom):
+    """with mesure("parsing"): ... ; inerte si le chronométrage est désactivé"""
+    if not ACTIF:
+        return _INERTE
+    return Mesure(nom)
+
+
+def commencer(page=None, session=None):
+    """Démarre la trace du thread courant ; None si le chronométrage est désactivé"""
+    if not ACTIF:
+        return None
+    _local.trace = Trace(page, session)
+    return _local.trace
+
+
+def terminer(trace, **contexte):
+    """Clôt la trace : statistiques de la page et une ligne dans le journal"""
+    if trace is None:
+        return
+    trace.duree = time.perf_counter() - trace.debut
+    _local.trace = None
+    ligne = {
+        "horodatage": time.time(),
+        "page": trace.page,
+        "session": trace.session,
+        "total_ms": round(trace.duree * 1000, 3),
+        **contexte,
+        "mesures": [
+            {"nom": m.nom, "ms": round(m.duree * 1000, 3), **m.details} for m in trace.mesures
+        ],
+    }
+    with _verrou:
+        _durees[trace.page].append(trace.duree)
+        try:
+            with open(JOURNAL, "a", encoding="utf-8") as f:
+                f.write(json.dumps(ligne, ensure_ascii=False) + "\n")
+        except OSError:
+            pass  # journal non inscriptible : les statistiques restent en mémoire
+
+
+def percentile(valeurs, p):
+    """Percentile au rang le plus proche ; valeurs triées"""
+    if not valeurs:
+        return None
+    rang = max(0, math.ceil(p / 100 * len(valeurs)) - 1)
+    return valeurs[rang]
+
+
+def statistiques():
+    """{ page: (exécutions, p50 en s, p95 en s) } sur les HISTORIQUE dernières exécutions"""
+    with _verrou:
+        copies = {page: sorted(durees) for page, durees in _durees.items()}
+    return {page: (len(d), percentile(d, 50), percentile(d, 95)) for page, d in copies.items()}
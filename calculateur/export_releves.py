@@ -0,0 +1,97 @@
+"""
+Export de tous les relevés d'heures d'un fichier dans une archive ZIP.
+
+Les PDF sont générés en parallèle (un processus par cœur) et écrits dans
+l'archive au fil de l'eau : un seul PDF à la fois est gardé en mémoire.
+L'archive est écrite sous un nom temporaire puis renommée : une archive
+interrompue n'est jamais servie sous le nom final.
+
+    python -m calculateur.export_releves heures_2526.txt releves_2526.zip [--processus N]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from calculateur.parallele import processus_disponibles
+from calculateur.stockage import charger_releve
+
+
+def nom_fichier_releve(nom):
+    return f"heures_{nom.replace(' ','_')}.pdf"
+
+
+def _rendre(tache):
+    """Exécuté dans un processus de travail : (nom, pdf, secondes)"""
+    from calculateur.pdf import pdf_releve
+
+    nom, total, jours = tache
+    debut = time.perf_counter()
+    with pdf_releve(nom, total, jours) as fichier:
+        pdf = fichier.read()
+    return nom, pdf, time.perf_counter() - debut
+
+
+def exporter_releves(releve, destination, processus=None):
+    """
+    Écrit le PDF de chaque prof de `releve` dans l'archive `destination`
+    (chemin ou fichier binaire ouvert en écriture).
+    Rend (nom, secondes de rendu) au fur et à mesure, dans l'ordre du fichier.
+    """
+    if not hasattr(destination, "write"):
+        destination = Path(destination)
+        descripteur, temporaire = tempfile.mkstemp(dir=destination.parent, prefix=destination.name, suffix=".tmp")
+        try:
+            with os.fdopen(descripteur, "wb") as f:
+                yield from exporter_releves(releve, f, processus)
+            os.chmod(temporaire, 0o644)  # mkstemp crée en 0600
+            os.replace(temporaire, destination)
+        except BaseException:
+            os.unlink(temporaire)
+            raise
+        return
+
+    processus = processus or processus_disponibles()
+    en_cours = deque()
+    contexte = multiprocessing.get_context("spawn")  # pas de fork d'un serveur multi-thread
+    with ProcessPoolExecutor(max_workers=processus, mp_context=contexte) as pool, \
+            zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+
+        def ecrire_premier():
+            nom, pdf, secondes = en_cours.popleft().result()
+            archive.writestr(nom_fichier_releve(nom), pdf)
+            return nom, secondes
+
+        for nom in releve.noms:
+            en_cours.append(pool.submit(_rendre, (nom, releve.totaux[nom], releve.jours_prof(nom))))
+            # Au plus deux PDF en attente par processus
+            if len(en_cours) >= 2 * processus:
+                yield ecrire_premier()
+        while en_cours:
+            yield ecrire_premier()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Génère le relevé PDF de chaque prof dans une archive ZIP."
+    )
+    parser.add_argument("source", type=Path, help="export des heures (ex. heures_2526.txt)")
+    parser.add_argument("archive", type=Path, help="archive ZIP à créer")
+    parser.add_argument("--processus", type=int, default=None, help="nombre de processus de rendu (défaut : un par cœur)")
+    args = parser.parse_args(argv)
+
+    debut = time.perf_counter()
+    releve = charger_releve(args.source)
+    for nom, secondes in exporter_releves(releve, args.archive, args.processus):
+        print(f"{secondes * 1000:8.1f} ms  {nom}")
+    print(f"{len(releve)} relevés -> {args.archive} en {time.perf_counter() - debut:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
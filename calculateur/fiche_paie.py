@@ -0,0 +1,219 @@
+"""
+Fiche de paie annotée (page « Lire sa fiche de paie »), remplie avec les
+résultats de simuler_salaire().
+
+Le SVG est un gabarit string.Template (gabarits/fiche_paie.svg) lu une fois
+par processus. Le rendu est mémorisé par (heures annuelles, date d'entrée,
+date du jour) puis minifié : une même fiche n'est calculée qu'une fois.
+
+Les infobulles (attributs data-infobulle du gabarit) sont découpées en lignes
+ici, avec les largeurs de caractères d'Helvetica : le navigateur n'a plus qu'à
+afficher un groupe <g> déjà prêt, sans mesurer de texte au survol. Les
+infobulles sont donc affichées en Helvetica ou dans une police aux mêmes
+largeurs (Arial, Liberation Sans, Arimo), pas dans le sans-serif par défaut.
+"""
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from xml.sax.saxutils import escape
+
+from calculateur import chrono
+from calculateur.paie import detail_cotisations_salariales, simuler_salaire
+from calculateur.taux import bareme_au
+
+GABARIT = Path(__file__).parent / "gabarits" / "fiche_paie.svg"
+
+# Exemple affiché par défaut : 147,4 h annuelles (19,70 h ETP par mois), 10 ans d'ancienneté
+HEURES_EXEMPLE = 147.4
+
+# Largeurs Helvetica (métriques AFM, en millièmes d'em), regroupées par largeur
+LARGEURS_HELVETICA = {
+    191: "'",
+    222: "ijl’‘",
+    260: "|",
+    278: " !,./:;I[\\]ftîïÎÏ·",
+    333: "()-`r“”",
+    334: "{}",
+    355: '"',
+    389: "*",
+    400: "°",
+    469: "^",
+    500: "Jcksvxyzçÿ",
+    556: "#$0123456789?L_abdeghnopquàâäéèêëôöùûü«»–€",
+    584: "+<=>~×−≈",
+    611: "FTZ",
+    667: "&ABEKPSVXYÀÂÄÉÈÊËŸ",
+    722: "CDHNRUwÇÙÛÜ",
+    778: "GOQÔÖ",
+    833: "Mm",
+    889: "%æ",
+    944: "Wœ",
+    1000: "ŒÆ—…",
+    1015: "@",
+}
+LARGEUR_CARACTERE = {c: largeur for largeur, caracteres in LARGEURS_HELVETICA.items() for c in caracteres}
+LARGEUR_PAR_DEFAUT = 556
+
+# Infobulles : mêmes dimensions que l'ancien découpage fait dans le navigateur
+TAILLE_POLICE = 13
+LARGEUR_MAX = 250
+INTERLIGNE = 16
+MARGE = 10
+
+RE_INFOBULLE = re.compile(r'data-infobulle="([^"]*)"')
+RE_COMMENTAIRE = re.compile(r"<!--.*?-->", re.S)
+RE_BLANCS = re.compile(r"\s+")
+RE_ENTRE_BALISES = re.compile(r">\s+<")
+RE_TEXTE_VIDE = re.compile(r"<text(?![^>]*\bid=)[^>]*></text>")  # cellules vides, pas l'infobulle
+
+
+def nombre_fr(valeur, decimales=2):
+    """1234.5 -> '1234,50'"""
+    return f"{valeur:.{decimales}f}".replace(".", ",")
+
+
+def pourcentage_fr(taux):
+    """0.0855 -> '8,55' ; 0.07 -> '7'"""
+    return f"{taux * 100:.4f}".rstrip("0").rstrip(".").replace(".", ",")
+
+
+def valeurs_fiche(simulation, date_entree, bareme):
+    """Champs du gabarit, en texte, pour une Simulation calculée au barème `bareme`"""
+    s, b = simulation, bareme
+    abattu = s.total_brut_abattu
+    salariales = detail_cotisations_salariales(abattu, s.salaire_brut_total, b)
+    patronales = {
+        "maladie": abattu * b.taux_patronal_maladie,
+        "plafonnee": abattu * b.taux_patronal_retraite_plafonnee,
+        "deplafonnee": abattu * b.taux_patronal_retraite_deplafonnee,
+        "famille": abattu * b.taux_patronal_famille,
+    }
+    points_anciennete = s.anciennete * 2
+    points_differentielle = max(0, b.coefficient_differentiel - points_anciennete)
+    valeurs = {
+        "date_entree": date_entree.strftime("%d/%m/%Y"),
+        "annee_bareme": b.debut.year,
+        "anciennete": s.anciennete,
+        "heures_etp": nombre_fr(s.heures_mensuelles_etp),
+        "taux_base": nombre_fr(s.salaire_base / s.heures_mensuelles_etp, 4),
+        "salaire_base": nombre_fr(s.salaire_base),
+        "points_anciennete": points_anciennete,
+        "points_differentielle": nombre_fr(points_differentielle),
+        "taux_primes": nombre_fr(b.valeur_point_v1 * s.heures_hebdo / 24, 4),
+        "prime_anciennete": nombre_fr(s.prime_anciennete),
+        "prime_differentielle": nombre_fr(s.prime_diff),
+        "brut": nombre_fr(s.salaire_brut_total),
+        "brut_abattu": nombre_fr(abattu),
+        "assiette_csg": nombre_fr(s.salaire_brut_total * b.assiette_csg),
+        "total_salarial": nombre_fr(s.cotisations_sal),
+        "total_patronal": nombre_fr(sum(patronales.values())),
+        "net": nombre_fr(s.salaire_net),
+        "taux_plafonnee": nombre_fr(b.taux_retraite_plafonnee * 100, 4),
+        "taux_deplafonnee": nombre_fr(b.taux_retraite_deplafonnee * 100, 4),
+        "taux_complementaire": nombre_fr(b.taux_complementaire_t1 * 100, 4),
+        "taux_csg_deductible": nombre_fr(b.taux_csg_deductible * 100, 4),
+        "taux_csg_non_deductible": nombre_fr(b.taux_csg_non_deductible * 100, 4),
+        "pct_plafonnee": pourcentage_fr(b.taux_retraite_plafonnee),
+        "pct_deplafonnee": pourcentage_fr(b.taux_retraite_deplafonnee),
+        "pct_pat_maladie": pourcentage_fr(b.taux_patronal_maladie),
+        "pct_pat_plafonnee": pourcentage_fr(b.taux_patronal_retraite_plafonnee),
+        "pct_pat_deplafonnee": pourcentage_fr(b.taux_patronal_retraite_deplafonnee),
+        "pct_pat_famille": pourcentage_fr(b.taux_patronal_famille),
+    }
+    valeurs.update({f"sal_{nom}": nombre_fr(montant) for nom, montant in salariales.items()})
+    valeurs.update({f"pat_{nom}": nombre_fr(montant) for nom, montant in patronales.items()})
+    return valeurs
+
+
+def largeur_texte(texte, taille=TAILLE_POLICE):
+    """Largeur en pixels de `texte` en Helvetica ; lettres inconnues : celle de leur lettre de base"""
+    total = 0
+    for c in texte:
+        largeur = LARGEUR_CARACTERE.get(c)
+        if largeur is None:
+            largeur = LARGEUR_CARACTERE.get(unicodedata.normalize("NFD", c)[0], LARGEUR_PAR_DEFAUT)
+        total += largeur
+    return total * taille / 1000
+
+
+def couper_lignes(texte, largeur_max=LARGEUR_MAX):
+    """Découpe mot à mot : on passe à la ligne dès que la ligne (espace final compris) dépasse largeur_max"""
+    lignes, ligne = [], ""
+    for mot in texte.split(" "):
+        essai = ligne + mot + " "
+        if largeur_texte(essai) > largeur_max and ligne:
+            lignes.append(ligne.strip())
+            ligne = mot + " "
+        else:
+            ligne = essai
+    if ligne:
+        lignes.append(ligne.strip())
+    return lignes
+
+
+def infobulles(markup):
+    """
+    Remplace chaque data-infobulle="texte" par data-ib="ibN" et rend les groupes
+    <g id="ibN"> correspondants, un par texte distinct, masqués par défaut.
+    data-l et data-h donnent la taille du fond pour le placement au survol.
+    """
+    ids = {}
+
+    def numeroter(trouve):
+        texte = trouve.group(1)
+        if texte not in ids:
+            ids[texte] = f"ib{len(ids)}"
+        return f'data-ib="{ids[texte]}"'
+
+    markup = RE_INFOBULLE.sub(numeroter, markup)
+    groupes = []
+    for texte, identifiant in ids.items():
+        lignes = couper_lignes(texte)
+        largeur = round(min(max(map(largeur_texte, lignes)), LARGEUR_MAX) + 2 * MARGE)
+        hauteur = (len(lignes) - 1) * INTERLIGNE + TAILLE_POLICE + 2 + MARGE
+        tspans = "".join(
+            f'<tspan x="{MARGE}" y="{15 + i * INTERLIGNE}">{escape(ligne)}</tspan>' for i, ligne in enumerate(lignes)
+        )
+        groupes.append(
+            f'<g id="{identifiant}" class="infobulle" visibility="hidden" data-l="{largeur}" data-h="{hauteur}">'
+            f'<rect class="tooltip-box" width="{largeur}" height="{hauteur}"/>'
+            f'<text class="tooltip-text">{tspans}</text></g>'
+        )
+    return Template(markup).safe_substitute(infobulles="".join(groupes))
+
+
+def minifier(markup):
+    """
+    Retire commentaires, blancs superflus et cellules <text> vides (sans id).
+    Le script garde une instruction par ligne (sans les lignes de commentaire).
+    """
+    avant, balise, reste = markup.partition("<script>")
+    script, fin, apres = reste.partition("</script>")
+
+    def balises(texte):
+        texte = RE_BLANCS.sub(" ", RE_COMMENTAIRE.sub("", texte))
+        return RE_TEXTE_VIDE.sub("", RE_ENTRE_BALISES.sub("><", texte)).strip()
+
+    lignes = (ligne.strip() for ligne in script.splitlines())
+    script = "\n".join(ligne for ligne in lignes if ligne and not ligne.startswith("//"))
+    return balises(avant) + balise + script + fin + balises(apres)
+
+
+@lru_cache(maxsize=1)
+def _gabarit():
+    return Template(GABARIT.read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=256)
+def fiche_paie_svg(heures_annuelles, date_entree, aujourd_hui=None):
+    """SVG minifié de la fiche de paie d'un mois pour ces heures annuelles et cette date d'entrée"""
+    with chrono.mesure("fiche de paie (SVG)") as m:
+        simulation = simuler_salaire(heures_annuelles, date_entree, aujourd_hui)
+        valeurs = valeurs_fiche(simulation, date_entree, bareme_au(aujourd_hui))
+        # ${infobulles} est rempli par infobulles(), une fois les textes des infobulles connus
+        markup = _gabarit().substitute(valeurs, infobulles="${infobulles}")
+        markup = minifier(infobulles(markup))
+        m.noter(octets=len(markup))
+    return markup
@@ -0,0 +1,309 @@
+"""
+Lecture des relevés d'heures exportés par la paie (format heures_2526.txt) :
+
+    Prénom NOM
+    16-09-2025 total jour : 03:30
+    Total Mois : 11 heures
+    ...
+    Total Mois : 18 h; Total Période : 142,5 h;
+
+Le fichier est lu ligne par ligne et chaque prof est rendu dès que son bloc est
+terminé : la mémoire ne dépend pas de la taille de l'export.
+"""
+import hashlib
+import re
+from array import array
+from datetime import date
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+RE_JOUR = re.compile(r"(\d{2}-\d{2}-\d{4})\s+total jour\s*:\s*(\d{2}:\d{2})")
+RE_DATE = re.compile(r"\d{2}-\d{2}-\d{4}")
+RE_TOTAL_MOIS = re.compile(r"Total Mois\s*:\s*([\d,\.]+)")
+RE_TOTAL_PERIODE = re.compile(r"Total Période\s*:\s*([\d,\.]+)")
+RE_ENTETE = re.compile(r"pr[ée]nom\s+nom$", re.IGNORECASE)
+
+NAN = float("nan")
+
+# Quelques centaines de dates distinctes par saison, partagées par tou·te·s les profs
+_JOURS = {}
+_DATES_FR = {}
+# "03:30" -> 210 et 210 -> 3.5 ; quelques dizaines de durées distinctes dans un export
+_DUREES = {}
+_HEURES = {}
+
+
+class BlocProf(NamedTuple):
+    """Heures d'un·e prof : jours travaillés, totaux par mois, total calculé et total déclaré par la paie."""
+    nom: str
+    ordinaux: array       # date.toordinal() de chaque jour travaillé
+    minutes: array        # minutes travaillées ce jour-là
+    mois: array           # clés de mois (annee * 12 + mois - 1), dans l'ordre du fichier
+    minutes_mois: array   # minutes calculées pour chaque mois
+    declares_mois: array  # "Total Mois" déclaré en heures, NaN si absent
+    ecarts: list          # [EcartMois, ...] entre les jours et les "Total Mois"
+    total: float
+    total_periode: Optional[float] = None
+
+    @property
+    def jours(self):
+        """[(date "jj-mm-aaaa", heures décimales), ...]"""
+        return [(date_fr(o), minutes_en_heures(m)) for o, m in zip(self.ordinaux, self.minutes)]
+
+
+class EcartMois(NamedTuple):
+    """Ligne "Total Mois" qui ne correspond pas à la somme des jours qui la précèdent"""
+    nom: str
+    mois: int        # annee * 12 + mois - 1
+    calcule: float   # heures
+    declare: float   # heures
+
+
+# Les "Total Mois" sont arrondis au centième d'heure
+TOLERANCE_TOTAL_MOIS = 0.005 + 1e-9
+
+
+class _BlocEnCours:
+    """
+    Lignes d'un·e prof en cours de lecture.
+    Les jours sont ajoutés directement dans `ordinaux` / `minutes` ; les cumuls
+    par mois sont faits par tranches, à chaque changement de mois ou "Total Mois".
+    """
+
+    def __init__(self, nom):
+        self.nom = nom
+        self.ordinaux = array("i")
+        self.minutes = array("H")
+        self.total_periode = None
+        self.par_mois = {}        # { clé de mois: [minutes, "Total Mois" déclaré ou NaN] }
+        self.ecarts = []
+        self.mois_courant = None
+        self.debut_mois = 0       # premier jour du mois courant non encore cumulé
+        self.debut_total = 0      # premier jour après le dernier "Total Mois"
+
+    def copie(self):
+        copie = _BlocEnCours(self.nom)
+        copie.ordinaux = array("i", self.ordinaux)
+        copie.minutes = array("H", self.minutes)
+        copie.total_periode = self.total_periode
+        copie.par_mois = {mois: list(cumul) for mois, cumul in self.par_mois.items()}
+        copie.ecarts = list(self.ecarts)
+        copie.mois_courant = self.mois_courant
+        copie.debut_mois = self.debut_mois
+        copie.debut_total = self.debut_total
+        return copie
+
+    def _cumuler_mois(self):
+        fin = len(self.minutes)
+        if self.mois_courant is not None and fin > self.debut_mois:
+            cumul = self.par_mois.get(self.mois_courant)
+            if cumul is None:
+                cumul = self.par_mois[self.mois_courant] = [0, NAN]
+            cumul[0] += sum(self.minutes[self.debut_mois:fin])
+        self.debut_mois = fin
+
+    def changer_mois(self, mois):
+        """Appelé avant d'ajouter le premier jour d'un autre mois"""
+        self._cumuler_mois()
+        self.mois_courant = mois
+
+    def ajouter_total_mois(self, declare):
+        """Rapproche le total déclaré des jours lus depuis le "Total Mois" précédent"""
+        self._cumuler_mois()
+        if self.mois_courant is not None:
+            self.par_mois[self.mois_courant][1] = declare
+            calcule = sum(self.minutes[self.debut_total:]) / 60
+            if abs(calcule - declare) > TOLERANCE_TOTAL_MOIS:
+                self.ecarts.append(EcartMois(self.nom, self.mois_courant, calcule, declare))
+        self.debut_total = len(self.minutes)
+
+    @property
+    def vide(self):
+        """Aucun jour ni total : la ligne de nom n'était pas celle d'un·e prof"""
+        return not self.ordinaux and not self.par_mois and self.total_periode is None
+
+    def terminer(self):
+        self._cumuler_mois()
+        return BlocProf(
+            self.nom, array("i", self.ordinaux), array("H", self.minutes),
+            array("i", self.par_mois.keys()),
+            array("i", (cumul[0] for cumul in self.par_mois.values())),
+            array("d", (cumul[1] for cumul in self.par_mois.values())),
+            list(self.ecarts),
+            # Même somme, dans le même ordre, que l'ancien sum(h for _, h in heures)
+            sum(map(_HEURES.__getitem__, self.minutes)),
+            self.total_periode,
+        )
+
+
+def hhmm_to_decimal(hhmm):
+    """Convertit '03:30' en nombre décimal d’heures"""
+    hh, mm = hhmm.strip().split(":")
+    return int(hh) + int(mm)/60
+
+
+def duree_minutes(hhmm):
+    """Convertit '03:30' en 210"""
+    minutes = _DUREES.get(hhmm)
+    if minutes is None:
+        hh, mm = hhmm.split(":")
+        minutes = _DUREES[hhmm] = int(hh) * 60 + int(mm)
+        _HEURES[minutes] = hhmm_to_decimal(hhmm)
+    return minutes
+
+
+def minutes_en_heures(minutes):
+    """Convertit 210 en 3.5, avec le même arrondi que hhmm_to_decimal('03:30')"""
+    return minutes // 60 + (minutes % 60)/60
+
+
+def decimal_fr(texte):
+    """Convertit '12,5' ou '12.5' en float"""
+    return float(texte.replace(",", "."))
+
+
+def jour_et_mois(date_str):
+    """Convertit '16-09-2025' en (date.toordinal(), clé de mois 2025 * 12 + 8)"""
+    jour = _JOURS.get(date_str)
+    if jour is None:
+        jj, mm, aaaa = date_str.split("-")
+        jour = _JOURS[date_str] = (date(int(aaaa), int(mm), int(jj)).toordinal(), int(aaaa) * 12 + int(mm) - 1)
+    return jour
+
+
+def cle_mois(annee, mois):
+    return annee * 12 + mois - 1
+
+
+def date_fr(ordinal):
+    """Convertit date.toordinal() en '16-09-2025'"""
+    texte = _DATES_FR.get(ordinal)
+    if texte is None:
+        texte = _DATES_FR[ordinal] = date.fromordinal(ordinal).strftime("%d-%m-%Y")
+    return texte
+
+
+def empreinte_fichier(chemin):
+    """Hash SHA-256 du contenu du fichier, lu par blocs de 1 Mo"""
+    sha = hashlib.sha256()
+    with open(chemin, "rb") as f:
+        for bloc in iter(lambda: f.read(1 << 20), b""):
+            sha.update(bloc)
+    return sha.hexdigest()
+
+
+class ParseurHeures:
+    """
+    Parseur reprenable : lire() peut être appelé plusieurs fois sur des lignes
+    qui se suivent (par ex. ce qui a été ajouté au fichier depuis la dernière
+    lecture). Le bloc du·de la dernier·ère prof reste ouvert entre deux appels.
+    """
+
+    def __init__(self):
+        self.bloc = None
+
+    def copie(self):
+        """Copie indépendante de l'état, pour lire des lignes sans engager le parseur"""
+        copie = ParseurHeures()
+        copie.bloc = self.bloc.copie() if self.bloc is not None else None
+        return copie
+
+    def lire(self, lignes: Iterable[str]) -> Iterator[BlocProf]:
+        """
+        Classe chaque ligne une seule fois : jour, total (Mois / Période) ou nom,
+        et rend le BlocProf de chaque prof dont le bloc se termine.
+        Les jours qui précèdent le premier nom sont ignorés. L'en-tête « Prénom NOM »
+        (une fois par export fusionné) et les lignes de nom sans aucun jour ni total
+        (titres, sites) ne sont pas des profs et ne sont pas rendus.
+        """
+        bloc = self.bloc
+        if bloc is not None:
+            ajouter_ordinal = bloc.ordinaux.append
+            ajouter_minutes = bloc.minutes.append
+
+        for line in lignes:
+            line = line.strip()
+            if not line:
+                continue
+
+            match = RE_JOUR.match(line) if line[0].isdigit() else None
+            if match:
+                date_str, hhmm = match.groups()
+                minutes = _DUREES.get(hhmm)
+                if minutes is None:
+                    minutes = duree_minutes(hhmm)
+                jour = _JOURS.get(date_str) or jour_et_mois(date_str)
+                if bloc is not None:
+                    if jour[1] != bloc.mois_courant:
+                        bloc.changer_mois(jour[1])
+                    ajouter_ordinal(jour[0])
+                    ajouter_minutes(minutes)
+
+            elif RE_DATE.match(line):
+                # Ligne datée dans un autre format : ignorée
+                continue
+
+            elif line.startswith("Total"):
+                if bloc is None:
+                    continue
+                match_mois = RE_TOTAL_MOIS.match(line)
+                if match_mois:
+                    bloc.ajouter_total_mois(decimal_fr(match_mois.group(1)))
+                match_periode = RE_TOTAL_PERIODE.search(line)
+                if match_periode:
+                    bloc.total_periode = decimal_fr(match_periode.group(1))
+
+            else:
+                if bloc is not None and not bloc.vide:
+                    yield bloc.terminer()
+                if RE_ENTETE.match(line):
+                    bloc = self.bloc = None
+                    continue
+                bloc = self.bloc = _BlocEnCours(line)
+                ajouter_ordinal = bloc.ordinaux.append
+                ajouter_minutes = bloc.minutes.append
+
+    def terminer(self) -> Optional[BlocProf]:
+        """BlocProf du·de la dernier·ère prof lu·e ; le bloc reste ouvert pour la suite"""
+        return self.bloc.terminer() if self.bloc is not None and not self.bloc.vide else None
+
+
+def iter_blocs_profs(lignes: Iterable[str]) -> Iterator[BlocProf]:
+    """
+    Parcourt les lignes de l'export en une passe et rend un BlocProf par prof.
+    Les totaux par mois sont cumulés pendant la même passe.
+    """
+    parseur = ParseurHeures()
+    yield from parseur.lire(lignes)
+    dernier = parseur.terminer()
+    if dernier is not None:
+        yield dernier
+
+
+def lire_blocs_profs(chemin) -> Iterator[BlocProf]:
+    """Lit le fichier en flux et rend un BlocProf par prof."""
+    with open(chemin, "r", encoding="utf-8") as f:
+        yield from iter_blocs_profs(f)
+
+
+def regrouper(blocs: Iterable[BlocProf]):
+    """
+    Retourne :
+    heures_profs = { "Prénom NOM": [(date, heures), ...], ... }
+    total_annuels = { "Prénom NOM": total_annee, ... }
+    """
+    heures_profs = {}
+    total_annuels = {}
+    for bloc in blocs:
+        heures_profs[bloc.nom] = bloc.jours
+        total_annuels[bloc.nom] = bloc.total
+    return heures_profs, total_annuels
+
+
+def parse_fichier_multi_profs(fichier_txt):
+    """Parse le contenu texte complet de l'export, voir regrouper()."""
+    return regrouper(iter_blocs_profs(fichier_txt.splitlines()))
+
+
+def charger_fichier_heures(chemin):
+    """Parse l'export directement depuis le disque, voir regrouper()."""
+    return regrouper(lire_blocs_profs(chemin))
@@ -0,0 +1,80 @@
+"""
+Images livrées avec l'application, servies depuis la mémoire.
+
+Le fichier source est lu une seule fois par processus ; les variantes
+redimensionnées sont calculées à la première demande et mémorisées sous
+la clé (hash du contenu, largeur), en mémoire et dans le dossier temporaire
+pour que les processus suivants n'aient pas à redimensionner. st.image reçoit
+toujours les mêmes octets pour une même variante : Streamlit les sert sous la
+même URL /media et le navigateur les garde en cache. Aucun accès réseau.
+"""
+import hashlib
+import io
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+# Largeurs en pixels des variantes proposées
+LARGEURS_VARIANTES = (150, 300, 400, 600, 800, 1200)
+
+# Pixels physiques par pixel CSS visés (écrans haute densité)
+DENSITE = 2
+
+DOSSIER_VARIANTES = Path(tempfile.gettempdir()) / "eclat_images"
+
+# Logo affiché dans la barre latérale et sur la page d'accueil
+LOGO = Path(__file__).resolve().parent.parent / "logo_2025_celine_queguiner.png"
+
+
+@lru_cache(maxsize=None)
+def _source(chemin):
+    """(hash SHA-256, octets, largeur) du fichier, lu une fois"""
+    from PIL import Image
+
+    with open(chemin, "rb") as f:
+        donnees = f.read()
+    with Image.open(io.BytesIO(donnees)) as image:
+        largeur = image.width
+    return hashlib.sha256(donnees).hexdigest(), donnees, largeur
+
+
+@lru_cache(maxsize=32)
+def _variante(chemin, empreinte, largeur):
+    fichier = DOSSIER_VARIANTES / f"{empreinte[:16]}_{largeur}.png"
+    try:
+        return fichier.read_bytes()
+    except OSError:
+        pass
+
+    from PIL import Image
+
+    _, donnees, _ = _source(chemin)
+    with Image.open(io.BytesIO(donnees)) as image:
+        hauteur = round(image.height * largeur / image.width)
+        reduite = image.resize((largeur, hauteur), Image.LANCZOS, reducing_gap=3.0)
+    sortie = io.BytesIO()
+    reduite.save(sortie, format="PNG", optimize=True)
+    variante = sortie.getvalue()
+
+    try:
+        DOSSIER_VARIANTES.mkdir(exist_ok=True)
+        temporaire = fichier.with_suffix(f".{os.getpid()}.tmp")
+        temporaire.write_bytes(variante)
+        os.replace(temporaire, fichier)
+    except OSError:
+        pass  # pas de dossier temporaire inscriptible : la variante reste en mémoire
+    return variante
+
+
+def variante_image(chemin, largeur, densite=DENSITE) -> bytes:
+    """
+    PNG de l'image pour un affichage à `largeur` px CSS : la plus petite
+    variante d'au moins largeur × densite px, ou l'original s'il est plus petit.
+    """
+    empreinte, donnees, largeur_source = _source(str(chemin))
+    cible = largeur * densite
+    choix = next((l for l in LARGEURS_VARIANTES if l >= cible), largeur_source)
+    if choix >= largeur_source:
+        return donnees
+    return _variante(str(chemin), empreinte, choix)
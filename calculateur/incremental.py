@@ -0,0 +1,197 @@
+"""
+Chargement incrémental de l'export des heures.
+
+La paie ajoute chaque semaine des lignes à la fin du fichier de la saison.
+ChargeurIncremental garde un point de reprise (position en octets, bloc du·de la
+dernier·ère prof encore ouvert, hash SHA-256 en cours) et, quand le fichier
+grandit, ne parse que la fin ajoutée. Le coût d'un rechargement suit la taille
+de l'ajout, pas celle de la saison.
+
+Si le fichier a été réécrit plutôt que complété (autre inode, taille plus
+petite, début ou dernières lignes lues modifiés), tout est relu. La vérification
+porte sur des échantillons (début du fichier et 64 Ko avant le point de reprise) :
+une réécriture qui ne toucherait que le milieu d'un fichier de même préfixe
+et de même fin ne serait pas détectée.
+
+Au premier chargement, la copie binaire de l'export (voir binaire.py) est
+relue si elle correspond encore au fichier ; après chaque parsing, elle est
+réécrite pour le prochain processus.
+
+Un gros fichier lu en entier (export consolidé de plusieurs sites) est parsé
+en parallèle, voir parallele.py ; le point de reprise est le même qu'après une
+lecture séquentielle.
+"""
+import codecs
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+from calculateur import chrono
+from calculateur.binaire import chemin_binaire, ecrire_releve, ouvrir_releve
+from calculateur.heures import ParseurHeures, empreinte_fichier
+from calculateur.parallele import SEUIL_PARALLELE, parser_en_parallele, processus_disponibles
+from calculateur.stockage import ReleveHeures
+
+TAILLE_LECTURE = 8 << 20
+TAILLE_ECHANTILLON = 64 << 10
+
+
+class ChargeurIncremental:
+    """
+    Relevé d'un fichier, tenu à jour par charger().
+    Sûr entre sessions : un seul rechargement à la fois, et chaque ReleveHeures
+    publié n'est plus jamais modifié.
+    """
+
+    def __init__(self, chemin, binaire=True, processus=None):
+        self.chemin = Path(chemin)
+        self.binaire = chemin_binaire(chemin) if binaire else None
+        self.processus = processus     # pour le parsing parallèle ; None : tous les cœurs
+        self._verrou = threading.Lock()
+        self._repartir_de_zero()
+
+    def _repartir_de_zero(self):
+        self.releve = None
+        self.signature = None          # (taille, mtime) lors du dernier charger()
+        self.identite = None           # (st_dev, st_ino)
+        self.position = 0              # fin de la dernière ligne complète lue
+        self.sha = hashlib.sha256()    # hash des octets [0, position)
+        self.echantillons = None       # (hash du début, hash des octets avant position)
+        self.base = ReleveHeures()     # profs dont le bloc est terminé
+        self.parseur = ParseurHeures() # bloc du·de la dernier·ère prof, encore ouvert
+        self.lignes_lues = 0           # statistique : lignes parsées depuis la création
+
+    def charger(self, progression=None) -> ReleveHeures:
+        """
+        Relevé à jour : rien à faire si le fichier n'a pas changé, la fin seulement s'il a grandi.
+        `progression` (parallele.Progression) suit les octets parsés.
+        """
+        with self._verrou:
+            stat = os.stat(self.chemin)
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if self.releve is not None and signature == self.signature:
+                return self.releve
+            if self.identite is None and self._ouvrir_binaire():
+                # Relevé repris d'un autre processus, sans point de reprise : au prochain
+                # changement, on retente la copie binaire avant de tout relire.
+                self.signature = signature
+                return self.releve
+            if not self._est_un_ajout(stat):
+                self._repartir_de_zero()
+            self._lire_la_suite(stat, progression)
+            self.signature = signature
+            self._ecrire_binaire()
+            return self.releve
+
+    @property
+    def nbytes(self):
+        """Colonnes du relevé publié et du point de reprise"""
+        return self.base.nbytes + (self.releve.nbytes if self.releve is not None else 0)
+
+    def _ouvrir_binaire(self):
+        if self.binaire is None:
+            return False
+        with chrono.mesure("hash export"):
+            empreinte = empreinte_fichier(self.chemin)
+        with chrono.mesure("copie binaire"):
+            releve = ouvrir_releve(self.binaire, empreinte)
+        if releve is None:
+            return False
+        self.releve = releve
+        return True
+
+    def _ecrire_binaire(self):
+        if self.binaire is None:
+            return
+        try:
+            ecrire_releve(self.releve, self.binaire)
+        except OSError:
+            pass  # dossier en lecture seule : on reparsera au prochain démarrage
+
+    def _est_un_ajout(self, stat):
+        if self.releve is None:
+            return False
+        if (stat.st_dev, stat.st_ino) != self.identite or stat.st_size <= self.position:
+            return False
+        with open(self.chemin, "rb") as f:
+            return self._echantillonner(f) == self.echantillons
+
+    def _echantillonner(self, f):
+        f.seek(0)
+        debut = hashlib.sha256(f.read(min(TAILLE_ECHANTILLON, self.position))).digest()
+        depart = max(0, self.position - TAILLE_ECHANTILLON)
+        f.seek(depart)
+        fin = hashlib.sha256(f.read(self.position - depart)).digest()
+        return debut, fin
+
+    def _lire_la_suite(self, stat, progression=None):
+        processus = self.processus or processus_disponibles()
+        if self.position == 0 and stat.st_size >= SEUIL_PARALLELE and processus > 1:
+            self._lire_en_parallele(stat, processus, progression)
+        elif progression is not None:
+            progression.commencer(stat.st_size - self.position)
+
+        with open(self.chemin, "rb") as f:
+            f.seek(self.position)
+            reste = b""
+            while True:
+                with chrono.mesure("lecture export") as m:
+                    morceau = f.read(TAILLE_LECTURE)
+                    m.noter(octets=len(morceau))
+                if not morceau:
+                    break
+                if progression is not None:
+                    progression.avancer(len(morceau))
+                morceau = reste + morceau
+                coupure = morceau.rfind(b"\n") + 1
+                complet, reste = morceau[:coupure], morceau[coupure:]
+                if complet:
+                    with chrono.mesure("parsing"):
+                        self._parser(complet)
+            self.identite = (stat.st_dev, stat.st_ino)
+            self.echantillons = self._echantillonner(f)
+
+        # Dernière ligne sans retour à la ligne (export en cours d'écriture, ou fin
+        # de fichier) : parsée sur une copie, le point de reprise reste avant elle.
+        # Elle peut s'arrêter au milieu d'un caractère (« POÈ… ») : le décodeur
+        # incrémental laisse de côté l'octet incomplet au lieu d'échouer.
+        sha = self.sha.copy()
+        sha.update(reste)
+        releve = self.base.copie(sha.hexdigest())
+        parseur = self.parseur.copie() if reste else self.parseur
+        for bloc in parseur.lire(codecs.getincrementaldecoder("utf-8")().decode(reste).splitlines()):
+            releve.ajouter(bloc)
+        dernier = parseur.terminer()
+        if dernier is not None:
+            releve.ajouter(dernier)
+        self.releve = releve
+
+    def _lire_en_parallele(self, stat, processus, progression):
+        """Tout jusqu'à la dernière ligne complète ; la suite est lue par _lire_la_suite()"""
+        with open(self.chemin, "rb") as f:
+            fin = stat.st_size
+            while fin > 0:
+                f.seek(max(fin - TAILLE_ECHANTILLON, 0))
+                bloc = f.read(fin - f.tell())
+                coupure = bloc.rfind(b"\n")
+                if coupure >= 0:
+                    fin -= len(bloc) - coupure - 1
+                    break
+                fin -= len(bloc)
+        if fin == 0:
+            return
+        with chrono.mesure("parsing parallèle") as m:
+            self.base, self.parseur, lignes, self.sha = parser_en_parallele(
+                self.chemin, fin, processus, progression)
+            m.noter(octets=fin, processus=processus)
+        self.position = fin
+        self.lignes_lues += lignes
+
+    def _parser(self, octets):
+        self.sha.update(octets)
+        self.position += len(octets)
+        lignes = octets.decode("utf-8").splitlines()
+        self.lignes_lues += len(lignes)
+        for bloc in self.parseur.lire(lignes):
+            self.base.ajouter(bloc)
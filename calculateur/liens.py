@@ -0,0 +1,11 @@
+"""
+Références Légifrance de la convention collective ECLAT (IDCC 1518) citées par
+les pages de l'application.
+"""
+URL_ECLAT = "https://www.legifrance.gouv.fr/conv_coll/id/KALICONT000005635177"
+URL_GRILLE = "https://www.legifrance.gouv.fr/conv_coll/article/KALIARTI000048471347#KALIARTI000048471347"
+URL_VALPOINT = "http://legifrance.gouv.fr/conv_coll/article/KALIARTI000050362519#KALIARTI000050362519"
+URL_SALAIRE = "https://www.legifrance.gouv.fr/conv_coll/id/KALIARTI000046098173/?idConteneur=KALICONT000005635177"
+URL_MODULATION = "https://www.legifrance.gouv.fr/conv_coll/id/KALIARTI000027717752?idConteneur=KALICONT000005635177&origin=list"
+URL_ETP = "https://www.legifrance.gouv.fr/conv_coll/article/KALIARTI000043234742?utm_"
+URL_MENSUALISATION = "https://www.legifrance.gouv.fr/conv_coll/article/KALIARTI000027717752#KALIARTI000027717752"
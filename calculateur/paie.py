@@ -0,0 +1,283 @@
+"""
+Formules de paie de la convention ECLAT appliquées chez Musiques Tangentes.
+
+simuler_salaire() calcule une simulation à la fois ; simuler_lot() applique
+les mêmes fonctions à des tableaux NumPy pour simuler toute l'équipe en un
+appel. Les deux donnent des résultats identiques.
+
+Valeurs du point et taux viennent du barème en vigueur (voir taux.py) : celui
+du jour de la simulation, ou un barème par ligne pour simuler_lot().
+"""
+from datetime import date
+from typing import Any, NamedTuple
+
+from calculateur.taux import bareme_au, baremes_mois
+
+COEFFICIENT_SOCLE = 257
+POINTS_RESPONSABILITE = 48  # coefficient 305 - 257
+
+
+# Colonnes de Simulation proposées dans la grille heures × ancienneté
+INDICATEURS_GRILLE = {
+    "salaire_base": "Salaire de base (€)",
+    "prime_anciennete": "Prime d'ancienneté (€)",
+    "prime_diff": "Prime différentielle (€)",
+    "salaire_brut_total": "Salaire brut (€)",
+    "salaire_net": "Salaire net (€)",
+    "taux_horaire_brut_reel": "Taux horaire brut réel (€/h)",
+}
+
+# Colonnes de la reconstitution mois par mois (simuler_mensuel), dans l'ordre d'affichage
+INDICATEURS_MENSUELS = {
+    "heures_mois": "Heures du mois",
+    "heures_mensuelles": "Heures rémunérées",
+    "anciennete": "Ancienneté (ans)",
+    **INDICATEURS_GRILLE,
+}
+
+
+class Simulation(NamedTuple):
+    """Résultats d'une simulation : des nombres pour simuler_salaire(), des tableaux pour simuler_lot()."""
+    heures_annuelles: Any
+    heures_avec_cp: Any
+    heures_mensuelles: Any
+    heures_hebdo: Any
+    heures_mensuelles_etp: Any
+    anciennete: Any
+    prime_anciennete: Any
+    prime_diff: Any
+    salaire_base: Any
+    salaire_brut_total: Any
+    total_brut_abattu: Any
+    cotisations_sal: Any
+    salaire_net: Any
+    heures_mensuelles_reelles: Any
+    taux_horaire_brut_reel: Any
+
+
+def calculer_anciennete(date_entree, aujourd_hui=None):
+    """Années complètes entre date_entree et aujourd_hui (par défaut : aujourd'hui)"""
+    today = aujourd_hui or date.today()
+    return today.year - date_entree.year - ((today.month, today.day) < (date_entree.month, date_entree.day))
+
+
+def lisser_heures(heures_annuelles):
+    """Heures annuelles réelles -> (heures + 10% CP, mensuelles rémunérées, hebdo contractuelles, mensuelles ETP)"""
+    heures_avec_cp = heures_annuelles * 1.10
+    heures_mensuelles = heures_avec_cp / 12
+    heures_hebdo = heures_mensuelles / (52/12)
+    heures_mensuelles_etp = (heures_hebdo * ((35 * 52)/12)) / 24
+    return heures_avec_cp, heures_mensuelles, heures_hebdo, heures_mensuelles_etp
+
+
+def heures_annuelles_depuis_etp(heures_mensuelles_etp):
+    """Heures mensuelles ETP (fiche de paie) -> heures annuelles réelles"""
+    return heures_mensuelles_etp * 7.4805
+
+
+def prime_anciennete(heures_hebdo, anciennete, bareme=None):
+    """2 points par année d'ancienneté, sur la valeur V1 (barème du jour par défaut)"""
+    bareme = bareme or bareme_au()
+    return heures_hebdo * bareme.valeur_point_v1 * (anciennete * 2) / 24
+
+
+def prime_differentielle(heures_hebdo, anciennete, bareme=None, maximum=max):
+    """Complète les points d'ancienneté jusqu'au coefficient différentiel ; maximum=np.maximum pour des tableaux"""
+    bareme = bareme or bareme_au()
+    return maximum(0, (bareme.coefficient_differentiel - (anciennete * 2))) * bareme.valeur_point_v1 * heures_hebdo / 24
+
+
+def salaire_de_base(heures_hebdo, bareme):
+    """Coefficient 305 : 257 points sur V1 et 48 points sur V2"""
+    return (heures_hebdo * ((bareme.valeur_point_v1 * COEFFICIENT_SOCLE) + (bareme.valeur_point_v2 * POINTS_RESPONSABILITE))) / 24
+
+
+def detail_cotisations_salariales(total_brut_abattu, salaire_brut_total, bareme):
+    """
+    Lignes de cotisations salariales, dans l'ordre de la fiche de paie :
+    retraite (plafonnée, déplafonnée, complémentaire) sur le brut abattu,
+    CSG/CRDS sur 98,25% du brut réel (salaire de base et primes).
+    """
+    assiette_csg = salaire_brut_total * bareme.assiette_csg
+    return {
+        "plafonnee": total_brut_abattu * bareme.taux_retraite_plafonnee,
+        "deplafonnee": total_brut_abattu * bareme.taux_retraite_deplafonnee,
+        "complementaire": total_brut_abattu * bareme.taux_complementaire_t1,
+        "csg_deductible": assiette_csg * bareme.taux_csg_deductible,
+        "csg_non_deductible": assiette_csg * bareme.taux_csg_non_deductible,
+    }
+
+
+def cotisations_salariales(total_brut_abattu, salaire_brut_total, bareme):
+    """Total des lignes de detail_cotisations_salariales()"""
+    return sum(detail_cotisations_salariales(total_brut_abattu, salaire_brut_total, bareme).values())
+
+
+def _simuler(heures_annuelles, anciennete, bareme, maximum=max):
+    """Enchaîne les formules ; fonctionne sur des nombres comme sur des tableaux NumPy."""
+    heures_avec_cp, heures_mensuelles, heures_hebdo, heures_mensuelles_etp = lisser_heures(heures_annuelles)
+
+    prime_anc = prime_anciennete(heures_hebdo, anciennete, bareme)
+    prime_diff = prime_differentielle(heures_hebdo, anciennete, bareme, maximum)
+
+    salaire_base = salaire_de_base(heures_hebdo, bareme)
+    salaire_brut_total = salaire_base + prime_anc + prime_diff
+    total_brut_abattu = salaire_brut_total * bareme.taux_abattement
+    cotisations_sal = cotisations_salariales(total_brut_abattu, salaire_brut_total, bareme)
+    salaire_net = salaire_brut_total - cotisations_sal
+
+    heures_mensuelles_reelles = heures_mensuelles_etp / bareme.coef_etp_par_heure_reelle
+    taux_horaire_brut_reel = salaire_brut_total / heures_mensuelles_reelles
+
+    return Simulation(
+        heures_annuelles, heures_avec_cp, heures_mensuelles, heures_hebdo, heures_mensuelles_etp,
+        anciennete, prime_anc, prime_diff, salaire_base, salaire_brut_total, total_brut_abattu,
+        cotisations_sal, salaire_net, heures_mensuelles_reelles, taux_horaire_brut_reel,
+    )
+
+
+def simuler_salaire(heures_annuelles, date_entree, aujourd_hui=None):
+    """Simulation complète pour des heures annuelles réelles > 0, au barème du jour `aujourd_hui`."""
+    return _simuler(heures_annuelles, calculer_anciennete(date_entree, aujourd_hui), bareme_au(aujourd_hui))
+
+
+def anciennete_lot(dates_entree, aujourd_hui=None):
+    """
+    calculer_anciennete() sur des tableaux.
+    dates_entree : dates ou datetime64 ; aujourd_hui : une date ou un tableau de même taille.
+    """
+    import numpy as np
+
+    def annee_mois_jour(dates):
+        jours = np.asarray(dates, dtype="datetime64[D]")
+        mois = jours.astype("datetime64[M]")
+        return (
+            jours.astype("datetime64[Y]").astype(np.int64) + 1970,
+            mois.astype(np.int64) % 12 + 1,
+            (jours - mois).astype(np.int64) + 1,
+        )
+
+    annee, mois, jour = annee_mois_jour(dates_entree)
+    a_annee, a_mois, a_jour = annee_mois_jour(date.today() if aujourd_hui is None else aujourd_hui)
+    avant_anniversaire = (a_mois < mois) | ((a_mois == mois) & (a_jour < jour))
+    return a_annee - annee - avant_anniversaire
+
+
+def simuler_lot(heures_annuelles, dates_entree=None, aujourd_hui=None, anciennete=None, bareme=None):
+    """
+    simuler_salaire() vectorisé : une ligne par élément de heures_annuelles.
+    L'ancienneté vient de dates_entree (voir anciennete_lot) ou est donnée directement.
+    Le barème est celui d'aujourd_hui (une date, ou un barème par ligne si c'est un
+    tableau), sauf s'il est donné directement (un Bareme, ou taux.baremes_mois()).
+    Le taux horaire vaut NaN pour 0 heure.
+    """
+    import numpy as np
+
+    heures_annuelles = np.asarray(heures_annuelles, dtype=np.float64)
+    if anciennete is None:
+        anciennete = anciennete_lot(dates_entree, aujourd_hui)
+    anciennete = np.broadcast_to(np.asarray(anciennete, dtype=np.int64), heures_annuelles.shape)
+    if bareme is None:
+        if aujourd_hui is None or isinstance(aujourd_hui, date):
+            bareme = bareme_au(aujourd_hui)
+        else:
+            bareme = baremes_mois(np.asarray(aujourd_hui, dtype="datetime64[M]").astype(np.int64) + 1970 * 12)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _simuler(heures_annuelles, anciennete, bareme, np.maximum)
+
+
+def simuler_mensuel(mensuel, dates_entree):
+    """
+    Reconstitution de la paie mois par mois : le Simulateur complet pour chaque
+    (prof, mois) de `mensuel` (stockage.IndexMensuel), en un appel à simuler_lot().
+    Les heures du mois sont comptées comme un rythme annuel (heures annuelles =
+    heures du mois × 12). L'ancienneté est celle du dernier jour du mois (elle
+    change donc le mois de l'anniversaire d'entrée, 0 avant l'entrée) et le
+    barème celui du mois. dates_entree : { nom: date d'entrée } ; seul·e·s les
+    profs présent·e·s dans les deux sont simulé·e·s.
+    DataFrame indexé par (prof, mois), colonnes heures_mois puis celles de Simulation.
+    """
+    import numpy as np
+    import pandas as pd
+
+    noms = [nom for nom in mensuel.index if nom in dates_entree]
+    debuts, fins = np.array([mensuel.index[nom] for nom in noms], dtype=np.int64).reshape(-1, 2).T
+    longueurs = fins - debuts
+    # Positions de tous les mois retenus, prof après prof : debut de chaque prof + rang dans son bloc
+    decalages = np.repeat(debuts - (np.cumsum(longueurs) - longueurs), longueurs)
+    positions = decalages + np.arange(longueurs.sum())
+
+    cles = np.frombuffer(mensuel.cles, dtype=np.int32)[positions].astype(np.int64)
+    heures_mois = np.frombuffer(mensuel.minutes, dtype=np.int32)[positions] / 60
+    entrees = np.repeat(np.array([dates_entree[nom] for nom in noms], dtype="datetime64[D]"), longueurs)
+    fins_de_mois = (cles - 1970 * 12 + 1).astype("datetime64[M]").astype("datetime64[D]") - 1
+
+    simulation = simuler_lot(
+        heures_mois * 12,
+        anciennete=np.maximum(anciennete_lot(entrees, fins_de_mois), 0),
+        bareme=baremes_mois(cles),
+    )
+    index = pd.MultiIndex.from_arrays(
+        [np.repeat(np.array(noms, dtype=object), longueurs), pd.PeriodIndex.from_ordinals(cles - 1970 * 12, freq="M")],
+        names=["prof", "mois"],
+    )
+    return pd.DataFrame({"heures_mois": heures_mois, **simulation._asdict()}, index=index)
+
+
+COLONNES_DATES_ENTREE = ("Prof", "Date d'entrée")
+
+
+def lire_dates_entree(fichier):
+    """
+    CSV « Prof;Date d'entrée » (dates JJ/MM/AAAA) -> (dates_entree, rejets).
+    dates_entree : tuple de (nom, date) ; rejets : ["ligne 4 : date « 31/02/2020 » invalide", ...],
+    les lignes numérotées comme dans le fichier (en-tête en ligne 1).
+    ValueError si le fichier n'est pas un CSV à ces deux colonnes.
+    """
+    import pandas as pd
+
+    from calculateur.recherche import normaliser
+
+    try:
+        table = pd.read_csv(fichier, sep=";", dtype=str, keep_default_na=False, encoding="utf-8-sig")
+    except (ValueError, UnicodeDecodeError, pd.errors.ParserError) as erreur:  # EmptyDataError est une ValueError
+        raise ValueError(f"CSV illisible : {erreur}") from erreur
+    attendues = [normaliser(colonne) for colonne in COLONNES_DATES_ENTREE]
+    if [normaliser(str(colonne)) for colonne in table.columns[:2]] != attendues:
+        raise ValueError(
+            f"En-tête attendu : « {';'.join(COLONNES_DATES_ENTREE)} », trouvé : « {';'.join(map(str, table.columns))} »"
+        )
+
+    noms = table.iloc[:, 0].str.strip()
+    textes = table.iloc[:, 1].str.strip()
+    jours = pd.to_datetime(textes, format="%d/%m/%Y", errors="coerce")
+    dates_entree, rejets = [], []
+    for ligne, nom, texte, jour in zip(range(2, len(table) + 2), noms, textes, jours):
+        if not nom and not texte:
+            continue
+        if not nom:
+            rejets.append(f"ligne {ligne} : nom manquant")
+        elif pd.isna(jour):
+            rejets.append(f"ligne {ligne} : date « {texte} » invalide pour {nom}")
+        else:
+            dates_entree.append((nom, jour.date()))
+    return tuple(dates_entree), rejets
+
+
+def grille_salaires(heures_annuelles, anciennetes, bareme=None):
+    """
+    simuler_lot() sur toutes les combinaisons (heures annuelles, années d'ancienneté),
+    en une évaluation vectorisée, au barème donné (par défaut celui du jour).
+    DataFrame long : une ligne par combinaison, colonnes heures_annuelles,
+    anciennete puis INDICATEURS_GRILLE.
+    """
+    import numpy as np
+    import pandas as pd
+
+    heures, anciennete = np.meshgrid(
+        np.asarray(heures_annuelles, dtype=np.float64), np.asarray(anciennetes, dtype=np.int64), indexing="ij"
+    )
+    simulation = simuler_lot(heures.ravel(), anciennete=anciennete.ravel(), bareme=bareme)
+    colonnes = ["heures_annuelles", "anciennete", *INDICATEURS_GRILLE]
+    return pd.DataFrame({colonne: getattr(simulation, colonne) for colonne in colonnes})
+
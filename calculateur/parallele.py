@@ -0,0 +1,179 @@
+"""
+Parsing parallèle des très gros exports (plusieurs sites consolidés).
+
+Le fichier est découpé en morceaux qui commencent chacun sur une ligne de nom :
+aucun bloc de prof n'est coupé entre deux morceaux, chacun se parse seul avec
+son propre ParseurHeures. Les morceaux sont parsés dans un pool de processus,
+le dernier dans le processus appelant (son bloc reste ouvert pour la suite du
+chargement incrémental), et les blocs sont fusionnés dans l'ordre du fichier :
+le relevé est identique à celui du parsing séquentiel.
+
+Progression est mise à jour au fil des morceaux parsés ; un autre thread
+(la page, voir vues/verificateur.py) la lit pour afficher l'avancement.
+"""
+import hashlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from calculateur.heures import ParseurHeures
+from calculateur.stockage import ReleveHeures
+
+# En dessous, le démarrage des processus coûte plus que le parsing lui-même
+SEUIL_PARALLELE = 64 << 20
+# Morceaux par processus : un processus qui a fini plus tôt en reprend un autre
+MORCEAUX_PAR_PROCESSUS = 4
+TAILLE_MORCEAU_MIN = 4 << 20
+
+
+class Progression:
+    """Octets traités sur `total`, partagés entre le thread qui charge et celui qui affiche"""
+
+    def __init__(self):
+        self.total = 0
+        self.faits = 0
+        self._verrou = threading.Lock()
+
+    def commencer(self, total):
+        with self._verrou:
+            self.total, self.faits = total, 0
+
+    def avancer(self, octets):
+        with self._verrou:
+            self.faits += octets
+
+    @property
+    def fraction(self):
+        with self._verrou:
+            return min(self.faits / self.total, 1.0) if self.total else 0.0
+
+
+def processus_disponibles():
+    """Cœurs utilisables par ce processus"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _commence_un_bloc(ligne: bytes):
+    """La première ligne non vide est un nom (ou l'en-tête), comme la classe ParseurHeures.lire()"""
+    for texte in ligne.decode("utf-8", "replace").splitlines():
+        texte = texte.strip()
+        if texte:
+            return not texte[0].isdigit() and not texte.startswith("Total")
+    return False
+
+
+def decouper(chemin, fin, taille):
+    """
+    Bornes [(début, fin), ...] des morceaux de [0, fin) : environ `taille` octets,
+    chaque morceau après le premier commençant sur une ligne de nom.
+    """
+    debuts = [0]
+    with open(chemin, "rb") as f:
+        visee = taille
+        while visee < fin:
+            f.seek(visee)
+            f.readline()  # fin de la ligne entamée
+            while True:
+                position = f.tell()
+                ligne = f.readline()
+                if not ligne or position >= fin:
+                    position = fin
+                    break
+                if _commence_un_bloc(ligne):
+                    break
+            if position >= fin:
+                break
+            debuts.append(position)
+            visee = position + taille
+    return list(zip(debuts, debuts[1:] + [fin]))
+
+
+def _lire_morceau(chemin, debut, fin):
+    with open(chemin, "rb") as f:
+        f.seek(debut)
+        return f.read(fin - debut).decode("utf-8").splitlines()
+
+
+def _parser_morceau(chemin, debut, fin):
+    """Dans un processus du pool : blocs complets du morceau et nombre de lignes"""
+    lignes = _lire_morceau(chemin, debut, fin)
+    parseur = ParseurHeures()
+    blocs = list(parseur.lire(lignes))
+    dernier = parseur.terminer()
+    if dernier is not None:
+        blocs.append(dernier)
+    return blocs, len(lignes)
+
+
+def _hacher(chemin, fin, sha):
+    with open(chemin, "rb") as f:
+        reste = fin
+        while reste:
+            bloc = f.read(min(1 << 20, reste))
+            if not bloc:
+                break
+            sha.update(bloc)
+            reste -= len(bloc)
+
+
+def parser_en_parallele(chemin, fin, processus=None, progression=None, taille=None):
+    """
+    Parse les octets [0, fin) de `chemin` : tout le fichier, ou jusqu'après un
+    retour à la ligne pour reprendre ensuite (ChargeurIncremental).
+    Retourne (base, parseur, lignes, sha) : ReleveHeures des blocs terminés, dans
+    l'ordre du fichier ; ParseurHeures dont le bloc du·de la dernier·ère prof est
+    encore ouvert ; nombre de lignes lues ; hash SHA-256 des octets [0, fin).
+    """
+    processus = processus or processus_disponibles()
+    taille = taille or max(fin // (processus * MORCEAUX_PAR_PROCESSUS), TAILLE_MORCEAU_MIN)
+    morceaux = decouper(chemin, fin, taille)
+    if progression is not None:
+        progression.commencer(fin)
+
+    sha = hashlib.sha256()
+    hachage = threading.Thread(target=_hacher, args=(chemin, fin, sha), daemon=True)
+    hachage.start()
+
+    base = ReleveHeures()
+    parseur = ParseurHeures()
+    lignes = 0
+    contexte = multiprocessing.get_context("spawn")  # pas de fork d'un serveur multi-thread
+    with ProcessPoolExecutor(max_workers=processus, mp_context=contexte) as pool:
+        futurs = []
+        for debut, fin_morceau in morceaux[:-1]:
+            futur = pool.submit(_parser_morceau, str(chemin), debut, fin_morceau)
+            if progression is not None:
+                futur.add_done_callback(lambda _, n=fin_morceau - debut: progression.avancer(n))
+            futurs.append(futur)
+
+        # Dernier morceau ici : son bloc ouvert reste dans ce processus
+        debut, fin_morceau = morceaux[-1]
+        dernieres = _lire_morceau(chemin, debut, fin_morceau)
+        blocs_fin = list(parseur.lire(dernieres))
+        if progression is not None:
+            progression.avancer(fin_morceau - debut)
+
+        for futur in futurs:
+            blocs, nombre = futur.result()
+            for bloc in blocs:
+                base.ajouter(bloc)
+            lignes += nombre
+    for bloc in blocs_fin:
+        base.ajouter(bloc)
+    lignes += len(dernieres)
+
+    hachage.join()
+    return base, parseur, lignes, sha
+
+
+def charger_releve_parallele(chemin, processus=None, progression=None):
+    """ReleveHeures de tout le fichier, comme stockage.charger_releve(chemin, empreinte_fichier(chemin))"""
+    base, parseur, _, sha = parser_en_parallele(chemin, os.path.getsize(chemin), processus, progression)
+    releve = base.copie(sha.hexdigest())
+    dernier = parseur.terminer()
+    if dernier is not None:
+        releve.ajouter(dernier)
+    return releve
@@ -0,0 +1,178 @@
+"""
+Documents PDF générés avec reportlab.
+
+Le relevé d'heures est un seul tableau paginé (TableauReleve) : en-tête répété
+sur chaque page, sous-total à la fin de chaque mois, mis en page page par page
+plutôt qu'un Paragraph par jour. Le PDF est écrit dans un fichier temporaire
+qui ne reste en mémoire que tant qu'il est petit. Les styles sont créés une fois par
+processus ; les polices sont les polices standard du PDF, sans chargement.
+"""
+from functools import lru_cache
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from calculateur import chrono
+
+# Au-delà, le PDF en cours de construction passe de la mémoire au disque
+TAILLE_EN_MEMOIRE = 1 << 20
+
+EN_TETE_RELEVE = ("Date", "Heures")
+GRIS_SOUS_TOTAL = colors.HexColor("#EEEEEE")
+LARGEURS_RELEVE = (120, 80)
+HAUTEUR_LIGNE = 13
+
+
+@lru_cache(maxsize=1)
+def feuille_styles():
+    """getSampleStyleSheet(), construit une fois par processus"""
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=1)
+def _style_releve():
+    """Commandes communes à tous les tableaux de relevé ; les sous-totaux s'y ajoutent"""
+    return (
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("LINEBELOW", (0, 0), (-1, 0), 0.75, colors.black),
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 2),
+        ("TOPPADDING", (0, 0), (-1, -1), 2),
+    )
+
+
+def lignes_releve(jours):
+    """
+    Lignes du tableau, sans l'en-tête : jours, et « Total mm/aaaa » après le
+    dernier jour de chaque mois. Retourne (lignes, indices des sous-totaux).
+    """
+    lignes = []
+    sous_totaux = set()
+    mois_courant, cumul = None, 0.0
+
+    def fermer_mois():
+        sous_totaux.add(len(lignes))
+        lignes.append((f"Total {mois_courant.replace('-', '/')}", f"{cumul:.2f} h"))
+
+    for date_str, h in jours:
+        mois = date_str[3:]
+        if mois != mois_courant and mois_courant is not None:
+            fermer_mois()
+            cumul = 0.0
+        mois_courant = mois
+        cumul += h
+        lignes.append((date_str, f"{h:.2f} h"))
+    if mois_courant is not None:
+        fermer_mois()
+    return lignes, sous_totaux
+
+
+class TableauReleve(Flowable):
+    """
+    Tableau du relevé, paginé au fil du rendu : à chaque page, split() en détache
+    un tableau des lignes qui y tiennent, sous l'en-tête, et garde la suite.
+    reportlab recalcule tout le reste d'un Table à chaque coupure de page ; ici,
+    seule la page en cours est construite et le coût suit le nombre de lignes.
+    """
+
+    def __init__(self, lignes, sous_totaux, debut=0):
+        super().__init__()
+        self.lignes = lignes
+        self.sous_totaux = sous_totaux
+        self.debut = debut
+        self.hAlign = "LEFT"
+
+    def _page(self, fin):
+        style = list(_style_releve())
+        for rang in range(1, fin - self.debut + 1):
+            if self.debut + rang - 1 in self.sous_totaux:
+                style.append(("BACKGROUND", (0, rang), (-1, rang), GRIS_SOUS_TOTAL))
+                style.append(("FONTNAME", (0, rang), (-1, rang), "Helvetica-Bold"))
+        return Table([EN_TETE_RELEVE, *self.lignes[self.debut:fin]], colWidths=LARGEURS_RELEVE,
+                     rowHeights=HAUTEUR_LIGNE, hAlign="LEFT", style=TableStyle(style))
+
+    def wrap(self, largeur, hauteur):
+        self.width = sum(LARGEURS_RELEVE)
+        self.height = (len(self.lignes) - self.debut + 1) * HAUTEUR_LIGNE
+        return self.width, self.height
+
+    def split(self, largeur, hauteur):
+        fin = self.debut + int(hauteur // HAUTEUR_LIGNE) - 1
+        if fin <= self.debut:
+            return []
+        if fin >= len(self.lignes):
+            return [self._page(len(self.lignes))]
+        return [self._page(fin), TableauReleve(self.lignes, self.sous_totaux, fin)]
+
+    def draw(self):
+        tableau = self._page(len(self.lignes))
+        tableau.wrapOn(self.canv, self.width, self.height)
+        tableau.drawOn(self.canv, 0, 0)
+
+
+def ecrire_pdf_releve(fichier, nom, total_annuel, jours):
+    """Écrit le relevé dans `fichier` (binaire, ouvert en écriture)"""
+    doc = SimpleDocTemplate(fichier, pagesize=A4)
+    styles = feuille_styles()
+    lignes, sous_totaux = lignes_releve(jours)
+    story = [
+        Paragraph(f"Relevé heures annuelles - {nom}", styles["Title"]),
+        Spacer(1, 12),
+        Paragraph(f"Total annuel : {total_annuel:.2f} h", styles["Normal"]),
+        Spacer(1, 12),
+        TableauReleve(lignes, sous_totaux),
+    ]
+    with chrono.mesure("pdf reportlab") as m:
+        doc.build(story)
+        m.noter(lignes=len(lignes), octets=fichier.tell())
+
+
+def pdf_releve(nom, total_annuel, jours):
+    """
+    Relevé d'heures annuelles d'un·e prof, dans un SpooledTemporaryFile relu
+    depuis le début (à fermer après lecture).
+    jours : [(date "jj-mm-aaaa", heures), ...]
+    """
+    fichier = SpooledTemporaryFile(max_size=TAILLE_EN_MEMOIRE)
+    try:
+        ecrire_pdf_releve(fichier, nom, total_annuel, jours)
+    except BaseException:
+        fichier.close()
+        raise
+    fichier.seek(0)
+    return fichier
+
+
+def pdf_simulation(simulation):
+    """Récapitulatif du Simulateur complet (calculateur.paie.Simulation)"""
+    s = simulation
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4)
+    styles = feuille_styles()
+    story = []
+
+    story.append(Paragraph("Simulation de salaire - Convention ECLAT", styles["Title"]))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph(f"Heures annuelles réelles : {s.heures_annuelles:.2f} h", styles["Normal"]))
+    story.append(Paragraph(f"Heures mensuelles rémunérées : {s.heures_mensuelles:.2f} h/mois", styles["Normal"]))
+    story.append(Paragraph(f"Heures hebdomadaires contractuelles : {s.heures_hebdo:.2f} h/semaine", styles["Normal"]))
+    story.append(Paragraph(f"Heures mensuelles ETP : {s.heures_mensuelles_etp:.2f} h", styles["Normal"]))
+    story.append(Paragraph(f"Heures mensuelles réelles (équivalentes) : {s.heures_mensuelles_reelles:.2f} h", styles["Normal"]))
+    story.append(Paragraph(f"Ancienneté : {s.anciennete} ans", styles["Normal"]))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph(f"Salaire de base : {s.salaire_base:.2f} €", styles["Normal"]))
+    story.append(Paragraph(f"Prime d’ancienneté : {s.prime_anciennete:.2f} €", styles["Normal"]))
+    story.append(Paragraph(f"Prime différentielle : {s.prime_diff:.2f} €", styles["Normal"]))
+    story.append(Paragraph(f"<b>Salaire brut total : {s.salaire_brut_total:.2f} €</b>", styles["Heading2"]))
+    story.append(Spacer(1, 12))
+    story.append(Paragraph(f"Taux horaire brut réel : {s.taux_horaire_brut_reel:.2f} €/h", styles["Normal"]))
+
+    with chrono.mesure("pdf reportlab") as m:
+        doc.build(story)
+        m.noter(octets=buffer.tell())
+    return buffer.getvalue()
@@ -0,0 +1,194 @@
+"""
+Recherche d'un·e prof par son nom, côté serveur.
+
+IndexNoms est construit une fois par relevé (ReleveHeures.recherche) ; la page
+n'envoie au navigateur que les meilleurs résultats, pas la liste complète des
+noms. Noms et requêtes sont comparés sans accents ni casse : « gerald poete »
+trouve « Gérald POÈTE ».
+
+- Chaque mot de la requête doit commencer un mot du nom (préfixes indexés,
+  l'ordre des mots est libre : « poete ger » trouve aussi « Gérald POÈTE »).
+- S'il y a moins de résultats que demandé, chaque mot de la requête est corrigé
+  en un début de mot de l'index à une faute de frappe près (lettre changée,
+  oubliée, en trop, ou deux lettres inversées ; deux fautes à partir de 6
+  lettres) : « gerlad » trouve « Gérald POÈTE ».
+- S'il en manque encore, les noms qui partagent le plus de trigrammes avec la
+  requête complètent la liste.
+
+Classement : mots de la requête trouvés en entier, puis noms dont le premier
+mot commence par la requête, puis les autres, puis les noms trouvés après
+correction (le moins de fautes d'abord) ; à égalité, le nom le plus court.
+"""
+import re
+import unicodedata
+from itertools import islice
+
+RE_SEPARATEURS = re.compile(r"[^a-z0-9]+")
+LIGATURES = str.maketrans({"œ": "oe", "æ": "ae"})
+
+# Part minimale de trigrammes communs (indice de Jaccard) pour un résultat approché
+SIMILARITE_MIN = 0.25
+# Fautes de frappe corrigées dans un mot de la requête, selon sa longueur ;
+# les mots plus courts ne sont pas corrigés (trop de débuts de mots à une faute)
+FAUTES_PAR_LONGUEUR = ((6, 2), (3, 1))
+
+
+def normaliser(texte):
+    """« Marc-André ALBERGEL » -> « marc andre albergel »"""
+    decompose = unicodedata.normalize("NFKD", texte.casefold().translate(LIGATURES))
+    sans_accents = "".join(c for c in decompose if not unicodedata.combining(c))
+    return RE_SEPARATEURS.sub(" ", sans_accents).strip()
+
+
+def trigrammes(normalise):
+    """Trigrammes de « mot1 mot2 », chaque mot entouré d'espaces"""
+    return {
+        trigramme
+        for mot in normalise.split()
+        for entoure in (f" {mot} ",)
+        for trigramme in (entoure[i:i + 3] for i in range(len(entoure) - 2))
+    }
+
+
+def fautes_tolerees(mot):
+    """Nombre de fautes corrigées dans `mot` (voir FAUTES_PAR_LONGUEUR)"""
+    return next((fautes for longueur, fautes in FAUTES_PAR_LONGUEUR if len(mot) >= longueur), 0)
+
+
+def distance_edition(a, b, maximum):
+    """
+    Fautes de frappe entre a et b : lettres changées, oubliées, en trop ou deux
+    lettres voisines inversées (distance de Damerau-Levenshtein restreinte).
+    Au-delà de `maximum`, rend maximum + 1 sans finir le calcul.
+    """
+    if abs(len(a) - len(b)) > maximum:
+        return maximum + 1
+    avant, ligne = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        courante = [i] + [0] * len(b)
+        for j, cb in enumerate(b, start=1):
+            courante[j] = min(ligne[j] + 1, courante[j - 1] + 1, ligne[j - 1] + (ca != cb))
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                courante[j] = min(courante[j], avant[j - 2] + 1)
+        if min(courante) > maximum:
+            return maximum + 1
+        avant, ligne = ligne, courante
+    return ligne[-1]
+
+
+class IndexNoms:
+    """
+    Index des noms d'un relevé. Les noms y sont rangés du plus court au plus long :
+    chaque liste de l'index est donc déjà dans l'ordre d'affichage, et chercher()
+    classe les résultats par opérations d'ensembles plutôt que nom par nom.
+    """
+
+    def __init__(self, noms):
+        ordre = sorted((normaliser(nom), nom) for nom in noms)
+        ordre.sort(key=lambda paire: len(paire[0]))
+        self.normalises = [normalise for normalise, _ in ordre]
+        self.noms = [nom for _, nom in ordre]
+        self.prefixes = {}            # { début de mot: [rang, ...] }, rangs croissants
+        self.entiers = {}             # { mot: {rang, ...} }
+        self.premiers = {}            # { début du premier mot: {rang, ...} }
+        self.trigrammes = {}          # { trigramme: [rang, ...] }, tableaux NumPy une fois construit
+        nb_trigrammes = []
+        for rang, normalise in enumerate(self.normalises):
+            mots = normalise.split()
+            for debut in {mot[:fin] for mot in mots for fin in range(1, len(mot) + 1)}:
+                self.prefixes.setdefault(debut, []).append(rang)
+            for mot in mots:
+                self.entiers.setdefault(mot, set()).add(rang)
+            for fin in range(1, len(mots[0]) + 1 if mots else 0):
+                self.premiers.setdefault(mots[0][:fin], set()).add(rang)
+            propres = trigrammes(normalise)
+            for trigramme in propres:
+                self.trigrammes.setdefault(trigramme, []).append(rang)
+            nb_trigrammes.append(len(propres))
+
+        self.prefixes_par_longueur = {}  # { longueur: [début de mot, ...] }, pour les corrections
+        for debut in self.prefixes:
+            self.prefixes_par_longueur.setdefault(len(debut), []).append(debut)
+
+        import numpy as np
+
+        self.trigrammes = {trigramme: np.array(rangs, dtype=np.int32) for trigramme, rangs in self.trigrammes.items()}
+        self.nb_trigrammes = np.array(nb_trigrammes, dtype=np.float64)
+
+    def __len__(self):
+        return len(self.noms)
+
+    def chercher(self, requete, limite=10):
+        """
+        Au plus `limite` noms, dans l'ordre : tous les mots de la requête trouvés
+        en entier, puis premier mot du nom commençant par le premier mot de la
+        requête, puis les autres noms qui contiennent les débuts de mots ; s'il en
+        manque, les noms trouvés en corrigeant les fautes de frappe, puis les noms
+        approchés par trigrammes.
+        """
+        mots = normaliser(requete).split()
+        if not mots:
+            return []
+
+        listes = sorted((self.prefixes.get(mot, ()) for mot in mots), key=len)
+        candidats = set(listes[0]).intersection(*listes[1:])
+        entiers = candidats.intersection(*(self.entiers.get(mot, ()) for mot in mots))
+        premiers = candidats.intersection(self.premiers.get(mots[0], ())) - entiers
+
+        rangs = sorted(entiers)[:limite]
+        rangs += sorted(premiers)[:limite - len(rangs)]
+        if len(rangs) < limite:
+            deja = entiers | premiers
+            suite = listes[0] if len(listes) == 1 else sorted(candidats)
+            rangs += islice((rang for rang in suite if rang not in deja), limite - len(rangs))
+        if len(rangs) < limite:
+            corriges = self._corriges(mots, set(rangs))
+            rangs += corriges[:limite - len(rangs)]
+            candidats = candidats.union(corriges)
+        if len(rangs) < limite:
+            rangs += self._approches(" ".join(mots), candidats, limite - len(rangs))
+        return [self.noms[rang] for rang in rangs]
+
+    def _corriges(self, mots, exclus):
+        """
+        Rangs des noms dont chaque mot commence comme un mot de la requête, à
+        quelques fautes près (voir fautes_tolerees), hors `exclus` ; classés par
+        nombre total de fautes puis par rang.
+        """
+        total = None
+        for mot in mots:
+            fautes = {rang: 0 for rang in self.prefixes.get(mot, ())}
+            maximum = fautes_tolerees(mot)
+            for longueur in range(len(mot) - maximum, len(mot) + maximum + 1):
+                for debut in self.prefixes_par_longueur.get(longueur, ()):
+                    distance = distance_edition(mot, debut, maximum)
+                    if 0 < distance <= maximum:
+                        for rang in self.prefixes[debut]:
+                            if distance < fautes.get(rang, maximum + 1):
+                                fautes[rang] = distance
+            if total is None:
+                total = fautes
+            else:
+                total = {rang: total[rang] + n for rang, n in fautes.items() if rang in total}
+            if not total:
+                return []
+        return sorted((rang for rang in total if rang not in exclus), key=lambda rang: (total[rang], rang))
+
+    def _approches(self, requete, exclus, limite):
+        """
+        Rangs des noms les plus proches par trigrammes (indice de Jaccard), hors `exclus`.
+        Les trigrammes communs de tous les noms sont comptés en un np.bincount.
+        """
+        import numpy as np
+
+        propres = trigrammes(requete)
+        listes = [self.trigrammes[trigramme] for trigramme in propres if trigramme in self.trigrammes]
+        if not listes or limite <= 0:
+            return []
+        communs = np.bincount(np.concatenate(listes), minlength=len(self.noms))
+        similarites = communs / (len(propres) + self.nb_trigrammes - communs)
+        similarites[list(exclus)] = 0
+        nombre = min(limite, len(self.noms))
+        meilleurs = np.argpartition(-similarites, nombre - 1)[:nombre]
+        meilleurs = meilleurs[np.lexsort((meilleurs, -similarites[meilleurs]))]
+        return [int(rang) for rang in meilleurs if similarites[rang] >= SIMILARITE_MIN]
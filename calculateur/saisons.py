@@ -0,0 +1,88 @@
+"""
+Saisons disponibles et cache des relevés chargés.
+
+Les exports sont rangés dans un même dossier sous la forme
+heures_<aa><aa>.txt (heures_2526.txt) ou heures_<aa><aa>_<site>.txt.
+lister_saisons() ne lit que les noms de fichiers ; un relevé n'est parsé
+que lorsque sa saison est demandée, puis reste dans un cache LRU borné en octets.
+"""
+import os
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from calculateur.incremental import ChargeurIncremental
+
+RE_FICHIER_SAISON = re.compile(r"heures_(\d{2})(\d{2})(?:_(.+))?\.txt")
+VARIABLE_DOSSIER = "ECLAT_DOSSIER_HEURES"
+BUDGET_CACHE = 256 << 20
+
+
+class Saison(NamedTuple):
+    debut: int           # 2025 pour la saison 2025-2026
+    site: Optional[str]  # None pour le fichier sans suffixe
+    chemin: Path
+
+    @property
+    def libelle(self):
+        saison = f"{self.debut}-{self.debut + 1}"
+        return f"{saison} · {self.site.replace('_', ' ').title()}" if self.site else saison
+
+
+def dossier_heures(defaut) -> Path:
+    """Dossier des exports : variable d'environnement ECLAT_DOSSIER_HEURES, sinon `defaut`"""
+    return Path(os.environ.get(VARIABLE_DOSSIER) or defaut)
+
+
+def lister_saisons(dossier) -> List[Saison]:
+    """Saisons présentes dans `dossier`, la plus récente d'abord, sans ouvrir les fichiers"""
+    saisons = []
+    for chemin in Path(dossier).glob("heures_*.txt"):
+        trouve = RE_FICHIER_SAISON.fullmatch(chemin.name)
+        if trouve is None:
+            continue
+        debut, fin, site = trouve.groups()
+        if (int(debut) + 1) % 100 != int(fin):
+            continue
+        saisons.append(Saison(2000 + int(debut), site, chemin))
+    return sorted(saisons, key=lambda s: (-s.debut, s.site or ""))
+
+
+class CacheReleves:
+    """
+    Un ChargeurIncremental par fichier, les moins récemment utilisés évincés
+    dès que la taille totale des relevés dépasse `budget` octets.
+    Le dernier relevé demandé est toujours gardé, même s'il dépasse seul le budget.
+    """
+
+    def __init__(self, budget=BUDGET_CACHE):
+        self.budget = budget
+        self._chargeurs = OrderedDict()
+        self._verrou = threading.Lock()
+
+    def charger(self, chemin, progression=None):
+        """ReleveHeures à jour de `chemin`, parsé au premier appel seulement"""
+        chemin = str(chemin)
+        with self._verrou:
+            chargeur = self._chargeurs.pop(chemin, None) or ChargeurIncremental(chemin)
+            self._chargeurs[chemin] = chargeur
+        releve = chargeur.charger(progression)
+        with self._verrou:
+            self._evincer()
+        return releve
+
+    def _evincer(self):
+        while len(self._chargeurs) > 1 and self.nbytes > self.budget:
+            self._chargeurs.popitem(last=False)
+
+    @property
+    def nbytes(self):
+        return sum(chargeur.nbytes for chargeur in self._chargeurs.values())
+
+    def __contains__(self, chemin):
+        return str(chemin) in self._chargeurs
+
+    def __len__(self):
+        return len(self._chargeurs)
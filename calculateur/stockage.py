@@ -0,0 +1,206 @@
+"""
+Stockage en colonnes des heures de tou·te·s les profs d'un export.
+
+Deux tableaux contigus (jour ordinal, minutes) et un index prof -> (début, fin).
+Environ 6 octets par jour travaillé, contre ~150 pour une liste de tuples
+(date texte, float) : la taille reste raisonnable sur plusieurs écoles et saisons.
+
+Les totaux par (prof, mois) sont calculés pendant la lecture et rapprochés des
+lignes "Total Mois" de l'export (voir IndexMensuel).
+"""
+from array import array
+from functools import cached_property
+from typing import Iterable
+
+from calculateur import chrono
+from calculateur.heures import BlocProf, cle_mois, date_fr, lire_blocs_profs, minutes_en_heures
+
+JOURS_FR = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
+
+# date.toordinal() du 1er janvier 1970, origine de datetime64
+ORDINAL_EPOQUE = 719163
+
+
+class IndexMensuel:
+    """
+    Minutes travaillées par (prof, mois) et "Total Mois" déclarés, en colonnes.
+    Les mois de `nom` sont cles[debut:fin] ; heures() répond en O(1).
+    """
+
+    def __init__(self):
+        self.cles = array("i")       # annee * 12 + mois - 1
+        self.minutes = array("i")
+        self.declares = array("d")   # heures déclarées, NaN si pas de "Total Mois"
+        self.index = {}              # { nom: (debut, fin) }
+        self.positions = {}          # { (nom, clé de mois): position }
+        self.ecarts = []             # [EcartMois, ...] dans l'ordre du fichier
+
+    def copie(self):
+        copie = IndexMensuel()
+        copie.cles = array("i", self.cles)
+        copie.minutes = array("i", self.minutes)
+        copie.declares = array("d", self.declares)
+        copie.index = dict(self.index)
+        copie.positions = dict(self.positions)
+        copie.ecarts = list(self.ecarts)
+        return copie
+
+    def ajouter(self, bloc: BlocProf):
+        """Comme ReleveHeures.ajouter() : un nom déjà vu (export multi-sites) remplace son bloc précédent"""
+        ancien = self.index.get(bloc.nom)
+        if ancien is not None:
+            for position in range(*ancien):
+                del self.positions[bloc.nom, self.cles[position]]
+            self.ecarts = [ecart for ecart in self.ecarts if ecart.nom != bloc.nom]
+        debut = len(self.cles)
+        self.cles.extend(bloc.mois)
+        self.minutes.extend(bloc.minutes_mois)
+        self.declares.extend(bloc.declares_mois)
+        self.index[bloc.nom] = (debut, len(self.cles))
+        for position, cle in enumerate(bloc.mois, start=debut):
+            self.positions[bloc.nom, cle] = position
+        self.ecarts.extend(bloc.ecarts)
+
+    @property
+    def nbytes(self):
+        return sum(colonne.itemsize * len(colonne) for colonne in (self.cles, self.minutes, self.declares))
+
+    def heures(self, nom, annee, mois):
+        """Heures travaillées par `nom` ce mois-là (0 si aucune)"""
+        position = self.positions.get((nom, cle_mois(annee, mois)))
+        return 0.0 if position is None else self.minutes[position] / 60
+
+    def declare(self, nom, annee, mois):
+        """"Total Mois" déclaré par la paie, None si absent"""
+        position = self.positions.get((nom, cle_mois(annee, mois)))
+        if position is None or self.declares[position] != self.declares[position]:
+            return None
+        return self.declares[position]
+
+    def ecarts_prof(self, nom):
+        return [ecart for ecart in self.ecarts if ecart.nom == nom]
+
+    def dataframe(self, nom):
+        """DataFrame Mois / Heures / Déclaré / Écart de `nom`"""
+        import numpy as np
+        import pandas as pd
+
+        with chrono.mesure("dataframe mensuel"):
+            debut, fin = self.index.get(nom, (0, 0))
+            cles = np.frombuffer(self.cles, dtype=np.int32)[debut:fin]
+            heures = np.frombuffer(self.minutes, dtype=np.int32)[debut:fin] / 60
+            declares = np.frombuffer(self.declares, dtype=np.float64)[debut:fin]
+            return pd.DataFrame({
+                "Mois": pd.PeriodIndex.from_ordinals(cles - 1970 * 12, freq="M"),
+                "Heures": heures,
+                "Déclaré": declares,
+                "Écart": heures - declares,
+            })
+
+
+class ReleveHeures:
+    """
+    Heures journalières de tou·te·s les profs, en colonnes.
+    Les profs sont contigu·ë·s : les jours de `nom` sont jours[debut:fin].
+    L'objet est partagé entre sessions : ne pas le modifier.
+    """
+
+    def __init__(self, empreinte=None):
+        self.noms = []                # ordre du fichier
+        self.index = {}               # { nom: (debut, fin) }
+        self.jours = array("i")       # date.toordinal() de chaque jour travaillé
+        self.minutes = array("H")     # minutes travaillées ce jour-là
+        self.totaux = {}              # { nom: total calculé en heures }
+        self.totaux_periode = {}      # { nom: "Total Période" déclaré, si présent }
+        self.mensuel = IndexMensuel()
+        self.empreinte = empreinte    # hash du fichier source, clé des caches dérivés
+
+    @classmethod
+    def depuis_blocs(cls, blocs: Iterable[BlocProf], empreinte=None):
+        releve = cls(empreinte)
+        for bloc in blocs:
+            releve.ajouter(bloc)
+        return releve
+
+    def ajouter(self, bloc: BlocProf):
+        """
+        Ajoute un·e prof à la fin ; réservé à la construction, avant tout partage.
+        Un nom déjà vu (export multi-sites) garde sa place dans `noms`, mais son
+        nouveau bloc remplace entièrement le précédent.
+        """
+        debut = len(self.jours)
+        self.jours.extend(bloc.ordinaux)
+        self.minutes.extend(bloc.minutes)
+        if bloc.nom not in self.index:
+            self.noms.append(bloc.nom)
+        self.index[bloc.nom] = (debut, len(self.jours))
+        self.totaux[bloc.nom] = bloc.total
+        if bloc.total_periode is not None:
+            self.totaux_periode[bloc.nom] = bloc.total_periode
+        else:
+            self.totaux_periode.pop(bloc.nom, None)
+        self.mensuel.ajouter(bloc)
+
+    def copie(self, empreinte=None):
+        """Copie indépendante (les colonnes sont copiées en bloc), à compléter avec ajouter()"""
+        copie = ReleveHeures(empreinte)
+        copie.noms = list(self.noms)
+        copie.index = dict(self.index)
+        copie.jours = array("i", self.jours)
+        copie.minutes = array("H", self.minutes)
+        copie.totaux = dict(self.totaux)
+        copie.totaux_periode = dict(self.totaux_periode)
+        copie.mensuel = self.mensuel.copie()
+        return copie
+
+    def __len__(self):
+        return len(self.noms)
+
+    def __contains__(self, nom):
+        return nom in self.index
+
+    @cached_property
+    def recherche(self):
+        """IndexNoms des profs (recherche sans accents), construit à la première recherche"""
+        from calculateur.recherche import IndexNoms
+
+        return IndexNoms(self.noms)
+
+    @property
+    def nbytes(self):
+        """Taille des colonnes en octets"""
+        return self.jours.itemsize * len(self.jours) + self.minutes.itemsize * len(self.minutes) + self.mensuel.nbytes
+
+    def vue(self, nom):
+        """(jours, minutes) de `nom` en memoryview, sans copie"""
+        debut, fin = self.index[nom]
+        return memoryview(self.jours)[debut:fin], memoryview(self.minutes)[debut:fin]
+
+    def jours_prof(self, nom):
+        """[(date "jj-mm-aaaa", heures décimales), ...] comme parse_fichier_multi_profs"""
+        jours, minutes = self.vue(nom)
+        return [(date_fr(o), minutes_en_heures(m)) for o, m in zip(jours, minutes)]
+
+    def dataframe(self, nom):
+        """
+        DataFrame Jour / Date / Heures de `nom`, construit à partir des colonnes.
+        Date est une vraie colonne datetime64 (tri et filtres par date), Jour une
+        catégorie ordonnée Lundi..Dimanche : aucun parsing de texte par ligne.
+        """
+        import numpy as np
+        import pandas as pd
+
+        with chrono.mesure("dataframe"):
+            jours, minutes = self.vue(nom)
+            ordinaux = np.frombuffer(jours, dtype=np.int32)
+            return pd.DataFrame({
+                # date.fromordinal(1) est un lundi
+                "Jour": pd.Categorical.from_codes((ordinaux - 1) % 7, categories=JOURS_FR, ordered=True),
+                "Date": (ordinaux - ORDINAL_EPOQUE).astype("datetime64[D]").astype("datetime64[s]"),
+                "Heures": np.frombuffer(minutes, dtype=np.uint16) / 60,
+            })
+
+
+def charger_releve(chemin, empreinte=None):
+    """Parse l'export en flux directement vers le stockage en colonnes."""
+    return ReleveHeures.depuis_blocs(lire_blocs_profs(chemin), empreinte)
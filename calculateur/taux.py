@@ -0,0 +1,90 @@
+"""
+Barèmes de paie datés : valeurs du point, coefficient différentiel, abattement
+et taux de cotisations, chacun en vigueur à partir de sa date d'effet.
+
+BAREMES est trié par date d'effet et construit une fois par processus, à
+l'import. bareme_au() trouve le barème d'un jour par recherche dichotomique ;
+baremes_mois() donne celui de chaque mois d'un historique en une seule passe
+vectorisée, sans recherche ligne par ligne. Avant le premier barème connu,
+c'est le premier qui s'applique.
+
+Un barème commence toujours le 1er d'un mois (la paie est mensuelle). Pour un
+avenant ou une nouvelle année, ajouter une ligne à BAREMES.
+"""
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+
+class Bareme(NamedTuple):
+    """Valeurs en vigueur à partir de `debut` : des nombres pour bareme_au(), des tableaux pour baremes_mois()."""
+    debut: Any
+    valeur_point_v1: Any
+    valeur_point_v2: Any
+    coefficient_differentiel: Any
+    taux_abattement: Any
+    coef_etp_par_heure_reelle: Any
+    # Cotisations salariales : retraite sur le brut abattu, CSG/CRDS sur 98,25% du brut réel
+    taux_retraite_plafonnee: Any
+    taux_retraite_deplafonnee: Any
+    taux_complementaire_t1: Any
+    assiette_csg: Any
+    taux_csg_deductible: Any
+    taux_csg_non_deductible: Any
+    # Cotisations patronales, sur le brut abattu ; affichées sur la fiche de paie seulement
+    taux_patronal_maladie: Any
+    taux_patronal_retraite_plafonnee: Any
+    taux_patronal_retraite_deplafonnee: Any
+    taux_patronal_famille: Any
+
+
+BAREMES = (
+    Bareme(
+        debut=date(2025, 1, 1),
+        valeur_point_v1=7.15,
+        valeur_point_v2=6.73,
+        coefficient_differentiel=62.03,
+        taux_abattement=0.7,
+        coef_etp_par_heure_reelle=1.36,
+        taux_retraite_plafonnee=0.069,
+        taux_retraite_deplafonnee=0.004,
+        taux_complementaire_t1=0.0401,
+        assiette_csg=0.9825,
+        taux_csg_deductible=0.068,
+        taux_csg_non_deductible=0.029,
+        taux_patronal_maladie=0.07,
+        taux_patronal_retraite_plafonnee=0.0855,
+        taux_patronal_retraite_deplafonnee=0.0202,
+        taux_patronal_famille=0.0345,
+    ),
+)
+
+# Date d'effet de chaque barème, en clé de mois annee * 12 + mois - 1 (comme stockage.IndexMensuel)
+DEBUTS = [bareme.debut.year * 12 + bareme.debut.month - 1 for bareme in BAREMES]
+
+
+def bareme_au(jour=None):
+    """Barème en vigueur le jour donné (par défaut : aujourd'hui)"""
+    jour = jour or date.today()
+    return BAREMES[max(bisect_right(DEBUTS, jour.year * 12 + jour.month - 1) - 1, 0)]
+
+
+@lru_cache(maxsize=1)
+def _colonnes():
+    """BAREMES en tableaux NumPy, un par champ, construits une fois"""
+    import numpy as np
+
+    return tuple(np.array(valeurs) for valeurs in zip(*BAREMES))
+
+
+def baremes_mois(cles):
+    """
+    Barème de chaque mois, en Bareme de tableaux de même taille que `cles`
+    (clés annee * 12 + mois - 1). Les dates d'effet sont triées : un seul
+    searchsorted place tous les mois, puis chaque champ est lu par indexation.
+    """
+    import numpy as np
+
+    indices = np.maximum(np.searchsorted(DEBUTS, np.asarray(cles, dtype=np.int64), side="right") - 1, 0)
+    return Bareme(*(colonne[indices] for colonne in _colonnes()))
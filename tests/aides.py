@@ -0,0 +1,43 @@
+"""Exports d'heures de test et comparaison de relevés."""
+from pathlib import Path
+
+EXPORT_REEL = Path(__file__).resolve().parent.parent / "heures_2526.txt"
+
+PETIT_EXPORT = """Prénom NOM
+
+Marc-André ALBERGEL
+16-09-2025 total jour : 03:30
+23-09-2025 total jour : 04:00
+Total Mois : 7,5 heures
+07-10-2025 total jour : 02:00
+Total Mois : 2 h; Total Période : 9,5 h;
+Gérald POÈTE
+02-09-2025 total jour : 01:30
+30-09-2025 total jour : 03:15
+Total Mois : 4,75 heures
+"""
+
+# "Total Mois" faux de 30 min, puis d'un centième (au-delà de l'arrondi toléré)
+EXPORT_ECARTS = PETIT_EXPORT.replace("Total Mois : 7,5", "Total Mois : 7").replace("Total Mois : 4,75", "Total Mois : 4,76")
+
+# Export multi-sites : le second bloc d'un même nom remplace le premier (mois,
+# "Total Mois", écarts et "Total Période" compris), comme dans parse_fichier_multi_profs
+EXPORT_DOUBLONS = EXPORT_ECARTS + """Site Nord
+Marc-André ALBERGEL
+14-10-2025 total jour : 01:00
+Total Mois : 1,5 heures
+"""
+
+
+def identiques(a, b):
+    """Même contenu et même empreinte pour deux ReleveHeures"""
+    return (a.noms == b.noms and a.index == b.index and a.jours == b.jours and a.minutes == b.minutes
+            and a.totaux == b.totaux and a.totaux_periode == b.totaux_periode and a.empreinte == b.empreinte
+            and a.mensuel.index == b.mensuel.index and a.mensuel.cles == b.mensuel.cles
+            and a.mensuel.minutes == b.mensuel.minutes and a.mensuel.ecarts == b.mensuel.ecarts
+            and _memes_nombres(a.mensuel.declares, b.mensuel.declares))
+
+
+def _memes_nombres(a, b):
+    """Égalité de tableaux de flottants où NaN == NaN"""
+    return len(a) == len(b) and all(x == y or (x != x and y != y) for x, y in zip(a, b))
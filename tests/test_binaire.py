@@ -0,0 +1,70 @@
+import pytest
+
+from calculateur.binaire import MAGIE, chemin_binaire, ecrire_releve, ouvrir_releve
+from calculateur.heures import empreinte_fichier
+from calculateur.incremental import ChargeurIncremental
+from calculateur.stockage import ReleveHeures, charger_releve
+from tests.aides import EXPORT_DOUBLONS, EXPORT_REEL, PETIT_EXPORT, identiques
+
+
+@pytest.fixture(params=["reel", "petit", "doublons"])
+def export(request, tmp_path):
+    chemin = tmp_path / "heures_2526.txt"
+    if request.param == "reel":
+        chemin.write_bytes(EXPORT_REEL.read_bytes())
+    elif request.param == "doublons":
+        chemin.write_text(EXPORT_DOUBLONS, encoding="utf-8")
+    else:
+        # Avec un écart de "Total Mois" et un "Total Période" à relire depuis l'en-tête
+        chemin.write_text(PETIT_EXPORT.replace("Total Mois : 7,5", "Total Mois : 7"), encoding="utf-8")
+    return chemin
+
+
+def test_aller_retour(export):
+    releve = charger_releve(export, empreinte_fichier(export))
+    copie = chemin_binaire(export)
+    ecrire_releve(releve, copie)
+    relu = ouvrir_releve(copie, releve.empreinte)
+    assert identiques(relu, releve)
+    assert relu.mensuel.positions == releve.mensuel.positions
+    assert [relu.jours_prof(nom) for nom in relu.noms] == [releve.jours_prof(nom) for nom in releve.noms]
+    mois = [(annee, m) for annee in (2025, 2026) for m in range(1, 13)]
+    for nom in releve.noms:
+        assert [relu.mensuel.heures(nom, *am) for am in mois] == [releve.mensuel.heures(nom, *am) for am in mois]
+        assert [relu.mensuel.declare(nom, *am) for am in mois] == [releve.mensuel.declare(nom, *am) for am in mois]
+    assert sorted(export.parent.iterdir()) == sorted([export, copie])  # pas de fichier temporaire laissé
+
+
+def test_copie_perimee_ou_abimee(export):
+    releve = charger_releve(export, empreinte_fichier(export))
+    copie = chemin_binaire(export)
+    assert ouvrir_releve(copie, releve.empreinte) is None
+    ecrire_releve(releve, copie)
+    assert ouvrir_releve(copie, "0" * 64) is None
+
+    contenu = copie.read_bytes()
+    copie.write_bytes(contenu[:len(contenu) - 1])
+    assert ouvrir_releve(copie, releve.empreinte) is None
+    copie.write_bytes(b"ECLATRH1" + contenu[len(MAGIE):])
+    assert ouvrir_releve(copie, releve.empreinte) is None
+    copie.write_bytes(b"")
+    assert ouvrir_releve(copie, releve.empreinte) is None
+
+
+def test_releve_sans_empreinte(tmp_path):
+    with pytest.raises(ValueError):
+        ecrire_releve(ReleveHeures(), tmp_path / "heures_2526.releve")
+
+
+def test_demarrage_a_chaud(export):
+    froid = ChargeurIncremental(export).charger()
+    assert chemin_binaire(export).exists()
+    chaud = ChargeurIncremental(export).charger()
+    assert isinstance(chaud.jours, memoryview)
+    assert identiques(chaud, froid)
+
+    # Export réécrit : la copie est ignorée, puis remplacée
+    export.write_text(PETIT_EXPORT.replace("Gérald", "Gérard"), encoding="utf-8")
+    recharge = ChargeurIncremental(export).charger()
+    assert identiques(recharge, charger_releve(export, empreinte_fichier(export)))
+    assert identiques(ouvrir_releve(chemin_binaire(export), recharge.empreinte), recharge)
@@ -0,0 +1,26 @@
+import zipfile
+
+from calculateur.export_releves import exporter_releves, nom_fichier_releve
+from calculateur.stockage import charger_releve
+from tests.aides import EXPORT_REEL
+
+
+def test_archive_complete(tmp_path):
+    releve = charger_releve(EXPORT_REEL)
+    archive = tmp_path / "releves.zip"
+    noms = [nom for nom, _ in exporter_releves(releve, archive, processus=2)]
+    assert noms == releve.noms
+    with zipfile.ZipFile(archive) as z:
+        assert z.namelist() == [nom_fichier_releve(nom) for nom in releve.noms]
+        assert all(z.read(nom).startswith(b"%PDF") for nom in z.namelist())
+    assert list(tmp_path.iterdir()) == [archive]
+
+
+def test_archive_interrompue(tmp_path):
+    """Génération abandonnée (rerun de la page) : ni archive tronquée, ni fichier temporaire"""
+    releve = charger_releve(EXPORT_REEL)
+    archive = tmp_path / "releves.zip"
+    export = exporter_releves(releve, archive, processus=1)
+    next(export)
+    export.close()
+    assert list(tmp_path.iterdir()) == []
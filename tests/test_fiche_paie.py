@@ -0,0 +1,47 @@
+from datetime import date
+
+import pytest
+
+from calculateur.fiche_paie import HEURES_EXEMPLE, fiche_paie_svg, nombre_fr, valeurs_fiche
+from calculateur.paie import simuler_salaire
+from calculateur.taux import bareme_au
+
+ENTREE = date(2015, 1, 1)
+AUJOURD_HUI = date(2025, 6, 1)
+
+
+def nombre(texte):
+    return float(texte.replace(",", "."))
+
+
+def test_csg_sur_le_brut_reel():
+    simulation = simuler_salaire(HEURES_EXEMPLE, ENTREE, AUJOURD_HUI)
+    valeurs = valeurs_fiche(simulation, ENTREE, bareme_au(AUJOURD_HUI))
+    assert nombre(valeurs["assiette_csg"]) == round(simulation.salaire_brut_total * 0.9825, 2)
+    cotisations = sum(nombre(valeurs[f"sal_{nom}"]) for nom in
+                      ("plafonnee", "deplafonnee", "complementaire", "csg_deductible", "csg_non_deductible"))
+    assert abs(nombre(valeurs["total_salarial"]) - cotisations) <= 0.02
+    assert abs(nombre(valeurs["net"]) - (nombre(valeurs["brut"]) - nombre(valeurs["total_salarial"]))) <= 0.015
+
+
+@pytest.mark.parametrize("heures", [HEURES_EXEMPLE, 1000.0])
+def test_meme_net_que_le_simulateur(heures):
+    """Une seule formule : la fiche affiche les cotisations et le net de simuler_salaire()"""
+    simulation = simuler_salaire(heures, ENTREE, AUJOURD_HUI)
+    valeurs = valeurs_fiche(simulation, ENTREE, bareme_au(AUJOURD_HUI))
+    assert valeurs["total_salarial"] == nombre_fr(simulation.cotisations_sal)
+    assert valeurs["net"] == nombre_fr(simulation.salaire_net)
+    assert simulation.salaire_net == simulation.salaire_brut_total - simulation.cotisations_sal
+
+
+def test_infobulles_assiette_csg():
+    svg = fiche_paie_svg(HEURES_EXEMPLE, ENTREE, AUJOURD_HUI)
+    assert "98,25% du Total brut réel" in svg
+    assert "salaire de base" not in svg.split("CSG")[1][:400]
+
+
+def test_police_des_infobulles():
+    """Les largeurs calculées sont celles d'Helvetica : police aux mêmes métriques imposée"""
+    svg = fiche_paie_svg(HEURES_EXEMPLE, ENTREE, AUJOURD_HUI)
+    regle = svg.split(".tooltip-text")[1].split("}")[0]
+    assert 'font-family: Helvetica, Arial, "Liberation Sans", Arimo, sans-serif;' in regle
@@ -0,0 +1,35 @@
+from calculateur.heures import empreinte_fichier
+from calculateur.incremental import ChargeurIncremental
+from calculateur.stockage import charger_releve
+from tests.aides import PETIT_EXPORT, identiques
+
+
+def test_fichier_ecrit_octet_par_octet(tmp_path):
+    """Export en cours d'écriture : la dernière ligne peut couper « È » en deux"""
+    contenu = PETIT_EXPORT.encode("utf-8")
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_bytes(b"")
+    chargeur = ChargeurIncremental(chemin, binaire=False)
+    with open(chemin, "ab", buffering=0) as f:
+        for octet in contenu:
+            f.write(bytes([octet]))
+            chargeur.charger()
+    assert identiques(chargeur.charger(), charger_releve(chemin, empreinte_fichier(chemin)))
+
+
+def test_ajouts_successifs(tmp_path):
+    chemin = tmp_path / "heures_2526.txt"
+    lignes = PETIT_EXPORT.splitlines(keepends=True)
+    chargeur = ChargeurIncremental(chemin, binaire=False)
+    for fin in range(1, len(lignes) + 1):
+        chemin.write_text("".join(lignes[:fin]), encoding="utf-8")
+        assert identiques(chargeur.charger(), charger_releve(chemin, empreinte_fichier(chemin)))
+
+
+def test_fichier_reecrit(tmp_path):
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_text(PETIT_EXPORT, encoding="utf-8")
+    chargeur = ChargeurIncremental(chemin, binaire=False)
+    chargeur.charger()
+    chemin.write_text(PETIT_EXPORT.replace("03:30", "02:30"), encoding="utf-8")
+    assert identiques(chargeur.charger(), charger_releve(chemin, empreinte_fichier(chemin)))
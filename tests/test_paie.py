@@ -0,0 +1,153 @@
+import io
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from calculateur import taux
+from calculateur.paie import (
+    anciennete_lot, calculer_anciennete, lire_dates_entree, simuler_lot, simuler_mensuel, simuler_salaire,
+)
+from calculateur.stockage import charger_releve
+
+
+def csv(texte):
+    return io.BytesIO(texte.encode("utf-8"))
+
+
+def test_dates_entree_valides_et_rejetees():
+    dates_entree, rejets = lire_dates_entree(csv(
+        "Prof;Date d'entrée\n"
+        "Gérald POÈTE;04/04/2003\n"
+        "Swann KUREK;31/02/2020\n"
+        ";01/01/2020\n"
+        ";\n"
+        " Diane ROZEC ; 29/02/2024 \n"
+    ))
+    assert dates_entree == (("Gérald POÈTE", date(2003, 4, 4)), ("Diane ROZEC", date(2024, 2, 29)))
+    assert rejets == ["ligne 3 : date « 31/02/2020 » invalide pour Swann KUREK", "ligne 4 : nom manquant"]
+
+
+def test_entete_sans_accents_ni_bom():
+    dates_entree, rejets = lire_dates_entree(io.BytesIO("﻿prof;Date d'entree\nA;01/09/2019\n".encode("utf-8")))
+    assert dates_entree == (("A", date(2019, 9, 1)),) and rejets == []
+
+
+@pytest.mark.parametrize("texte", ["Prof\nA\n", "Nom;Entrée\nA;01/01/2020\n", ""])
+def test_colonnes_invalides(texte):
+    with pytest.raises(ValueError):
+        lire_dates_entree(csv(texte))
+
+
+# Anniversaires d'entrée, 29 février, entrée le jour même ou dans le futur, et
+# ancienneté autour de la fin de la prime différentielle (62,03 - 2 × 31 > 0)
+JOURS = [date(2025, 3, 1), date(2025, 2, 28), date(2024, 2, 29), date(2024, 2, 28), date(2028, 2, 29), date(2025, 12, 31)]
+ENTREES = [
+    date(2015, 3, 1), date(2015, 3, 2), date(2015, 2, 28), date(2016, 2, 29), date(2020, 2, 29),
+    date(1994, 3, 1), date(1993, 3, 1), date(1993, 2, 28), date(2025, 3, 1), date(2026, 1, 1),
+    date(2024, 2, 29), date(2000, 1, 1), date(2000, 12, 31),
+]
+HEURES = [0.5, 1.0, 147.4, 167.0, 333.33, 1e-3, 1200.25, 864.0 / 7]
+
+
+def cas_simulation():
+    return [(h, entree, jour) for h in HEURES for entree in ENTREES for jour in JOURS]
+
+
+def test_simuler_lot_identique_au_scalaire_par_jour():
+    for jour in JOURS:
+        cas = [(h, entree) for h in HEURES for entree in ENTREES]
+        lot = simuler_lot([h for h, _ in cas], [entree for _, entree in cas], jour)
+        for i, (h, entree) in enumerate(cas):
+            scalaire = simuler_salaire(h, entree, jour)
+            for champ, valeur in scalaire._asdict().items():
+                assert getattr(lot, champ)[i] == valeur, (champ, h, entree, jour)
+
+
+def test_simuler_lot_identique_au_scalaire_dates_par_ligne():
+    cas = cas_simulation()
+    lot = simuler_lot([h for h, _, _ in cas], [e for _, e, _ in cas], np.array([j for _, _, j in cas], dtype="datetime64[D]"))
+    for i, (h, entree, jour) in enumerate(cas):
+        scalaire = simuler_salaire(h, entree, jour)
+        assert tuple(colonne[i] for colonne in lot) == tuple(scalaire), (h, entree, jour)
+
+
+def test_anciennete_lot():
+    entrees = [e for e in ENTREES for _ in JOURS]
+    jours = [j for _ in ENTREES for j in JOURS]
+    assert anciennete_lot(entrees, jours).tolist() == [calculer_anciennete(e, j) for e, j in zip(entrees, jours)]
+
+
+# Saison sept. 2025 - juin 2026 ; clé de mois annee * 12 + mois - 1
+MOIS_SAISON = [2025 * 12 + 8 + n for n in range(10)]
+ENTREES_MENSUEL = {
+    "Anniversaire NOVEMBRE": date(2015, 11, 15),    # 10 ans à partir de novembre
+    "Arrivée JANVIER": date(2026, 1, 10),           # pas encore entrée de septembre à décembre
+    "Bissextile FÉVRIER": date(2016, 2, 29),        # 10 ans en mars : pas de 29/02 en 2026
+}
+
+
+def fin_de_mois(cle):
+    annee, mois = divmod(cle + 1, 12)
+    return date(annee, mois + 1, 1) - timedelta(days=1)
+
+
+@pytest.fixture
+def export_saison(tmp_path):
+    """Quelques jours par mois pour chaque prof, un nombre de minutes différent par mois"""
+    lignes = ["Prénom NOM"]
+    for rang, nom in enumerate([*ENTREES_MENSUEL, "Sans DATE"]):
+        lignes.append(nom)
+        for i, cle in enumerate(MOIS_SAISON):
+            annee, mois = divmod(cle, 12)
+            for jour in (3, 17):
+                minutes = 45 + 15 * ((rang + i + jour) % 9)
+                lignes.append(f"{jour:02d}-{mois + 1:02d}-{annee} total jour : {minutes // 60:02d}:{minutes % 60:02d}")
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_text("\n".join(lignes) + "\n", encoding="utf-8")
+    return charger_releve(chemin).mensuel
+
+
+@pytest.fixture
+def nouveau_bareme(monkeypatch):
+    """Une revalorisation au 1er janvier 2026, en cours de saison"""
+    premier = taux.BAREMES[0]
+    baremes = (premier, premier._replace(debut=date(2026, 1, 1), valeur_point_v1=7.4, taux_csg_deductible=0.07))
+    monkeypatch.setattr(taux, "BAREMES", baremes)
+    monkeypatch.setattr(taux, "DEBUTS", [b.debut.year * 12 + b.debut.month - 1 for b in baremes])
+    taux._colonnes.cache_clear()
+    yield baremes
+    taux._colonnes.cache_clear()
+
+
+@pytest.mark.parametrize("revalorisation", [False, True])
+def test_simuler_mensuel_comme_le_scalaire(export_saison, request, revalorisation):
+    if revalorisation:
+        request.getfixturevalue("nouveau_bareme")
+    df = simuler_mensuel(export_saison, {**ENTREES_MENSUEL, "Inconnu·e HORS EXPORT": date(2010, 1, 1)})
+    assert df.index.get_level_values("prof").unique().tolist() == list(ENTREES_MENSUEL)
+    assert len(df) == len(ENTREES_MENSUEL) * len(MOIS_SAISON)
+
+    for (nom, periode), ligne in df.iterrows():
+        cle = periode.year * 12 + periode.month - 1
+        jour = fin_de_mois(cle)
+        assert ligne["heures_mois"] == export_saison.heures(nom, periode.year, periode.month)
+        entree = ENTREES_MENSUEL[nom]
+        # Avant l'entrée : ancienneté 0, comme une entrée le jour même
+        attendu = simuler_salaire(ligne["heures_mois"] * 12, entree if entree <= jour else jour, jour)
+        assert tuple(ligne[list(attendu._fields)]) == tuple(attendu), (nom, periode)
+
+    anciennetes = df["anciennete"].unstack("prof")
+    assert anciennetes["Anniversaire NOVEMBRE"].tolist() == [9, 9] + [10] * 8
+    assert anciennetes["Arrivée JANVIER"].tolist() == [0] * 10
+    assert anciennetes["Bissextile FÉVRIER"].tolist() == [9] * 6 + [10] * 4
+    if revalorisation:
+        valeurs = df.xs("Arrivée JANVIER")["salaire_base"] / df.xs("Arrivée JANVIER")["heures_hebdo"]
+        assert valeurs.iloc[3] < valeurs.iloc[4]  # décembre au premier barème, janvier au nouveau
+
+
+@pytest.mark.parametrize("dates_entree", [{}, {"Inconnu·e HORS EXPORT": date(2010, 1, 1)}])
+def test_simuler_mensuel_sans_prof(export_saison, dates_entree):
+    df = simuler_mensuel(export_saison, dates_entree)
+    assert df.empty
+    assert list(df.columns[:2]) == ["heures_mois", "heures_annuelles"]
@@ -0,0 +1,66 @@
+import pytest
+
+from benchmarks.generateur import generer
+from calculateur import incremental, parallele
+from calculateur.heures import charger_fichier_heures, empreinte_fichier
+from calculateur.incremental import ChargeurIncremental
+from calculateur.parallele import Progression, charger_releve_parallele, decouper, parser_en_parallele
+from calculateur.stockage import charger_releve
+from tests.aides import PETIT_EXPORT, identiques
+
+
+@pytest.fixture
+def export(tmp_path, monkeypatch):
+    """Export synthétique d'environ 80 Ko, parsé en morceaux de quelques Ko"""
+    chemin = tmp_path / "heures_2526.txt"
+    generer(chemin, 2)
+    monkeypatch.setattr(parallele, "TAILLE_MORCEAU_MIN", 4 << 10)
+    return chemin
+
+
+def test_decouper_sur_les_noms(export):
+    fin = export.stat().st_size
+    morceaux = decouper(export, fin, 5000)
+    assert len(morceaux) > 5
+    assert morceaux[0][0] == 0 and morceaux[-1][1] == fin
+    assert all(a[1] == b[0] for a, b in zip(morceaux, morceaux[1:]))
+    contenu = export.read_bytes()
+    for debut, _ in morceaux[1:]:
+        assert contenu[debut - 1:debut] == b"\n"
+        assert parallele._commence_un_bloc(contenu[debut:contenu.index(b"\n", debut)])
+
+
+@pytest.mark.parametrize("taille", [None, 3000, 1 << 30])
+def test_parser_en_parallele(export, taille):
+    fin = export.stat().st_size
+    base, parseur, lignes, sha = parser_en_parallele(export, fin, processus=2, taille=taille)
+    releve = base.copie(sha.hexdigest())
+    releve.ajouter(parseur.terminer())
+    assert identiques(releve, charger_releve(export, empreinte_fichier(export)))
+    assert lignes == len(export.read_text(encoding="utf-8").splitlines())
+
+
+def test_charger_releve_parallele(export):
+    progression = Progression()
+    releve = charger_releve_parallele(export, processus=2, progression=progression)
+    assert progression.fraction == 1.0
+    assert identiques(releve, charger_releve(export, empreinte_fichier(export)))
+    heures_profs, total_annuels = charger_fichier_heures(export)
+    assert {nom: releve.jours_prof(nom) for nom in releve.noms} == heures_profs
+    assert releve.totaux == total_annuels
+
+
+def test_chargeur_incremental_en_parallele(export, monkeypatch):
+    monkeypatch.setattr(incremental, "SEUIL_PARALLELE", 0)
+    appels = []
+    monkeypatch.setattr(incremental, "parser_en_parallele", lambda *args: appels.append(args) or parser_en_parallele(*args))
+    # Dernière ligne inachevée : lue après le parallèle, puis reprise à l'ajout suivant
+    with open(export, "a", encoding="utf-8") as f:
+        f.write(PETIT_EXPORT[:-20])
+    chargeur = ChargeurIncremental(export, binaire=False, processus=3)
+    assert identiques(chargeur.charger(), charger_releve(export, empreinte_fichier(export)))
+    assert [args[2] for args in appels] == [3]
+    with open(export, "a", encoding="utf-8") as f:
+        f.write(PETIT_EXPORT[-20:] + PETIT_EXPORT.replace("POÈTE", "POÈTE-LAMY"))
+    assert identiques(chargeur.charger(), charger_releve(export, empreinte_fichier(export)))
+    assert len(appels) == 1
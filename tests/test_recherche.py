@@ -0,0 +1,85 @@
+import pytest
+
+from calculateur.recherche import IndexNoms, distance_edition, normaliser
+from calculateur.stockage import charger_releve
+from tests.aides import PETIT_EXPORT
+
+NOMS = [
+    "Anne MARTIN",        # « anne » en entier, premier mot
+    "Jean ANNE",          # « anne » en entier, plus court
+    "Annette DURAND",     # premier mot commençant par « anne »
+    "Anneliese KO",       # idem, plus court
+    "Paul ANNEAU",        # un autre mot commençant par « anne »
+    "Gérald POÈTE",
+    "Gérard MARTIN",
+    "Geraldine ROUX",
+    "Marc-André ALBERGEL",
+    "Zoé LŒUVRE",
+]
+
+
+@pytest.fixture(scope="module")
+def index():
+    return IndexNoms(NOMS)
+
+
+def test_normaliser():
+    assert normaliser("Marc-André ALBERGEL") == "marc andre albergel"
+    assert normaliser("  Zoé  LŒUVRE ") == "zoe loeuvre"
+    assert normaliser("GÉRALD poète") == normaliser("gerald POETE")
+
+
+@pytest.mark.parametrize("requete", ["gerald poete", "GÉRALD", "poete ger", "po GER", "  Gérald,  POÈTE  "])
+def test_accents_casse_et_ordre_des_mots(index, requete):
+    assert index.chercher(requete)[0] == "Gérald POÈTE"
+
+
+def test_trois_niveaux_puis_le_plus_court(index):
+    assert index.chercher("anne") == ["Jean ANNE", "Anne MARTIN", "Anneliese KO", "Annette DURAND", "Paul ANNEAU"]
+    assert index.chercher("anne", limite=3) == ["Jean ANNE", "Anne MARTIN", "Anneliese KO"]
+    assert index.chercher("marc andre") == ["Marc-André ALBERGEL"]
+    assert index.chercher("loeuvre") == ["Zoé LŒUVRE"]
+    assert index.chercher("") == [] and index.chercher(" - ") == []
+
+
+def test_en_tete_jamais_propose(tmp_path):
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_text(PETIT_EXPORT, encoding="utf-8")
+    recherche = charger_releve(chemin).recherche
+    assert len(recherche) == 2
+    for requete in ["prenom nom", "Prénom", "nom", "pr"]:
+        assert "Prénom NOM" not in recherche.chercher(requete)
+
+
+@pytest.mark.parametrize("requete", [
+    "gerlad",          # lettres inversées
+    "gerld poete",     # lettre oubliée
+    "geerald",         # lettre en trop
+    "gerals",          # lettre changée
+    "poete gearld",    # ordre libre, faute dans un seul mot
+    "poetr",
+])
+def test_fautes_de_frappe(index, requete):
+    assert index.chercher(requete)[0] == "Gérald POÈTE"
+
+
+def test_corrections_apres_les_prefixes(index):
+    # Préfixe exact d'abord, puis une faute, puis deux
+    assert index.chercher("gerald") == ["Gérald POÈTE", "Geraldine ROUX", "Gérard MARTIN"]
+    assert index.chercher("gerlad")[:2] == ["Gérald POÈTE", "Geraldine ROUX"]
+    # Mots courts : pas de correction
+    assert index.chercher("jo") == []
+
+
+def test_approches_par_trigrammes(index):
+    """Un mot sans correction possible : les trigrammes du reste retrouvent le nom"""
+    assert index.chercher("marc andre albergel xq")[0] == "Marc-André ALBERGEL"
+
+
+@pytest.mark.parametrize("a, b, attendu", [
+    ("gerald", "gerald", 0), ("gerlad", "gerald", 1), ("gerld", "gerald", 1),
+    ("geerald", "gerald", 1), ("gerals", "gerald", 1), ("gearld", "gerald", 1), ("grelad", "gerald", 2), ("abc", "xyz", 3),
+])
+def test_distance_edition(a, b, attendu):
+    assert distance_edition(a, b, 3) == attendu
+    assert distance_edition(a, b, 1) == min(attendu, 2)
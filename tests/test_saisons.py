@@ -0,0 +1,56 @@
+from calculateur.heures import empreinte_fichier
+from calculateur.saisons import CacheReleves, Saison, lister_saisons
+from calculateur.stockage import charger_releve
+from tests.aides import PETIT_EXPORT, identiques
+
+
+def test_lister_saisons(tmp_path):
+    for nom in ["heures_2425.txt", "heures_2526.txt", "heures_2526_saint_leu.txt", "heures_2526_ancien.txt",
+                "heures_2527.txt", "heures_2526.csv", "heures_25.txt", "notes.txt"]:
+        (tmp_path / nom).write_text("", encoding="utf-8")
+    saisons = lister_saisons(tmp_path)
+    assert saisons == [
+        Saison(2025, None, tmp_path / "heures_2526.txt"),
+        Saison(2025, "ancien", tmp_path / "heures_2526_ancien.txt"),
+        Saison(2025, "saint_leu", tmp_path / "heures_2526_saint_leu.txt"),
+        Saison(2024, None, tmp_path / "heures_2425.txt"),
+    ]
+    assert [s.libelle for s in saisons] == ["2025-2026", "2025-2026 · Ancien", "2025-2026 · Saint Leu", "2024-2025"]
+    assert lister_saisons(tmp_path / "absent") == []
+
+
+def test_cache_comme_charger_releve(tmp_path):
+    chemins = []
+    for i, debut in enumerate((2425, 2526)):
+        chemin = tmp_path / f"heures_{debut}.txt"
+        chemin.write_text(PETIT_EXPORT.replace("2025", str(2024 + i)), encoding="utf-8")
+        chemins.append(chemin)
+    cache = CacheReleves()
+    assert len(cache) == 0
+    for chemin in chemins:
+        assert identiques(cache.charger(chemin), charger_releve(chemin, empreinte_fichier(chemin)))
+    assert all(chemin in cache for chemin in chemins)
+    assert cache.charger(chemins[0]) is cache.charger(chemins[0])
+
+    with open(chemins[0], "a", encoding="utf-8") as f:
+        f.write("14-10-2025 total jour : 01:00\n")
+    assert identiques(cache.charger(chemins[0]), charger_releve(chemins[0], empreinte_fichier(chemins[0])))
+
+
+def test_cache_borne_en_octets(tmp_path):
+    chemins = []
+    for debut in (2324, 2425, 2526):
+        chemin = tmp_path / f"heures_{debut}.txt"
+        chemin.write_text(PETIT_EXPORT, encoding="utf-8")
+        chemins.append(chemin)
+    cache = CacheReleves(budget=1)
+    for chemin in chemins:
+        cache.charger(chemin)
+        assert len(cache) == 1 and chemin in cache
+    cache = CacheReleves()
+    for chemin in chemins:
+        cache.charger(chemin)
+    cache.charger(chemins[0])
+    cache.budget = cache.nbytes - 1
+    cache.charger(chemins[0])
+    assert chemins[0] in cache and chemins[1] not in cache and chemins[2] in cache
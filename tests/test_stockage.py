@@ -0,0 +1,106 @@
+import re
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from benchmarks import reference
+from benchmarks.bench_parseur import sans_lignes_vides
+from calculateur.heures import parse_fichier_multi_profs
+from calculateur.stockage import JOURS_FR, charger_releve
+from tests.aides import EXPORT_DOUBLONS, EXPORT_ECARTS, EXPORT_REEL, PETIT_EXPORT
+
+
+def test_releve_comme_le_parseur_d_origine():
+    texte = EXPORT_REEL.read_text(encoding="utf-8")
+    origine = sans_lignes_vides(reference.parse_fichier_multi_profs(texte))
+    assert sans_lignes_vides(parse_fichier_multi_profs(texte)) == origine
+    releve = charger_releve(EXPORT_REEL)
+    assert releve.noms == list(origine[0])
+    assert ({nom: releve.jours_prof(nom) for nom in releve.noms}, releve.totaux) == origine
+
+
+def test_dataframe_comme_le_tableau_d_origine():
+    """Jour / Date / Heures comme l'ancien tableau, construit ligne par ligne à partir du texte"""
+    releve = charger_releve(EXPORT_REEL)
+    heures_profs, _ = reference.parse_fichier_multi_profs(EXPORT_REEL.read_text(encoding="utf-8"))
+    for nom in releve.noms:
+        jours = heures_profs[nom]
+        df = releve.dataframe(nom)
+        assert list(df.columns) == ["Jour", "Date", "Heures"]
+        assert df["Jour"].tolist() == [JOURS_FR[datetime.strptime(d, "%d-%m-%Y").weekday()] for d, _ in jours]
+        assert df["Date"].tolist() == [pd.Timestamp(datetime.strptime(d, "%d-%m-%Y")) for d, _ in jours]
+        assert df["Heures"].tolist() == [h for _, h in jours]
+        assert df["Date"].dt.strftime("%d-%m-%Y").tolist() == [d for d, _ in jours]
+
+
+def mensuel_naif(texte):
+    """Minutes et "Total Mois" par (prof, clé de mois), et écarts, recalculés ligne à ligne"""
+    minutes, declares, ecarts = {}, {}, []
+    nom = mois = None
+    depuis_total = 0
+    for ligne in texte.splitlines():
+        ligne = ligne.strip()
+        jour = re.match(r"\d{2}-(\d{2})-(\d{4})\s+total jour\s*:\s*(\d{2}):(\d{2})", ligne)
+        if jour:
+            mm, aaaa, hh, mi = map(int, jour.groups())
+            mois = aaaa * 12 + mm - 1
+            minutes[nom, mois] = minutes.get((nom, mois), 0) + hh * 60 + mi
+            depuis_total += hh * 60 + mi
+        elif ligne.startswith("Total Mois") and mois is not None:
+            declare = float(re.search(r"[\d,.]+", ligne).group().replace(",", "."))
+            declares[nom, mois] = declare
+            if abs(depuis_total / 60 - declare) > 0.005 + 1e-9:
+                ecarts.append((nom, mois, depuis_total / 60, declare))
+            depuis_total = 0
+        elif ligne and not ligne.startswith("Total"):
+            nom, mois, depuis_total = ligne, None, 0
+            minutes = {cle: n for cle, n in minutes.items() if cle[0] != nom}
+            declares = {cle: d for cle, d in declares.items() if cle[0] != nom}
+            ecarts = [ecart for ecart in ecarts if ecart[0] != nom]
+    return minutes, declares, ecarts
+
+
+@pytest.mark.parametrize("texte", [EXPORT_REEL.read_text(encoding="utf-8"), PETIT_EXPORT, EXPORT_ECARTS, EXPORT_DOUBLONS],
+                         ids=["reel", "petit", "ecarts", "doublons"])
+def test_index_mensuel_comme_les_jours(tmp_path, texte):
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_text(texte, encoding="utf-8")
+    mensuel = charger_releve(chemin).mensuel
+    minutes, declares, ecarts = mensuel_naif(texte)
+
+    positions = {(nom, mensuel.cles[i]): i for nom, (debut, fin) in mensuel.index.items() for i in range(debut, fin)}
+    assert {cle: mensuel.minutes[i] for cle, i in positions.items()} == minutes
+    assert {cle: mensuel.declares[i] for cle, i in positions.items() if mensuel.declares[i] == mensuel.declares[i]} == declares
+    assert [tuple(ecart) for ecart in mensuel.ecarts] == ecarts
+    for nom, cle in positions:
+        annee, mois = divmod(cle, 12)
+        assert mensuel.heures(nom, annee, mois + 1) == minutes[nom, cle] / 60
+        assert mensuel.declare(nom, annee, mois + 1) == declares.get((nom, cle))
+
+
+def test_ecarts_total_mois(tmp_path):
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_text(EXPORT_ECARTS, encoding="utf-8")
+    mensuel = charger_releve(chemin).mensuel
+    assert [(e.nom, e.mois, e.calcule, e.declare) for e in mensuel.ecarts] == [
+        ("Marc-André ALBERGEL", 2025 * 12 + 8, 7.5, 7.0),
+        ("Gérald POÈTE", 2025 * 12 + 8, 4.75, 4.76),
+    ]
+    df = mensuel.dataframe("Marc-André ALBERGEL")
+    assert df["Écart"].tolist() == [0.5, 0.0]
+    assert mensuel.heures("Gérald POÈTE", 2025, 10) == 0.0 and mensuel.declare("Gérald POÈTE", 2025, 10) is None
+
+
+def test_nom_repete(tmp_path):
+    chemin = tmp_path / "heures_2526.txt"
+    chemin.write_text(EXPORT_DOUBLONS, encoding="utf-8")
+    releve = charger_releve(chemin)
+    nom = "Marc-André ALBERGEL"
+    assert releve.noms == [nom, "Gérald POÈTE"]
+    assert releve.jours_prof(nom) == [("14-10-2025", 1.0)]
+    assert releve.totaux[nom] == 1.0 and nom not in releve.totaux_periode
+    assert releve.mensuel.dataframe(nom)["Heures"].tolist() == [1.0]
+    assert releve.mensuel.heures(nom, 2025, 9) == 0.0 and releve.mensuel.declare(nom, 2025, 9) is None
+    assert releve.mensuel.heures(nom, 2025, 10) == 1.0 and releve.mensuel.declare(nom, 2025, 10) == 1.5
+    assert [(e.nom, e.mois) for e in releve.mensuel.ecarts] == [("Gérald POÈTE", 2025 * 12 + 8), (nom, 2025 * 12 + 9)]
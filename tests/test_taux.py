@@ -0,0 +1,54 @@
+from datetime import date, timedelta
+
+import pytest
+
+from calculateur import taux
+from calculateur.taux import bareme_au, baremes_mois
+
+
+@pytest.fixture
+def trois_baremes(monkeypatch):
+    """Trois barèmes fictifs, dont un changement en cours d'année"""
+    premier = taux.BAREMES[0]
+    baremes = (
+        premier,
+        premier._replace(debut=date(2025, 9, 1), valeur_point_v1=7.25, taux_csg_deductible=0.07),
+        premier._replace(debut=date(2026, 1, 1), valeur_point_v1=7.4, coefficient_differentiel=63.0),
+    )
+    monkeypatch.setattr(taux, "BAREMES", baremes)
+    monkeypatch.setattr(taux, "DEBUTS", [b.debut.year * 12 + b.debut.month - 1 for b in baremes])
+    taux._colonnes.cache_clear()
+    yield baremes
+    taux._colonnes.cache_clear()
+
+
+def bareme_naif(baremes, jour):
+    """Le dernier barème commencé à cette date, sinon le premier"""
+    en_vigueur = [b for b in baremes if b.debut <= jour]
+    return en_vigueur[-1] if en_vigueur else baremes[0]
+
+
+JOURS = [date(2024, 12, 31) + timedelta(days=n) for n in range(0, 500, 3)] + [
+    date(1999, 1, 1), date(2025, 8, 31), date(2025, 9, 1), date(2025, 12, 31), date(2026, 1, 1), date(2040, 6, 15),
+]
+
+
+def test_bareme_au(trois_baremes):
+    for jour in JOURS:
+        assert bareme_au(jour) is bareme_naif(trois_baremes, jour), jour
+
+
+def test_baremes_mois_comme_bareme_au(trois_baremes):
+    cles = [jour.year * 12 + jour.month - 1 for jour in JOURS]
+    colonnes = baremes_mois(cles)
+    for i, jour in enumerate(JOURS):
+        attendu = bareme_au(jour)
+        assert tuple(colonne[i] for colonne in colonnes) == attendu, jour
+    assert baremes_mois([]).valeur_point_v1.shape == (0,)
+
+
+def test_bareme_actuel():
+    """Avant le premier barème connu, c'est le premier qui s'applique"""
+    assert bareme_au(date(2000, 1, 1)) is taux.BAREMES[0]
+    assert bareme_au(date.today()) is bareme_au()
+    assert baremes_mois([2000 * 12]).valeur_point_v1.tolist() == [taux.BAREMES[0].valeur_point_v1]
@@ -0,0 +1,18 @@
+import streamlit as st
+
+from calculateur.images import LOGO, variante_image
+
+st.title("Simulateur de paie - Musiques Tangentes")
+st.image(variante_image(LOGO, 400), width=400)
+st.write("""
+**Cet outil vous permet de comprendre les éléments de votre fiche de paie et de calculer vos heures et primes.**
+
+Utilisez le menu à gauche pour naviguer entre les différents modules :
+- Définitions : Coefficient, valeur du point d'indice et salaire de base  
+- Lire sa fiche de paie : schéma interactif  
+- Mensualisation et ETP 
+- Primes d'ancienneté et différentielle  
+- Vérification de son nombre d'heures réelles annuelles  
+- Simulateur complet   
+- Liens utiles
+""")
@@ -0,0 +1,45 @@
+import streamlit as st
+
+from calculateur.fiche_paie import nombre_fr
+from calculateur.liens import URL_GRILLE, URL_SALAIRE, URL_VALPOINT
+from calculateur.taux import bareme_au
+
+bareme = bareme_au()
+v1, v2 = nombre_fr(bareme.valeur_point_v1), nombre_fr(bareme.valeur_point_v2)
+
+st.title("Coefficient et salaire de base")
+
+st.info("""
+**Coefficient :** Renvoie à la grille de classification de la convention collective ECLAT.  
+Les Animateurs et Techniciens sont rattaché·e·s par défaut au groupe A de niveau 1, 
+qui correspond au coefficient 257. Musiques Tangentes rattache ses profs au **groupe D, 
+coefficient 305**, dont le salaire de base est plus élevé.
+""")
+st.success("Nb : Le coefficient conventionnel de base, indiqué sur les bulletins de paie, est de 305 mais le coefficient réel sur " \
+f"lequel est indexé les paies des profs de Musiques Tangentes est de {nombre_fr(305 + bareme.coefficient_differentiel)} (voir \"prime différentielle\"). Il est donc " \
+"plus élevé que le coefficient maximal de la catégorie Techniciens et agents de maîtrise et s'approche de la catégorie Cadres.")
+st.caption(f"[Lien Légifrance - Grille de classification]({URL_GRILLE})")
+st.divider()
+st.info(f"""
+**Valeur du point d'indice** : Valeur fixée par la convention collective ECLAT.  
+Au {bareme.debut:%d/%m/%Y}, la valeur du point d'indice est de {v1}€.
+""")
+st.caption(f"[Lien Légifrance - Valeur du point d'indice]({URL_VALPOINT})")
+st.divider()
+st.info("""
+Le **salaire de base conventionnel** correspond à la rémunération d’un·e professeur·e à temps plein ECLAT.  
+Il est calculé en multipliant les heures hebdomadaires contractuelles par la valeur du point d’indice et le coefficient, puis en divisant 
+le tout par 24 afin de ramener le résultat à la quotité ETP, c’est-à-dire la fraction du temps plein effectuée.
+Il sépare le coefficient en deux tranches pour valoriser différemment le socle de base et les points de responsabilité.
+""")
+
+with st.expander("Détail de la formule conventionnelle"):
+    # La formule générale
+    st.latex(r"\text{Salaire de base} = \frac{\text{Heures hebdo} \times [ (257 \times valeur_point_v1) + (\text{Coefficient} - 257) \times valeur_point_v2 ]}{24}")
+    st.write("---")
+    # L'application avec les chiffres du barème en vigueur
+    st.write(f"Pour un coefficient 305 en {bareme.debut.year} :")
+    st.latex(rf"\text{{Salaire}} = \frac{{\text{{H}}_{{\text{{hebdo}}}} \times [ (257 \times {v1}) + (48 \times {v2}) ]}}{{24}}")
+    
+    st.caption(f"Note : Les points d'ancienneté sont ajoutés séparément et calculés intégralement sur la valeur V1 ({v1} €).")
+    st.caption(f"[Lien Légifrance - Salaire conventionnel]({URL_SALAIRE})")
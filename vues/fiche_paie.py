@@ -0,0 +1,26 @@
+from datetime import date
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from calculateur import chrono
+from calculateur.fiche_paie import HEURES_EXEMPLE, fiche_paie_svg
+
+st.title("Comprendre sa fiche de paie")
+
+st.write("Passez la souris sur un élément pour voir le détail")
+
+# Fiche remplie par le simulateur ; par défaut l'exemple de 19,70 h ETP et 10 ans d'ancienneté
+colonne_heures, colonne_date = st.columns(2)
+heures_fiche = colonne_heures.number_input(
+    "Heures annuelles réellement effectuées :", min_value=0.5, value=HEURES_EXEMPLE, step=0.5
+)
+date_fiche = colonne_date.date_input(
+    "Date d'entrée dans l'école :", value=date(date.today().year - 10, 1, 1),
+    min_value=date(1980, 1, 1), max_value=date.today()
+)
+
+fiche_svg = fiche_paie_svg(heures_fiche, date_fiche, date.today())
+with chrono.mesure("components.html") as m:
+    m.noter(octets=len(fiche_svg))
+    components.html(fiche_svg, height=1250, scrolling=False)
@@ -0,0 +1,35 @@
+import streamlit as st
+
+from calculateur.fiche_paie import nombre_fr
+from calculateur.liens import URL_ECLAT, URL_ETP, URL_MODULATION, URL_SALAIRE
+from calculateur.taux import bareme_au
+
+bareme = bareme_au()
+v1, v2 = nombre_fr(bareme.valeur_point_v1), nombre_fr(bareme.valeur_point_v2)
+
+st.title("🔗 Liens utiles")
+
+st.write("### 1. Textes et avenants")
+st.markdown(f"- [Convention collective ECLAT - IDCC 1518]({URL_ECLAT})")
+st.markdown(f"- [Classifications et salaires]({URL_SALAIRE})")
+st.markdown(f"- [Durée et définition des temps de travail des animateurs techniciens et professeurs]({URL_ETP})")
+st.markdown(f"- [Durée du travail : Modulation]({URL_MODULATION})")
+
+st.write("### 2. Formules")
+
+with st.expander("Salaire de base"):
+    st.latex(r"\text{Salaire de base} = \frac{\text{Heures hebdo} \times [ (257 \times V_1) + (\text{Coefficient} - 257) \times V_2 ]}{24}")
+    st.write("---")
+    st.write(f"Pour un coefficient 305 en {bareme.debut.year} :")
+    st.latex(rf"\text{{Salaire}} = \frac{{\text{{H}}_{{\text{{hebdo}}}} \times [ (257 \times {v1}) + (48 \times {v2}) ]}}{{24}}")
+    st.caption(f"Note : Les points d'ancienneté sont ajoutés séparément et calculés intégralement sur la valeur V1 ({v1} €).")
+with st.expander("Heures mensuelles rémunérées"):
+    st.latex("\\text{Heures mensuelles rémunérées} = \\frac{\\text{Heures annuelles} + 10\\% \\text{ CP}}{12}")
+with st.expander("Heures hebdomadaires contractuelles"):
+    st.latex("\\text{Heures hebdomadaires contractuelles} = \\frac{\\text{Heures mensuelles rémunérées}}{\\frac{52}{12}}")
+with st.expander("Heures mensuelles ETP"):
+    st.latex("\\text{Heures mensuelles ETP} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{151,67}}{24}")
+with st.expander("Prime d'ancienneté"): 
+    st.latex("\\text{Prime d'ancienneté} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{valeur du point d'indice} \\times (\\text{ancienneté} \\times 2)}{24}")
+with st.expander("Prime différentielle"):
+    st.latex("\\text{Prime différentielle} = \\frac{\\text{valeur max entre 0 et} \\text{(" + str(bareme.coefficient_differentiel) + " - (}\\text{ancienneté} \\times 2)) \\times \\text{valeur du point d'indice} \\times \\text{heures hebdo contractuelles}}{24}")
@@ -0,0 +1,75 @@
+import streamlit as st
+
+from calculateur.liens import URL_ETP, URL_MENSUALISATION, URL_MODULATION
+from calculateur.paie import heures_annuelles_depuis_etp, lisser_heures
+
+st.title("Calcul des heures contractuelles et ETP")
+
+st.info("La **mensualisation** permet de compenser le creux d'heures pendant les vacances scolaires.")
+with st.expander("**Comprendre la mensualisation de votre salaire**"):
+    st.write(f"""
+    La Convention Collective Nationale de l'Animation (ECLAT, IDCC 1518) impose que la rémunération des salarié·e·s en CDI soit versée sous la forme d'une mensualisation obligatoire sur 12 mois.    
+    Concrètement, le calcul de votre salaire est basé sur votre **temps de travail annuel contractuel**, lequel est ensuite **réparti de manière uniforme** sur l'ensemble de l'année civile.    
+    Cela signifie que vous percevez **un salaire de base identique et stable chaque mois, y compris lors des périodes de suspension de l'activité** (vacances scolaires).    
+
+    ##### Principes de la mensualisation
+
+    La mensualisation est une obligation légale pour tout contrat à durée indéterminée et permet d'assurer une **stabilité financière** aux salarié·e·s.  
+    > « Afin de répondre aux variations inhérentes aux activités (pendant les périodes périscolaires, scolaires, de vacances) de la branche professionnelle, de permettre de satisfaire l'accueil 
+    du public et d'éviter le recours excessif aux heures complémentaires, au chômage partiel, un régime de modulation pour les salariés à temps partiel est mis en place concernant les salariés 
+    sous CDI. »   
+    > *Source :* [*Article 5.7.4.1. de la convention collective ECLAT - Modulation pour les salariés à temps partiel*]({URL_MENSUALISATION})   
+    
+    Pour les enseignant·e·s artistiques : 
+
+    - **Le contrat est annuel :** La rémunération versée couvre l'ensemble des heures de service, les heures connexes prévues par la convention, ainsi que la rémunération des congés payés et des périodes d'inactivité.
+    - **Calcul du montant :** Le total des heures annuelles à rémunérer (incluant les 10 % de majoration pour congés payés) est divisé par 12, ce qui donne **le temps de travail mensuel rémunéré**.
+    - **Paiement stable :** Ce temps de travail mensuel rémunéré est appliqué de manière régulière (12 fois par an) pour garantir un revenu stable, même pendant les vacances scolaires.
+
+    La mensualisation ne modifie ni votre volume d'heures de service réel, ni vos droits légaux (ancienneté, congés) mais elle **assure une régularité et une sécurité financière sur l'année**.
+    """)
+
+         
+with st.expander("Formules de calcul"):
+	# Formule 1 : Calcul du temps de travail annuel total à rémunérer, réparti sur 12 mois.
+    st.latex(r"\text{Heures mensuelles rémunérées} = \frac{\text{Heures annuelles} \times 1,10}{12}")
+
+	# Formule 2 : Calcul de l'équivalent hebdomadaire de ces heures mensualisées (utile pour comparer avec l'horaire contractuel)
+	# L'utilisation de \frac{52}{12} est la définition du coefficient de mensualisation légal.
+    st.latex(r"\text{Coefficient de mensualisation} = \frac{52 \text{ semaines}}{12 \text{ mois}} \approx 4,33 \text{ semaines/mois}")
+
+	# Formule 3 : L'équivalent de l'horaire de service contractuel hebdomadaire (vérification)
+    st.latex(r"\text{Heures hebdomadaires contractuelles} = \frac{\text{Heures mensuelles rémunérées}}{\frac{52}{12}}")
+    st.caption(f"[Lien Légifrance - Modulation et annualisation]({URL_MODULATION})")
+
+    st.divider()
+    st.info("**L'équivalent temps plein** - ETP - permet de comparer les heures des profs (temps plein fixé à 24h/semaine par la convention collective ECLAT) à un temps plein classique (35h/semaine).")
+with st.expander("Formule"):
+    st.latex("\\text{Heures mensuelles ETP} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{151,67}}{24}")
+    st.caption(f"[Lien Légifrance - Temps plein professeur]({URL_ETP})")
+    
+    st.divider()
+    st.write("##### Heures annuelles réelles -> Heures contractuelles et ETP :")
+    heures_annuelles_reelles = st.number_input(
+    "Heures annuelles réellement effectuées (de septembre à août) :", min_value=0.0, step=0.5
+    )
+
+if heures_annuelles_reelles > 0:
+    heures_avec_cp, heures_mensuelles, heures_hebdo, heures_mensuelles_etp = lisser_heures(heures_annuelles_reelles)
+
+    st.markdown("###### Résultats")
+    st.write(f"- Heures annuelles + 10% CP : **{heures_avec_cp:.2f} h**")
+    st.write(f"- Heures mensuelles rémunérées : **{heures_mensuelles:.2f} h/mois**")
+    st.write(f"- Heures hebdomadaires contractuelles : **{heures_hebdo:.2f} h/semaine**")
+    st.write(f"- Heures mensuelles ETP : **{heures_mensuelles_etp:.2f} h**")
+
+st.write("##### Heures mensuelles ETP -> Heures annuelles réelles :")
+heures_mensuelles_etp = st.number_input(
+    "Heures mensuelles ETP (affichées sur fiche de paie) :", min_value=0.0, step=0.5
+)
+
+if heures_mensuelles_etp > 0:
+    heures_annuelles_reelles = heures_annuelles_depuis_etp(heures_mensuelles_etp)
+
+    st.markdown("###### Résultats")
+    st.write(f"- Heures annuelles réelles : **{heures_annuelles_reelles:.2f} h**")
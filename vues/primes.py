@@ -0,0 +1,38 @@
+from datetime import date
+
+import streamlit as st
+
+from calculateur.paie import calculer_anciennete, prime_anciennete, prime_differentielle
+from calculateur.taux import bareme_au
+
+bareme = bareme_au()
+
+st.title("Calcul des primes")
+
+st.info("La **prime d'ancienneté** est calculée sur la base du nombre d'années d'ancienneté. Elle commence à N+1. On compte 2 points par année d'ancienneté.")
+st.info("La **prime différentielle** a été mise en place afin que tou·te·s les salarié·e·s soient sur un pied d'égalité en termes de " \
+"rémunération, quelle que soit leur ancienneté.")
+with st.expander("Formules"):
+    st.latex("\\text{Prime d'ancienneté} = \\frac{\\text{Heures hebdo contractuelles} \\times \\text{valeur du point d'indice} \\times (\\text{ancienneté} \\times 2)}{24}")
+    st.latex("\\text{Prime différentielle} = \\frac{\\text{valeur max entre 0 et} \\text{(" + str(bareme.coefficient_differentiel) + " - (}\\text{ancienneté} \\times 2)) \\times \\text{valeur du point d'indice} \\times \\text{heures hebdo contractuelles}}{24}")
+
+st.divider()
+st.write("**Calculateur :**")
+date_entree = st.date_input(
+    "Date d'entrée dans l'école :", min_value=date(1980,1,1), max_value=date.today()
+)
+heures_lissees = st.number_input("Heures hebdomadaires contractuelles :", min_value=0.0, step=0.5)
+st.caption(f"Valeur du point d'indice V1 au {bareme.debut:%d/%m/%Y} : {bareme.valeur_point_v1} €.")
+st.caption(f"Valeur du point d'indice V2 au {bareme.debut:%d/%m/%Y} : {bareme.valeur_point_v2} €.")
+
+# Ancienneté
+anciennete = calculer_anciennete(date_entree)
+
+if heures_lissees > 0:
+    prime_anc = prime_anciennete(heures_lissees, anciennete, bareme)
+    prime_diff = prime_differentielle(heures_lissees, anciennete, bareme)
+
+    st.markdown("### Résultats")
+    st.write(f"- Ancienneté calculée : **{anciennete} ans**")
+    st.write(f"- Prime d’ancienneté : **{prime_anc:.2f} €**")
+    st.write(f"- Prime différentielle : **{prime_diff:.2f} €**")
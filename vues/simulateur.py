@@ -0,0 +1,94 @@
+from datetime import date
+
+import streamlit as st
+
+from calculateur.paie import simuler_salaire
+
+st.title("🧮 Simulateur complet")
+heures_annuelles = st.number_input("Heures annuelles réellement effectuées :", min_value=0.0, step=0.5)
+date_entree = st.date_input("Date d'entrée dans l'école :", min_value=date(1980,1,1), max_value=date.today())
+
+if heures_annuelles > 0:
+    simulation = simuler_salaire(heures_annuelles, date_entree)
+    heures_mensuelles = simulation.heures_mensuelles
+    heures_hebdo = simulation.heures_hebdo
+    heures_mensuelles_etp = simulation.heures_mensuelles_etp
+    anciennete = simulation.anciennete
+    prime_anciennete = simulation.prime_anciennete
+    prime_diff = simulation.prime_diff
+    salaire_base = simulation.salaire_base
+    salaire_brut_total = simulation.salaire_brut_total
+    salaire_net = simulation.salaire_net
+    taux_horaire_brut_reel = simulation.taux_horaire_brut_reel
+
+    st.markdown("### Résultats")
+    st.write(f"- Heures mensuelles rémunérées : **{heures_mensuelles:.2f} h/mois**")
+    st.write(f"- Heures hebdomadaires contactuelles : **{heures_hebdo:.2f} h/semaine**")
+    st.write(f"- Heures mensuelles ETP : **{heures_mensuelles_etp:.2f} h**")
+    st.write(f"- Ancienneté : **{anciennete} ans**")
+    st.write(f"- Prime d’ancienneté : **{prime_anciennete:.2f} €**")
+    st.write(f"- Prime différentielle : **{prime_diff:.2f} €**")
+    st.write(f"- Salaire de base conventionnel : **{salaire_base:.2f} €**")
+    st.write(f"- Salaire brut total estimé : **{salaire_brut_total:.2f} €**")
+    st.write(f"- Salaire net estimé : **{salaire_net:.2f} €**")
+    st.write(f"- Taux horaire brut réel : **{taux_horaire_brut_reel:.2f} €/h**")
+    st.write(f":red[Attention : Les profs rattaché·e·s à la mutuelle de Musiques Tangentes et les profs imposables auront un salaire net moins élevé que le montant estimé, puisque ces montants sont déduits du salaire brut total.]")
+
+    # Export PDF, généré seulement au clic
+    def pdf_data():
+        from calculateur.pdf import pdf_simulation
+
+        return pdf_simulation(simulation)
+
+    st.download_button(
+        label="📄 Télécharger le PDF récapitulatif",
+        data=pdf_data,
+        file_name="simulation_eclat.pdf",
+        mime="application/pdf"
+    )
+
+# Grille : toutes les combinaisons heures × ancienneté en une évaluation vectorisée
+st.divider()
+if st.toggle("Explorer une grille heures annuelles × ancienneté"):
+    import altair as alt
+    import numpy as np
+
+    from calculateur.paie import INDICATEURS_GRILLE, grille_salaires
+    from calculateur.taux import bareme_au
+
+    @st.cache_data(show_spinner=False, max_entries=16)
+    def grille_cache(heures_min, heures_max, points, anciennete_max, bareme):
+        """Grille mémorisée par barème : un nouveau barème en vigueur donne une nouvelle grille."""
+        return grille_salaires(np.linspace(heures_min, heures_max, points), range(anciennete_max + 1), bareme)
+
+    colonne_heures, colonne_anciennete, colonne_indicateur = st.columns(3)
+    heures_min, heures_max = colonne_heures.slider(
+        "Heures annuelles :", min_value=12, max_value=1200, value=(12, 1200), step=12
+    )
+    anciennete_max = colonne_anciennete.slider("Ancienneté jusqu'à (ans) :", min_value=0, max_value=40, value=40)
+    indicateur = colonne_indicateur.selectbox(
+        "Valeur affichée :", list(INDICATEURS_GRILLE), index=4, format_func=INDICATEURS_GRILLE.get
+    )
+    points = min(100, (heures_max - heures_min) // 12 + 1)
+
+    grille = grille_cache(heures_min, heures_max, points, anciennete_max, bareme_au())
+
+    st.altair_chart(
+        alt.Chart(grille).mark_rect().encode(
+            x=alt.X("heures_annuelles:O", title="Heures annuelles réelles", axis=alt.Axis(format=".0f", labelOverlap=True)),
+            y=alt.Y("anciennete:O", title="Ancienneté (ans)", sort="descending"),
+            color=alt.Color(f"{indicateur}:Q", title=INDICATEURS_GRILLE[indicateur], scale=alt.Scale(scheme="blues")),
+            tooltip=[
+                alt.Tooltip("heures_annuelles:Q", title="Heures annuelles", format=".1f"),
+                alt.Tooltip("anciennete:O", title="Ancienneté"),
+                alt.Tooltip(f"{indicateur}:Q", title=INDICATEURS_GRILLE[indicateur], format=".2f"),
+            ],
+        ),
+        width="stretch",
+    )
+    st.download_button(
+        label="Télécharger la grille (CSV)",
+        data=lambda: grille.rename(columns=INDICATEURS_GRILLE).to_csv(index=False, sep=";", decimal=",").encode("utf-8-sig"),
+        file_name="grille_eclat.csv",
+        mime="text/csv",
+    )
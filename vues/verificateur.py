@@ -0,0 +1,221 @@
+import tempfile
+import threading
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+from calculateur.export_releves import exporter_releves, nom_fichier_releve
+from calculateur.paie import INDICATEURS_MENSUELS, lire_dates_entree
+from calculateur.parallele import Progression
+from calculateur.saisons import CacheReleves, dossier_heures, lister_saisons
+
+RESULTATS_RECHERCHE = 10
+
+
+@st.cache_resource(show_spinner=False)
+def cache_releves():
+    """Relevés des saisons déjà ouvertes, partagés entre toutes les sessions (LRU borné en octets)."""
+    return CacheReleves()
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def pdf_releve_cache(_releve, empreinte, nom):
+    """PDF du relevé, mémorisé par (prof, version du fichier) ; les plus anciens sont évincés."""
+    from calculateur.pdf import pdf_releve
+
+    with pdf_releve(nom, _releve.totaux[nom], _releve.jours_prof(nom)) as fichier:
+        return fichier.read()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def paie_mensuelle_cache(_releve, empreinte, dates_entree):
+    """
+    Paie reconstituée mois par mois, mémorisée par (version du fichier, dates d'entrée).
+    dates_entree : tuple de (nom, date d'entrée) ; DataFrame indexé par (prof, mois).
+    """
+    from calculateur.paie import simuler_mensuel
+
+    return simuler_mensuel(_releve.mensuel, dict(dates_entree))
+
+
+def tableau_paie_mensuelle(paie):
+    """Table (prof, mois) -> colonnes affichées, mois en MM/AAAA"""
+    tableau = paie[list(INDICATEURS_MENSUELS)].rename(columns=INDICATEURS_MENSUELS).reset_index()
+    tableau["mois"] = tableau["mois"].dt.strftime("%m/%Y")
+    return tableau.rename(columns={"prof": "Prof", "mois": "Mois"})
+
+
+def charger_heures(chemin):
+    """
+    Retourne le ReleveHeures à jour.
+    Une saison n'est parsée qu'à sa première sélection ; ensuite, si l'export a
+    seulement grandi, seules les lignes ajoutées sont parsées ; s'il a été remplacé,
+    il est relu en entier. Sans changement, rien n'est relu.
+    Les objets retournés sont partagés : ne pas les modifier.
+    Pendant la lecture, un thread d'affichage fait avancer une barre de progression.
+    """
+    progression = Progression()
+    barre = st.empty()
+    fini = threading.Event()
+
+    def afficher():
+        while not fini.wait(0.2):
+            if progression.total:
+                fraction = progression.fraction
+                barre.progress(fraction, text=f"Lecture du relevé d'heures… {fraction:.0%}")
+
+    rapporteur = threading.Thread(target=afficher, daemon=True)
+    add_script_run_ctx(rapporteur)
+    rapporteur.start()
+    try:
+        return cache_releves().charger(chemin, progression)
+    finally:
+        fini.set()
+        rapporteur.join()
+        barre.empty()
+
+
+# Saisons disponibles, listées d'après les noms de fichiers seulement
+saisons = lister_saisons(dossier_heures(Path(__file__).resolve().parent.parent))
+
+st.title("Vérificateur heures annuelles réelles")
+
+if not saisons:
+    st.error("Aucun export d'heures (heures_aaaa.txt) trouvé.")
+    st.stop()
+saison = st.selectbox("Saison :", saisons, format_func=lambda s: s.libelle)
+releve = charger_heures(saison.chemin)
+
+# Recherche côté serveur : seuls les meilleurs résultats sont envoyés au navigateur
+recherche = st.text_input("Rechercher votre nom :", placeholder="Début du prénom ou du nom, accents facultatifs")
+resultats = releve.recherche.chercher(recherche, RESULTATS_RECHERCHE) if recherche else []
+if recherche and not resultats:
+    st.warning("Aucun nom ne correspond à cette recherche.")
+elif not recherche:
+    st.caption(f"{len(releve)} profs dans cet export.")
+prof_selectionne = st.selectbox("Sélectionnez votre nom :", resultats) if resultats else None
+
+if prof_selectionne:
+    total_annuel = releve.totaux[prof_selectionne]
+
+    st.markdown(f"### Total annuel : **{total_annuel:.2f} h**")
+
+    # Tableau avec dates réelles
+    df_heures = releve.dataframe(prof_selectionne)
+    if not df_heures.empty:
+        premier, dernier = df_heures["Date"].min().date(), df_heures["Date"].max().date()
+        periode = st.date_input(
+            "Période affichée :", value=(premier, dernier), min_value=premier, max_value=dernier
+        )
+        if len(periode) == 2:
+            debut, fin = pd.Timestamp(periode[0]), pd.Timestamp(periode[1])
+            df_heures = df_heures[df_heures["Date"].between(debut, fin)]
+            st.caption(f"Sur la période : **{df_heures['Heures'].sum():.2f} h**")
+    st.dataframe(
+        df_heures,
+        width="stretch",
+        column_config={"Date": st.column_config.DateColumn("Date", format="DD-MM-YYYY")},
+    )
+
+    # Totaux mensuels, rapprochés des lignes "Total Mois" de l'export
+    st.markdown("#### Totaux mensuels")
+    ecarts = releve.mensuel.ecarts_prof(prof_selectionne)
+    if ecarts:
+        st.warning(f"{len(ecarts)} mois dont le « Total Mois » de l'export ne correspond pas à la somme des jours.")
+    df_mois = releve.mensuel.dataframe(prof_selectionne)
+    df_mois["Mois"] = df_mois["Mois"].dt.strftime("%m/%Y")
+    st.dataframe(
+        df_mois,
+        width="stretch",
+        hide_index=True,
+        column_config={colonne: st.column_config.NumberColumn(format="%.2f") for colonne in ("Heures", "Déclaré", "Écart")},
+    )
+
+    # Paie reconstituée mois par mois à partir des heures de chaque mois
+    st.markdown("#### Paie mois par mois")
+    date_entree = st.date_input(
+        "Date d'entrée dans l'école :", value=None, min_value=date(1980, 1, 1), max_value=date.today()
+    )
+    if date_entree:
+        paie = paie_mensuelle_cache(releve, releve.empreinte, ((prof_selectionne, date_entree),))
+        st.dataframe(
+            tableau_paie_mensuelle(paie).drop(columns="Prof"),
+            width="stretch",
+            hide_index=True,
+            column_config={
+                libelle: st.column_config.NumberColumn(format="%.2f")
+                for cle, libelle in INDICATEURS_MENSUELS.items() if cle != "anciennete"
+            },
+        )
+        st.caption(
+            "Chaque mois est simulé comme si le rythme du mois durait toute l'année, avec l'ancienneté "
+            "au dernier jour du mois et le barème du mois."
+        )
+
+    # Export PDF, généré seulement au clic
+    st.download_button(
+        label="Télécharger le PDF récapitulatif",
+        data=lambda: pdf_releve_cache(releve, releve.empreinte, prof_selectionne),
+        file_name=nom_fichier_releve(prof_selectionne),
+        mime="application/pdf"
+    )
+
+# Export de tous les relevés
+with st.expander("Administration : relevés de tou·te·s les profs"):
+    if releve.mensuel.ecarts:
+        st.warning(f"{len(releve.mensuel.ecarts)} « Total Mois » ne correspondent pas à la somme des jours :")
+        st.dataframe(pd.DataFrame(
+            [{"Prof": e.nom, "Mois": f"{e.mois % 12 + 1:02d}/{e.mois // 12}", "Calculé": e.calcule, "Déclaré": e.declare} for e in releve.mensuel.ecarts]
+        ), width="stretch", hide_index=True)
+    else:
+        st.caption("Tous les « Total Mois » de l'export correspondent à la somme des jours.")
+    archive_releves = Path(tempfile.gettempdir()) / f"releves_{releve.empreinte[:12]}.zip"
+    if st.button("Générer l'archive ZIP des relevés"):
+        barre = st.progress(0.0, text="Génération des relevés…")
+        durees = []
+        for i, (nom, secondes) in enumerate(exporter_releves(releve, archive_releves), start=1):
+            durees.append({"Prof": nom, "Rendu (ms)": round(secondes * 1000, 1)})
+            barre.progress(i / len(releve), text=nom)
+        barre.empty()
+        st.dataframe(pd.DataFrame(durees), width="stretch")
+    if archive_releves.exists():
+        st.download_button(
+            label="Télécharger l'archive ZIP",
+            data=lambda: archive_releves.read_bytes(),
+            file_name="releves_heures.zip",
+            mime="application/zip"
+        )
+
+    # Paie mois par mois de toute l'équipe, d'après un CSV « Prof;Date d'entrée »
+    st.divider()
+    fichier_entrees = st.file_uploader(
+        "Dates d'entrée de l'équipe (CSV « Prof;Date d'entrée », dates JJ/MM/AAAA) :", type="csv"
+    )
+    dates_entree = ()
+    if fichier_entrees is not None:
+        try:
+            dates_entree, rejets = lire_dates_entree(fichier_entrees)
+        except ValueError as erreur:
+            st.error(str(erreur))
+        else:
+            if rejets:
+                st.warning(f"{len(rejets)} ligne(s) ignorée(s) :\n\n" + "\n".join(f"- {rejet}" for rejet in rejets))
+            if not dates_entree:
+                st.error("Aucune date d'entrée valide dans ce fichier.")
+    if dates_entree:
+        with st.spinner("Reconstitution de la paie mois par mois…"):
+            paie_equipe = paie_mensuelle_cache(releve, releve.empreinte, dates_entree)
+        inconnus = [nom for nom, _ in dates_entree if nom not in releve.index]
+        st.caption(
+            f"{len(paie_equipe)} mois simulés pour {paie_equipe.index.get_level_values('prof').nunique()} profs."
+            + (f" Absent·e·s de l'export : {', '.join(inconnus)}." if inconnus else "")
+        )
+        st.download_button(
+            label="Télécharger la paie mois par mois (CSV)",
+            data=lambda: tableau_paie_mensuelle(paie_equipe).to_csv(index=False, sep=";", decimal=",").encode("utf-8-sig"),
+            file_name="paie_mois_par_mois.csv",
+            mime="text/csv",
+        )